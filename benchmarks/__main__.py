@@ -0,0 +1,63 @@
+"""
+Runs the benchmark suite:
+
+    python -m benchmarks --out results.json
+    python -m benchmarks --baseline results.json --filter leaderboard
+"""
+import argparse
+import sys
+
+from benchmarks.cases import all_cases, isolated_leaderboard
+from benchmarks.harness import (DEFAULT_THRESHOLD, compare, format_seconds, load_results, measure,
+                                save_results)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Minesweeper hot-path benchmarks.")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--full", action="store_true", help="include 2000x2000 boards (slow)")
+    parser.add_argument("--out", help="save results as JSON")
+    parser.add_argument("--baseline", help="compare against a saved JSON run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown of the median before flagging a regression (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+    if args.warmup < 0 or args.repeat <= 0:
+        parser.error("--warmup must be >= 0 and --repeat > 0")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = [case for case in all_cases(args.full) if not args.filter or args.filter in case[0]]
+
+    results = {}
+    print(f"{'case':<40} {'p50':>11} {'p90':>11} {'p99':>11} {'min':>11}")
+    with isolated_leaderboard():
+        for name, setup, func in cases:
+            stats = measure(func, setup, args.warmup, args.repeat)
+            results[name] = stats
+            print(f"{name:<40} {format_seconds(stats['p50'])} {format_seconds(stats['p90'])} "
+                  f"{format_seconds(stats['p99'])} {format_seconds(stats['min'])}", flush=True)
+
+    if args.out:
+        save_results(args.out, results, args.warmup, args.repeat)
+        print(f"Saved results to {args.out}")
+
+    if args.baseline:
+        rows = compare(results, load_results(args.baseline), args.threshold)
+        regressions = [row for row in rows if row[4]]
+        print(f"\n{'case':<40} {'baseline':>11} {'current':>11} {'ratio':>7}")
+        for name, base, current, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<40} {format_seconds(base)} {format_seconds(current)} {ratio:7.2f}{flag}")
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}.")
+            return 1
+        print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Benchmark cases for the generation, flood fill and leaderboard hot paths.
+
+Each case is (name, setup, func): `setup()` builds the input untimed and
+`func(state)` is the timed part.
+"""
+import json
+import os
+import random
+import tempfile
+from contextlib import contextmanager
+
+from leaderboard import leaderboard
+from logic.board import Board, HEX, SQUARE
+from logic.generation import count_adjacent_mines, count_adjacent_mines_grid, place_mines_safely
+
+SIZES = [(9, 9), (30, 16), (100, 100), (500, 500)]
+FULL_SIZES = SIZES + [(2000, 2000)]
+LEADERBOARD_SIZES = [10, 1000, 100000]
+
+MINE_DENSITY = 99 / (30 * 16)  # Expert density
+FLOOD_DENSITY = 0.02           # sparse enough that one click floods most of the board
+SEED = 12345
+
+
+def _mines_for(width, height, density):
+    return max(1, int(width * height * density))
+
+
+def _dict_board(width, height):
+    return [[{"is_mine": False, "is_revealed": False, "is_flagged": False, "adjacent_mines": 0}
+             for _ in range(width)] for _ in range(height)]
+
+
+def _dict_board_with_mines(width, height):
+    board = _dict_board(width, height)
+    place_mines_safely(board, width, height, _mines_for(width, height, MINE_DENSITY),
+                       height // 2, width // 2, rng=SEED)
+    return board
+
+
+def _placed_board(width, height, topology, density):
+    board = Board(width, height, _mines_for(width, height, density), topology)
+    board.place_mines(height // 2, width // 2, rng=SEED)
+    return board
+
+
+def generation_cases(sizes):
+    cases = []
+    for width, height in sizes:
+        tag = f"{width}x{height}"
+        mines = _mines_for(width, height, MINE_DENSITY)
+
+        def place(board, width=width, height=height, mines=mines):
+            place_mines_safely(board, width, height, mines, height // 2, width // 2, rng=SEED)
+
+        def count_all(board, width=width, height=height):
+            for r in range(height):
+                for c in range(width):
+                    count_adjacent_mines(board, r, c)
+
+        def count_grid(mines_array, width=width, height=height):
+            count_adjacent_mines_grid(mines_array, width, height)
+
+        cases.append((f"place_mines_safely[{tag}]", lambda w=width, h=height: _dict_board(w, h), place))
+        cases.append((f"count_adjacent_mines[{tag}]", lambda w=width, h=height: _dict_board_with_mines(w, h),
+                      count_all))
+        cases.append((f"count_adjacent_mines_grid[{tag}]",
+                      lambda w=width, h=height: _placed_board(w, h, SQUARE, MINE_DENSITY).mines, count_grid))
+    return cases
+
+
+def flood_fill_cases(sizes):
+    # Board.reveal is the flood fill behind ClassicGameBoard.reveal_cells,
+    # CustomGameBoard.reveal_cells and HexGameBoard.flood_fill_hex.
+    cases = []
+    for width, height in sizes:
+        tag = f"{width}x{height}"
+        for name, topology in (("reveal_cells", SQUARE), ("flood_fill_hex", HEX)):
+            cases.append((f"{name}[{tag}]",
+                          lambda w=width, h=height, t=topology: _placed_board(w, h, t, FLOOD_DENSITY),
+                          lambda board: board.reveal(board.height // 2, board.width // 2)))
+    return cases
+
+
+def _leaderboard_data(records):
+    rng = random.Random(SEED)
+    data = json.loads(json.dumps(leaderboard.MINIMAL_EMPTY_LEADERBOARD_STRUCTURE))
+    data["classic"]["Expert"] = sorted(
+        ({"name": f"Player {i}", "time": rng.uniform(30, 999), "board_id": f"C-30x16-99-8.15-{i:08x}"}
+         for i in range(records)), key=lambda e: e["time"])
+    return data
+
+
+@contextmanager
+def isolated_leaderboard():
+    """
+    Points the leaderboard module (and its shared store) at a scratch file
+    and answers the name prompt without Tk for the duration of the block.
+    """
+    original = leaderboard.LEADERBOARD_FILE, leaderboard._store, leaderboard._get_player_name
+    with tempfile.TemporaryDirectory() as tmp:
+        leaderboard.LEADERBOARD_FILE = os.path.join(tmp, "leaderboard_data.json")
+        leaderboard._store = leaderboard.LeaderboardStore(leaderboard.LEADERBOARD_FILE)
+        leaderboard._get_player_name = lambda title=None: "Benchmark"
+        try:
+            yield
+        finally:
+            leaderboard.LEADERBOARD_FILE, leaderboard._store, leaderboard._get_player_name = original
+
+
+def leaderboard_cases(record_counts):
+    cases = []
+    for records in record_counts:
+        text = json.dumps(_leaderboard_data(records), indent=2)
+
+        def write_file(text=text):
+            leaderboard._store.close()
+            with open(leaderboard.LEADERBOARD_FILE, "w") as f:
+                f.write(text)
+            if os.path.exists(leaderboard._store.journal_path):
+                os.remove(leaderboard._store.journal_path)
+            leaderboard._store.invalidate()
+
+        def warm_store(write_file=write_file):
+            write_file()
+            leaderboard.load_leaderboard()
+
+        cases.append((f"load_leaderboard[{records}]", write_file, lambda _: leaderboard.load_leaderboard()))
+        cases.append((f"load_leaderboard_cached[{records}]", warm_store, lambda _: leaderboard.load_leaderboard()))
+        # A time of 0 always qualifies, so the sort and save are included.
+        cases.append((f"update_leaderboard[{records}]", write_file,
+                      lambda _: leaderboard.update_leaderboard("classic", "Expert", 0.0)))
+    return cases
+
+
+def all_cases(full=False):
+    sizes = FULL_SIZES if full else SIZES
+    return generation_cases(sizes) + flood_fill_cases(sizes) + leaderboard_cases(LEADERBOARD_SIZES)
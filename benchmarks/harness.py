@@ -0,0 +1,88 @@
+import json
+import platform
+import time
+
+PERCENTILES = (50, 90, 99)
+DEFAULT_THRESHOLD = 0.10  # a case regresses when its median is more than 10% slower
+
+
+def percentile(sorted_values, pct):
+    """Linear-interpolated percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * pct / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def measure(func, setup=None, warmup=1, repeat=5):
+    """
+    Times `func` `repeat` times after `warmup` untimed calls.
+    If `setup` is given it runs before every call (untimed) and its return
+    value is passed to `func`, so cases that mutate their input start fresh.
+    Returns a dict of statistics in seconds.
+    """
+    timings = []
+    for run in range(warmup + repeat):
+        state = setup() if setup else None
+        start = time.perf_counter()
+        func(state)
+        elapsed = time.perf_counter() - start
+        if run >= warmup:
+            timings.append(elapsed)
+
+    timings.sort()
+    stats = {
+        "repeat": repeat,
+        "min": timings[0],
+        "mean": sum(timings) / len(timings),
+        "max": timings[-1],
+    }
+    for pct in PERCENTILES:
+        stats[f"p{pct}"] = percentile(timings, pct)
+    return stats
+
+
+def save_results(path, results, warmup, repeat):
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "warmup": warmup,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_results(path):
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares medians against a baseline run.
+    Returns a list of (case name, baseline p50, current p50, ratio, regressed)
+    for every case present in both.
+    """
+    rows = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = stats["p50"] / base["p50"] if base["p50"] > 0 else float("inf")
+        rows.append((name, base["p50"], stats["p50"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.2f} ms"
+    return f"{seconds:8.3f} s "
@@ -3,11 +3,18 @@ from tkinter import messagebox
 import time
 
 from leaderboard.leaderboard import update_leaderboard
-from utils.helpers import format_time
-from logic.generation import place_mines_safely, count_adjacent_mines
+from utils.helpers import format_time, probability_color
+from utils.board_canvas import BoardCanvas, UNREVEALED_FILL
+from utils.redraw import RedrawQueue
+from logic.board_id import new_seed, format_board_id
+from logic.no_guess import generate_no_guess
+from logic.probability import ProbabilityMap
+from logic.board import Board
+from logic.replay import ReplayRecorder, save_replay, REVEAL, FLAG, CHORD
+from utils.latency import latency_probe
 
 class ClassicGameBoard(tk.Toplevel):
-    def __init__(self, controller, width, height, mines, difficulty):
+    def __init__(self, controller, width, height, mines, difficulty, seed=None, first_click=None, no_guess=False):
         super().__init__()
         self.controller = controller
         self.width = width
@@ -16,7 +23,8 @@ class ClassicGameBoard(tk.Toplevel):
         self.mines_count = mines 
         self.difficulty = difficulty
 
-        self.title(f"Classic Game - {self.difficulty}")
+        self.no_guess = no_guess
+        self.title(f"Classic Game - {self.difficulty}{' (No Guessing)' if no_guess else ''}")
         self.resizable(False, False)
         self.configure(bg="lightgrey")
 
@@ -25,6 +33,11 @@ class ClassicGameBoard(tk.Toplevel):
         self.start_time = None
         self.timer_id = None
         self.m_key_pressed = False
+        self.seed = seed if seed is not None else new_seed()
+        self.board_id = None
+        self.hints_on = False
+        self.probabilities = None  # ProbabilityMap, created the first time hints are shown
+        self.recorder = ReplayRecorder()
 
         top_frame = tk.Frame(self, bg=self.cget('bg'))
         top_frame.pack(side="top", fill="x", pady=5)
@@ -35,169 +48,190 @@ class ClassicGameBoard(tk.Toplevel):
         self.timer_label = tk.Label(top_frame, text="Time: 0.00", bg=top_frame.cget('bg'))
         self.timer_label.pack(side="right", padx=10)
 
-        self.board_frame = tk.Frame(self, bg=self.cget('bg'))
-        self.board_frame.pack()
-
-        self.board = []
-        for r in range(height):
-            row = []
-            for c in range(width):
-                cell = {
-                    "button": None, "is_mine": False, "adjacent_mines": 0,
-                    "is_revealed": False, "is_flagged": False
-                }
-                row.append(cell)
-            self.board.append(row)
-
-        for r_idx in range(height): 
-            for c_idx in range(width):
-                btn = tk.Button(self.board_frame, width=2, height=1, relief="raised",
-                                command=lambda r=r_idx, c=c_idx: self.on_left_click(r, c))
-                btn.grid(row=r_idx, column=c_idx)
-                btn.bind("<Button-1>", lambda e: self.focus_set())
-                
-                right_click_handler = lambda event, r=r_idx, c=c_idx: self.on_right_click(r, c)
-                btn.bind("<Button-3>", right_click_handler)      
-                btn.bind("<Button-2>", right_click_handler)      
-                btn.bind("<Control-Button-1>", right_click_handler) 
-
-                self.board[r_idx][c_idx]["button"] = btn
+        self.hint_button = tk.Button(top_frame, text="Hint", command=self.toggle_hints)
+        self.hint_button.pack(side="right", padx=5)
+
+        self.board_id_label = tk.Label(top_frame, text="Board: -", bg=top_frame.cget('bg'))
+        self.board_id_label.pack(side="left", expand=True)
+        self.board_id_label.bind("<Button-1>", self.copy_board_id)
+
+        self.model = Board(width, height, mines)
+        self.canvas = BoardCanvas(self, width, height, self.on_left_click, self.on_right_click)
+        self.canvas.pack(padx=5, pady=(0, 5))
+        self.redraws = RedrawQueue(self, self.draw_revealed)
+        self.latency = latency_probe(self, f"classic {width}x{height}, {mines} mines")
 
         self.focus_set()
         self.bind("<KeyPress-m>", lambda e: setattr(self, 'm_key_pressed', True))
         self.bind("<KeyRelease-m>", lambda e: setattr(self, 'm_key_pressed', False))
         self.bind("<KeyPress-M>", lambda e: setattr(self, 'm_key_pressed', True))
         self.bind("<KeyRelease-M>", lambda e: setattr(self, 'm_key_pressed', False))
+        self.bind("<KeyPress-h>", lambda e: self.toggle_hints())
+        self.bind("<KeyPress-H>", lambda e: self.toggle_hints())
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+        if first_click is not None:
+            self.on_left_click(*first_click)
+
     def on_close(self):
+        self.latency.close()
+        self.redraws.cancel()
         if self.timer_id:
             self.after_cancel(self.timer_id)
         self.destroy()
 
+    def copy_board_id(self, event=None):
+        if self.board_id:
+            self.clipboard_clear()
+            self.clipboard_append(self.board_id)
+
     def on_left_click(self, r, c):
+        self.latency.click("left")
         if self.m_key_pressed:
             self.on_right_click(r, c)
             return
-        
-        cell_data = self.board[r][c] 
 
-        if self.is_game_over or cell_data["is_revealed"]:
+        model = self.model
+        idx = model.index(r, c)
+
+        if self.is_game_over or model.flagged[idx]:
             return
-        
-        if cell_data["is_flagged"]:
+
+        if model.revealed[idx]:
+            self.recorder.record(CHORD, idx)
+            with self.latency.model("chord"):
+                changed = model.chord(r, c)
+            self.handle_revealed(changed)
             return
 
         if not self.first_click_done:
             self.first_click_done = True
-            self.mines_count = place_mines_safely(self.board, self.width, self.height, self.initial_mines_count, r, c)
-            flagged_count = sum(item["is_flagged"] for row_board in self.board for item in row_board)
-            self.mine_label.config(text=f"Mines: {self.mines_count - flagged_count}")
-            
-            for rr_init in range(self.height):
-                for cc_init in range(self.width):
-                    if not self.board[rr_init][cc_init]["is_mine"]:
-                        self.board[rr_init][cc_init]["adjacent_mines"] = count_adjacent_mines(self.board, rr_init, cc_init)
+            with self.latency.model("place"):
+                if self.no_guess:
+                    result = generate_no_guess(model, r, c, rng=self.seed)
+                    self.mines_count = model.mines_count
+                else:
+                    self.mines_count = model.place_mines(r, c, rng=self.seed)
+            if self.no_guess and not result.solved:
+                messagebox.showinfo("No Guessing", "Could not find a guess-free layout in time; this board may need a guess.")
+            self.board_id = format_board_id("classic", self.width, self.height, self.initial_mines_count, r, c, self.seed, self.no_guess)
+            self.board_id_label.config(text=f"Board: {self.board_id}")
+            self.mine_label.config(text=f"Mines: {model.mines_left()}")
             self.start_time = time.time()
+            self.recorder.start(self.start_time)
             self.update_timer()
 
-        if cell_data["is_mine"]:
-            self.reveal_mine(r, c, exploded=True)
-            self.game_over(False)
-        else:
-            self.reveal_cells(r, c)
-            if self.check_win():
-                self.game_over(True)
+        self.recorder.record(REVEAL, idx)
+        self.reveal_cells(r, c)
 
     def on_right_click(self, r, c):
-        if self.is_game_over or self.board[r][c]["is_revealed"]:
+        self.latency.click("right")
+        if self.is_game_over:
             return
-        
-        cell = self.board[r][c]
-        cell["is_flagged"] = not cell["is_flagged"] 
-        
-        if cell["is_flagged"]:
-            cell["button"].config(text="F", fg="red")
+
+        with self.latency.model("flag"):
+            is_flagged = self.model.toggle_flag(r, c)
+        if is_flagged is None:
+            return
+
+        idx = self.model.index(r, c)
+        self.recorder.record(FLAG, idx)
+        if is_flagged:
+            self.canvas.set_cell(idx, text="F", color="red")
         else:
-            cell["button"].config(text="", fg="black")
+            self.canvas.set_cell(idx, text="")
+
+        if self.first_click_done:
+            self.mine_label.config(text=f"Mines: {self.model.mines_left()}")
 
-        if self.first_click_done: 
-            flagged_count = sum(item["is_flagged"] for row_board in self.board for item in row_board)
-            mines_left = self.mines_count - flagged_count 
-            self.mine_label.config(text=f"Mines: {mines_left}")
-    
     def reveal_cells(self, r, c):
-        stack = [(r, c)]
-        visited = set()
-        while stack:
-            rr, cc = stack.pop()
-            if (rr, cc) in visited or self.board[rr][cc]["is_revealed"] or self.board[rr][cc]["is_flagged"]:
-                continue
-            visited.add((rr, cc))
-            cell = self.board[rr][cc]
-            cell["is_revealed"] = True
-            btn = cell["button"]
-            adj = cell["adjacent_mines"]
-            colors = ["", "blue", "green", "red", "darkblue", "maroon", "teal", "black", "gray"]
-            text_color = colors[adj] if 0 < adj < len(colors) else "black"
-            btn.config(relief="sunken", state="disabled", text=str(adj) if adj > 0 else "", disabledforeground=text_color)
-            if adj == 0:
-                for nr_offset in range(-1, 2):
-                    for nc_offset in range(-1, 2):
-                        if nr_offset == 0 and nc_offset == 0:
-                            continue
-                        nr, nc = rr + nr_offset, cc + nc_offset
-                        if 0 <= nr < self.height and 0 <= nc < self.width:
-                            neighbor = self.board[nr][nc]
-                            if not neighbor["is_revealed"] and not neighbor["is_mine"] and not neighbor["is_flagged"]:
-                                stack.append((nr, nc))
+        with self.latency.model("reveal"):
+            changed = self.model.reveal(r, c)
+        self.handle_revealed(changed)
+
+    def handle_revealed(self, changed):
+        model = self.model
+        self.redraws.push(idx for idx in changed if not model.mines[idx])
+
+        if model.exploded is not None:
+            self.reveal_mine(*model.coords(model.exploded), exploded=True)
+            self.game_over(False)
+        elif changed and self.check_win():
+            self.game_over(True)
+        elif changed:
+            self.update_hints()
+
+    def draw_revealed(self, idx):
+        self.canvas.show_number(idx, self.model.counts[idx])
+
+    def toggle_hints(self):
+        if self.is_game_over:
+            return
+        self.hints_on = not self.hints_on
+        self.hint_button.config(relief="sunken" if self.hints_on else "raised")
+        if self.hints_on:
+            self.update_hints()
+        else:
+            self.clear_hints()
+
+    def update_hints(self):
+        """Colours every unrevealed cell by its exact mine probability."""
+        if not self.hints_on:
+            return
+        with self.latency.model():
+            if self.probabilities is None:
+                self.probabilities = ProbabilityMap(self.model)
+            probabilities = self.probabilities.compute()
+        for idx, probability in probabilities.items():
+            fill = probability_color(probability) if probability is not None else UNREVEALED_FILL
+            self.canvas.set_cell(idx, fill)
+
+    def clear_hints(self):
+        model = self.model
+        for idx in range(model.size):
+            if not model.revealed[idx]:
+                self.canvas.set_cell(idx, UNREVEALED_FILL)
 
     def reveal_mine(self, r, c, exploded=False):
-        cell = self.board[r][c]
-        cell["is_revealed"] = True
-        btn = cell["button"]
+        idx = self.model.index(r, c)
+        self.model.revealed[idx] = 1
         if exploded:
-            btn.config(text="*", bg="red", fg="white", relief="sunken", state="disabled", disabledforeground="white")
+            self.canvas.set_cell(idx, "red", "*", "white")
         else:
-            btn.config(text="*", bg="lightgrey", relief="sunken", state="disabled", disabledforeground="black")
+            self.canvas.set_cell(idx, "lightgrey", "*", "black")
 
     def check_win(self):
-        for r_idx in range(self.height): 
-            for c_idx in range(self.width): 
-                cell = self.board[r_idx][c_idx]
-                if not cell["is_mine"] and not cell["is_revealed"]:
-                    return False
-        return True
+        with self.latency.model():
+            return self.model.is_won()
 
     def game_over(self, won):
+        self.redraws.flush()
+        self.latency.finish()  # before the dialogs, which would otherwise count as paint time
+        if self.hints_on:
+            self.hints_on = False
+            self.clear_hints()
         self.is_game_over = True
         if self.timer_id:
             self.after_cancel(self.timer_id)
         time_taken = time.time() - self.start_time if self.start_time else 0
+        model = self.model
+        save_replay(self.recorder, self.board_id, won, time_taken,
+                    mines=[idx for idx in range(model.size) if model.mines[idx]] if self.no_guess else None)
         if won:
-            for r_idx in range(self.height):
-                for c_idx in range(self.width):
-                    cell = self.board[r_idx][c_idx]
-                    if cell["is_mine"] and not cell["is_flagged"]:
-                        cell["button"].config(text="F", fg="green", state="disabled", disabledforeground="green")
-                    cell["button"].config(state="disabled") 
+            for idx in range(model.size):
+                if model.mines[idx] and not model.flagged[idx]:
+                    self.canvas.set_cell(idx, text="F", color="green")
             messagebox.showinfo("You Win!", f"You cleared the board in {format_time(time_taken)}!")
-            if self.difficulty == "Random":
-                update_leaderboard("classic", "Random", time_taken,
-                                   width=self.width, height=self.height, mines=self.mines_count)
-            else:
-                update_leaderboard("classic", self.difficulty, time_taken)
-        else: 
-            for r_idx in range(self.height):
-                for c_idx in range(self.width):
-                    cell = self.board[r_idx][c_idx]
-                    if cell["is_mine"] and not cell["is_revealed"]:
-                        if not cell["is_flagged"]:
-                            self.reveal_mine(r_idx, c_idx, exploded=False)
-                    elif not cell["is_mine"] and cell["is_flagged"]: 
-                        cell["button"].config(text="X", bg="lightcoral", fg="black")
-                    cell["button"].config(state="disabled")
+            update_leaderboard("classic", self.difficulty, time_taken,
+                               width=self.width, height=self.height, mines=self.mines_count, board_id=self.board_id)
+        else:
+            for idx in range(model.size):
+                if model.mines[idx] and not model.revealed[idx]:
+                    if not model.flagged[idx]:
+                        self.reveal_mine(*model.coords(idx), exploded=False)
+                elif not model.mines[idx] and model.flagged[idx]:
+                    self.canvas.set_cell(idx, "lightcoral", "X", "black")
             messagebox.showinfo("Game Over", "You hit a mine. Better luck next time!")
 
     def update_timer(self):
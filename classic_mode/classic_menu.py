@@ -1,6 +1,14 @@
 import tkinter as tk
+from tkinter import messagebox
 import random
 from .classic_game import ClassicGameBoard
+from logic.board_id import parse_board_id
+
+CLASSIC_PRESETS = {
+    "Beginner": (9, 9, 10),
+    "Intermediate": (16, 16, 40),
+    "Expert": (30, 16, 99),
+}
 
 class ClassicMenu(tk.Frame):
     def __init__(self, parent, controller):
@@ -10,21 +18,27 @@ class ClassicMenu(tk.Frame):
         label = tk.Label(self, text="Classic Mode", font=("Arial", 18, "bold"), bg=self.cget('bg'))
         label.pack(pady=10)
 
-        tk.Button(
-            self, text="Beginner (9x9, 10 mines)",
-            command=lambda: self.start_classic_game(9, 9, 10, "Beginner")
-        ).pack(pady=5)
-        tk.Button(
-            self, text="Intermediate (16x16, 40 mines)",
-            command=lambda: self.start_classic_game(16, 16, 40, "Intermediate")
-        ).pack(pady=5)
-        tk.Button(
-            self, text="Expert (30x16, 99 mines)",
-            command=lambda: self.start_classic_game(30, 16, 99, "Expert")
-        ).pack(pady=5)
+        for difficulty, (w, h, m) in CLASSIC_PRESETS.items():
+            tk.Button(
+                self, text=f"{difficulty} ({w}x{h}, {m} mines)",
+                command=lambda w=w, h=h, m=m, d=difficulty: self.start_classic_game(w, h, m, d)
+            ).pack(pady=5)
         tk.Button(
             self, text="Random", command=self.start_random_game
         ).pack(pady=5)
+
+        self.no_guess_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self, text="No guessing", variable=self.no_guess_var, bg=self.cget('bg')
+        ).pack(pady=5)
+
+        board_id_frame = tk.Frame(self, bg=self.cget('bg'))
+        board_id_frame.pack(pady=5)
+        tk.Label(board_id_frame, text="Board ID:", bg=board_id_frame.cget('bg')).pack(side="left", padx=5)
+        self.board_id_entry = tk.Entry(board_id_frame, width=26)
+        self.board_id_entry.pack(side="left", padx=5)
+        tk.Button(board_id_frame, text="Play", command=self.start_from_board_id).pack(side="left", padx=5)
+
         tk.Button(
             self, text="View Classic Leaderboard",
             command=lambda: controller.show_frame("ClassicLeaderboardDisplay")
@@ -35,7 +49,19 @@ class ClassicMenu(tk.Frame):
         ).pack(pady=20)
 
     def start_classic_game(self, width, height, mines, difficulty):
-        ClassicGameBoard(self.controller, width, height, mines, difficulty)
+        ClassicGameBoard(self.controller, width, height, mines, difficulty, no_guess=self.no_guess_var.get())
+
+    def start_from_board_id(self):
+        try:
+            board_id = parse_board_id(self.board_id_entry.get(), expected_mode="classic", max_side=30)
+        except ValueError as e:
+            messagebox.showerror("Invalid Board ID", str(e))
+            return
+        config = (board_id.width, board_id.height, board_id.mines)
+        difficulty = next((d for d, preset in CLASSIC_PRESETS.items() if preset == config), "Random")
+        ClassicGameBoard(self.controller, *config, difficulty,
+                         seed=board_id.seed, first_click=(board_id.first_r, board_id.first_c),
+                         no_guess=board_id.no_guess)
 
     def start_random_game(self):
         w = random.randint(10, 30)
@@ -55,4 +81,4 @@ class ClassicMenu(tk.Frame):
         if m < 0:
             m = 0
 
-        ClassicGameBoard(self.controller, w, h, m, "Random")
\ No newline at end of file
+        ClassicGameBoard(self.controller, w, h, m, "Random", no_guess=self.no_guess_var.get())
\ No newline at end of file
@@ -1,6 +1,12 @@
 import tkinter as tk
 from tkinter import messagebox
 from .custom_game import CustomGameBoard
+from .huge_game import HugeGameBoard
+from .endless_game import EndlessGameBoard
+from logic.board_id import parse_board_id
+
+MAX_SIDE = 30  # larger boards open as a Huge game
+HUGE_MAX_SIDE = 10000
 
 class CustomMenu(tk.Frame):
     def __init__(self, parent, controller):
@@ -20,8 +26,10 @@ class CustomMenu(tk.Frame):
             entry.pack(side="left", padx=5)
             return entry
 
-        self.width_entry = add_entry_row("Width", 10, 30, "10")
-        self.height_entry = add_entry_row("Height", 10, 30, "10")
+        self.width_entry = add_entry_row("Width", 10, HUGE_MAX_SIDE, "10")
+        self.height_entry = add_entry_row("Height", 10, HUGE_MAX_SIDE, "10")
+        tk.Label(self, text=f"Boards wider or taller than {MAX_SIDE} open as a scrollable Huge game.",
+                 bg=entry_frame_bg, fg="gray").pack()
         
         mine_frame = tk.Frame(self, bg=entry_frame_bg)
         mine_frame.pack(pady=2)
@@ -31,8 +39,24 @@ class CustomMenu(tk.Frame):
         self.mines_entry.pack(side="left", padx=5)
 
 
+        self.no_guess_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self, text="No guessing", variable=self.no_guess_var, bg=entry_frame_bg
+        ).pack(pady=2)
+
         start_button = tk.Button(self, text="Start Custom Game", command=self.start_custom_game)
         start_button.pack(pady=10)
+
+        endless_button = tk.Button(self, text="Endless Mode", command=lambda: EndlessGameBoard(self.controller))
+        endless_button.pack(pady=2)
+
+        board_id_frame = tk.Frame(self, bg=entry_frame_bg)
+        board_id_frame.pack(pady=5)
+        tk.Label(board_id_frame, text="Board ID:", bg=entry_frame_bg).pack(side="left", padx=5)
+        self.board_id_entry = tk.Entry(board_id_frame, width=26)
+        self.board_id_entry.pack(side="left", padx=5)
+        tk.Button(board_id_frame, text="Play", command=self.start_from_board_id).pack(side="left", padx=5)
+
         leaderboard_button = tk.Button(
             self, text="View Custom Leaderboard",
             command=lambda: controller.show_frame("CustomLeaderboardDisplay")
@@ -48,27 +72,51 @@ class CustomMenu(tk.Frame):
             w_str, h_str, m_str = self.width_entry.get(), self.height_entry.get(), self.mines_entry.get()
             if not (w_str and h_str and m_str): raise ValueError("All fields are required.")
             w, h, m = int(w_str), int(h_str), int(m_str)
+            self.validate_config(w, h, m)
+            if self.is_huge(w, h):
+                if self.no_guess_var.get():
+                    raise ValueError(f"No guessing is only available up to {MAX_SIDE}x{MAX_SIDE}.")
+                HugeGameBoard(self.controller, w, h, m)
+            else:
+                CustomGameBoard(self.controller, w, h, m, no_guess=self.no_guess_var.get())
+        except ValueError as e:
+            messagebox.showerror("Invalid Input", str(e))
 
-            if not (10 <= w <= 30 and 10 <= h <= 30):
-                raise ValueError("Width/Height must be between 10 and 30.")
-            total_tiles = w * h
-            if total_tiles == 0: raise ValueError("Board dimensions cannot be zero.")
-            
-            # Adjusted mine validation
-            min_mines = 10
-            # Max mines should allow at least a few non-mine cells for first click safety
-            # (e.g., 9 for a 3x3 safe area)
-            safe_area_cells = 9 
-            max_m = total_tiles - safe_area_cells
-            if max_m < min_mines : # If board is too small to even satisfy min_mines + safe_area
-                 max_m = total_tiles -1 if total_tiles > 0 else 0
-
-
-            if m < min_mines:
-                raise ValueError(f"Mines must be >= {min_mines}.")
-            if m > max_m :
-                 raise ValueError(f"Mines ({m}) exceed maximum allowed ({max_m}) for a {w}x{h} grid to ensure safe first click.")
-            
-            CustomGameBoard(self.controller, w, h, m)
+    def start_from_board_id(self):
+        try:
+            board_id = parse_board_id(self.board_id_entry.get(), expected_mode="custom")
+            self.validate_config(board_id.width, board_id.height, board_id.mines)
         except ValueError as e:
-            messagebox.showerror("Invalid Input", str(e))
\ No newline at end of file
+            messagebox.showerror("Invalid Board ID", str(e))
+            return
+        first_click = (board_id.first_r, board_id.first_c)
+        if self.is_huge(board_id.width, board_id.height):
+            HugeGameBoard(self.controller, board_id.width, board_id.height, board_id.mines,
+                          seed=board_id.seed, first_click=first_click)
+        else:
+            CustomGameBoard(self.controller, board_id.width, board_id.height, board_id.mines,
+                            seed=board_id.seed, first_click=first_click, no_guess=board_id.no_guess)
+
+    def is_huge(self, w, h):
+        return w > MAX_SIDE or h > MAX_SIDE
+
+    def validate_config(self, w, h, m):
+        if not (10 <= w <= HUGE_MAX_SIDE and 10 <= h <= HUGE_MAX_SIDE):
+            raise ValueError(f"Width/Height must be between 10 and {HUGE_MAX_SIDE}.")
+        total_tiles = w * h
+        if total_tiles == 0: raise ValueError("Board dimensions cannot be zero.")
+        
+        # Adjusted mine validation
+        min_mines = 10
+        # Max mines should allow at least a few non-mine cells for first click safety
+        # (e.g., 9 for a 3x3 safe area)
+        safe_area_cells = 9 
+        max_m = total_tiles - safe_area_cells
+        if max_m < min_mines : # If board is too small to even satisfy min_mines + safe_area
+             max_m = total_tiles -1 if total_tiles > 0 else 0
+
+
+        if m < min_mines:
+            raise ValueError(f"Mines must be >= {min_mines}.")
+        if m > max_m :
+             raise ValueError(f"Mines ({m}) exceed maximum allowed ({max_m}) for a {w}x{h} grid to ensure safe first click.")
\ No newline at end of file
@@ -0,0 +1,266 @@
+import tkinter as tk
+from tkinter import messagebox
+import time
+
+from utils.helpers import format_time
+from utils.board_canvas import UNREVEALED_FILL, REVEALED_FILL, GRID_OUTLINE, NUMBER_COLORS
+from logic.board_id import new_seed
+from logic.endless import CHUNK, EndlessBoard
+
+CELL_SIZE = 20
+VIEW_CELLS = (40, 30)  # initial window size in cells (columns, rows)
+DRAG_THRESHOLD = 5     # pixels a press may move and still count as a click
+
+
+class EndlessGameBoard(tk.Toplevel):
+    """
+    Endless mode: an unbounded board explored by dragging (or with the arrow
+    keys and mouse wheel). The score is the number of cells revealed before
+    hitting a mine.
+
+    Only chunks on screen are drawn. A chunk nobody has reached yet is drawn
+    as one grid of lines instead of per-cell items; once the player's reveals
+    reach it, it is redrawn cell by cell from the logic.endless model.
+    """
+    def __init__(self, controller, seed=None):
+        super().__init__()
+        self.controller = controller
+        self.seed = seed if seed is not None else new_seed()
+        self.title("Custom Game - Endless")
+        self.configure(bg="lightgrey")
+
+        self.is_game_over = False
+        self.start_time = None
+        self.timer_id = None
+        self.m_key_pressed = False
+        self.press = None  # (x, y, dragged) of the current left-button press
+
+        self.model = EndlessBoard(self.seed)
+        self.view_x = -(VIEW_CELLS[0] // 2) * CELL_SIZE  # board pixel at the canvas' left edge
+        self.view_y = -(VIEW_CELLS[1] // 2) * CELL_SIZE
+        self.tiles = {}     # chunk key -> True if drawn per cell, False if drawn as a blank grid
+        self.rect_ids = {}  # (r, c) -> rectangle item, for cells of per-cell tiles
+        self.text_ids = {}  # (r, c) -> text item
+
+        top_frame = tk.Frame(self, bg=self.cget('bg'))
+        top_frame.pack(side="top", fill="x", pady=5)
+
+        self.score_label = tk.Label(top_frame, text="Revealed: 0", bg=top_frame.cget('bg'))
+        self.score_label.pack(side="left", padx=10)
+
+        self.timer_label = tk.Label(top_frame, text="Time: 0.00", bg=top_frame.cget('bg'))
+        self.timer_label.pack(side="right", padx=10)
+
+        tk.Label(top_frame, text=f"Seed: {self.seed:08x}", bg=top_frame.cget('bg')).pack(side="left", expand=True)
+
+        self.canvas = tk.Canvas(self, width=VIEW_CELLS[0] * CELL_SIZE, height=VIEW_CELLS[1] * CELL_SIZE,
+                                bg=REVEALED_FILL, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+
+        self.canvas.bind("<Configure>", lambda e: self.refresh_view())
+        self.canvas.bind("<ButtonPress-1>", self.on_press)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_release)
+        self.canvas.bind("<Button-3>", self.on_canvas_right_click)
+        self.canvas.bind("<Button-2>", self.on_canvas_right_click)
+        self.canvas.bind("<Control-Button-1>", self.on_canvas_right_click)
+        self.canvas.bind("<MouseWheel>", lambda e: self.pan(0, CELL_SIZE if e.delta > 0 else -CELL_SIZE))
+        self.canvas.bind("<Shift-MouseWheel>", lambda e: self.pan(CELL_SIZE if e.delta > 0 else -CELL_SIZE, 0))
+        self.canvas.bind("<Button-4>", lambda e: self.pan(0, CELL_SIZE))
+        self.canvas.bind("<Button-5>", lambda e: self.pan(0, -CELL_SIZE))
+
+        self.focus_set()
+        self.bind("<KeyPress-m>", lambda e: setattr(self, 'm_key_pressed', True))
+        self.bind("<KeyRelease-m>", lambda e: setattr(self, 'm_key_pressed', False))
+        self.bind("<KeyPress-M>", lambda e: setattr(self, 'm_key_pressed', True))
+        self.bind("<KeyRelease-M>", lambda e: setattr(self, 'm_key_pressed', False))
+        self.bind("<Left>", lambda e: self.pan(CELL_SIZE, 0))
+        self.bind("<Right>", lambda e: self.pan(-CELL_SIZE, 0))
+        self.bind("<Up>", lambda e: self.pan(0, CELL_SIZE))
+        self.bind("<Down>", lambda e: self.pan(0, -CELL_SIZE))
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        if self.timer_id:
+            self.after_cancel(self.timer_id)
+        self.destroy()
+
+    # Viewport
+
+    def pan(self, dx, dy):
+        """Moves the view contents by (dx, dy) pixels and draws what came into view."""
+        if not dx and not dy:
+            return
+        self.view_x -= dx
+        self.view_y -= dy
+        self.canvas.move("tile", dx, dy)
+        self.refresh_view()
+
+    def refresh_view(self):
+        span = CHUNK * CELL_SIZE
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        wanted = {(cr, cc)
+                  for cr in range(self.view_y // span, (self.view_y + height) // span + 1)
+                  for cc in range(self.view_x // span, (self.view_x + width) // span + 1)}
+        for key in [key for key in self.tiles if key not in wanted]:
+            self.drop_tile(key)
+        for key in wanted:
+            if key not in self.tiles:
+                self.draw_tile(key)
+
+    def tile_tag(self, key):
+        return f"chunk{key[0]}_{key[1]}"
+
+    def draw_tile(self, key):
+        cr, cc = key
+        tag = self.tile_tag(key)
+        x0, y0 = cc * CHUNK * CELL_SIZE - self.view_x, cr * CHUNK * CELL_SIZE - self.view_y
+        reached = key in self.model.chunks or key in self.model.summaries
+        self.tiles[key] = reached
+        if not reached:
+            span = CHUNK * CELL_SIZE
+            self.canvas.create_rectangle(x0, y0, x0 + span, y0 + span, fill=UNREVEALED_FILL, outline="",
+                                         tags=("tile", tag))
+            for i in range(CHUNK + 1):
+                offset = i * CELL_SIZE
+                self.canvas.create_line(x0 + offset, y0, x0 + offset, y0 + span, fill=GRID_OUTLINE, tags=("tile", tag))
+                self.canvas.create_line(x0, y0 + offset, x0 + span, y0 + offset, fill=GRID_OUTLINE, tags=("tile", tag))
+            return
+
+        for lr in range(CHUNK):
+            r = cr * CHUNK + lr
+            y = y0 + lr * CELL_SIZE
+            for lc in range(CHUNK):
+                c = cc * CHUNK + lc
+                x = x0 + lc * CELL_SIZE
+                fill, text, color = self.cell_style(r, c)
+                self.rect_ids[(r, c)] = self.canvas.create_rectangle(
+                    x, y, x + CELL_SIZE, y + CELL_SIZE, fill=fill, outline=GRID_OUTLINE, tags=("tile", tag))
+                if text:
+                    self.text_ids[(r, c)] = self.canvas.create_text(
+                        x + CELL_SIZE / 2, y + CELL_SIZE / 2, text=text, fill=color,
+                        font=("Arial", 8, "bold"), tags=("tile", tag))
+
+    def drop_tile(self, key):
+        self.canvas.delete(self.tile_tag(key))
+        if self.tiles.pop(key):
+            cr, cc = key
+            for r in range(cr * CHUNK, (cr + 1) * CHUNK):
+                for c in range(cc * CHUNK, (cc + 1) * CHUNK):
+                    del self.rect_ids[(r, c)]
+                    self.text_ids.pop((r, c), None)
+
+    def cell_style(self, r, c):
+        state = self.model.cell_state(r, c)
+        if state is None:
+            return UNREVEALED_FILL, "", "black"
+        revealed, flagged, mine, count = state
+        if revealed:
+            if mine:
+                return ("red", "*", "white") if (r, c) == self.model.exploded else ("lightgrey", "*", "black")
+            return REVEALED_FILL, str(count) if count else "", NUMBER_COLORS[count] if count else "black"
+        if flagged:
+            if self.is_game_over and not mine:
+                return "lightcoral", "X", "black"
+            return UNREVEALED_FILL, "F", "red"
+        if self.is_game_over and mine:
+            return "lightgrey", "*", "black"
+        return UNREVEALED_FILL, "", "black"
+
+    def draw_cells(self, cells):
+        """Redraws changed cells, switching blank chunk tiles to per-cell ones first."""
+        for key in {self.model.chunk_key(r, c) for r, c in cells}:
+            if self.tiles.get(key) is False:
+                self.drop_tile(key)
+                self.draw_tile(key)
+        for r, c in cells:
+            rect_id = self.rect_ids.get((r, c))
+            if rect_id is None:
+                continue
+            fill, text, color = self.cell_style(r, c)
+            self.canvas.itemconfig(rect_id, fill=fill)
+            text_id = self.text_ids.get((r, c))
+            if text_id is not None:
+                self.canvas.itemconfig(text_id, text=text, fill=color)
+            elif text:
+                x, y = c * CELL_SIZE - self.view_x, r * CELL_SIZE - self.view_y
+                key = self.model.chunk_key(r, c)
+                self.text_ids[(r, c)] = self.canvas.create_text(
+                    x + CELL_SIZE / 2, y + CELL_SIZE / 2, text=text, fill=color,
+                    font=("Arial", 8, "bold"), tags=("tile", self.tile_tag(key)))
+
+    # Game
+
+    def cell_at(self, x, y):
+        return (int(y) + self.view_y) // CELL_SIZE, (int(x) + self.view_x) // CELL_SIZE
+
+    def on_press(self, event):
+        self.focus_set()
+        self.press = (event.x, event.y, False)
+
+    def on_drag(self, event):
+        if self.press is None:
+            return
+        x, y, dragged = self.press
+        if not dragged and abs(event.x - x) < DRAG_THRESHOLD and abs(event.y - y) < DRAG_THRESHOLD:
+            return
+        self.pan(event.x - x, event.y - y)
+        self.press = (event.x, event.y, True)
+
+    def on_release(self, event):
+        press, self.press = self.press, None
+        if press is None or press[2]:
+            return
+        self.on_left_click(*self.cell_at(event.x, event.y))
+
+    def on_canvas_right_click(self, event):
+        self.on_right_click(*self.cell_at(event.x, event.y))
+        return "break"
+
+    def on_left_click(self, r, c):
+        if self.m_key_pressed:
+            self.on_right_click(r, c)
+            return
+        if self.is_game_over:
+            return
+
+        model = self.model
+        if self.start_time is None:
+            self.start_time = time.time()
+            self.update_timer()
+        state = model.cell_state(r, c)
+        if state is not None and state[0]:
+            changed = model.chord(r, c)
+        else:
+            changed = model.reveal(r, c)
+        self.draw_cells(changed)
+        self.score_label.config(text=f"Revealed: {model.revealed_count}")
+        if model.exploded is not None:
+            self.game_over()
+
+    def on_right_click(self, r, c):
+        if self.is_game_over:
+            return
+        if self.model.toggle_flag(r, c) is not None:
+            self.draw_cells([(r, c)])
+
+    def game_over(self):
+        self.is_game_over = True
+        if self.timer_id:
+            self.after_cancel(self.timer_id)
+        time_taken = time.time() - self.start_time if self.start_time else 0
+        model = self.model
+        for key in [key for key, per_cell in self.tiles.items() if not per_cell and key in model.chunks]:
+            self.drop_tile(key)
+            self.draw_tile(key)
+        self.draw_cells(list(self.rect_ids))
+        messagebox.showinfo("Game Over",
+                            f"You revealed {self.model.revealed_count} cells in {format_time(time_taken)}.")
+
+    def update_timer(self):
+        if self.is_game_over:
+            return
+        elapsed = time.time() - self.start_time if self.start_time else 0
+        self.timer_label.config(text=f"Time: {elapsed:.2f}")
+        self.timer_id = self.after(100, self.update_timer)
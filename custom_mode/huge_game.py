@@ -0,0 +1,379 @@
+import tkinter as tk
+from tkinter import messagebox
+import time
+
+from leaderboard.leaderboard import update_custom_leaderboard
+from utils.helpers import format_time
+from utils.board_canvas import UNREVEALED_FILL, REVEALED_FILL, GRID_OUTLINE, NUMBER_COLORS
+from utils.redraw import RedrawQueue
+from logic.board_id import new_seed, format_board_id
+from logic.huge_board import HugeBoard
+from logic.replay import ReplayRecorder, save_replay, REVEAL, FLAG, CHORD, ENGINE_HUGE
+from utils.latency import latency_probe
+
+TILE = 16  # cells per side of a drawing tile
+ZOOM_LEVELS = (8, 12, 16, 24, 32)  # cell sizes in pixels
+DEFAULT_ZOOM = 3
+VIEWPORT_CELLS = 40  # initial window size, in cells at the default zoom
+
+
+class HugeGameBoard(tk.Toplevel):
+    """
+    Custom game for boards too big for a full canvas (up to 10,000 x 10,000).
+
+    The model is a bit-packed logic.huge_board.HugeBoard. The canvas is
+    scrollable and zoomable but only holds items for the tiles of TILE x TILE
+    cells around the visible area: scrolling draws the tiles that come into
+    view and deletes the ones that leave it, and every cell is drawn from
+    the model's state, so game over only has to redraw what is on screen.
+    """
+    def __init__(self, controller, width, height, mines, seed=None, first_click=None):
+        super().__init__()
+        self.controller = controller
+        self.width = width
+        self.height = height
+        self.initial_mines_count = mines
+        self.mines_count = mines
+
+        self.title(f"Custom Game - Huge ({width}x{height})")
+        self.configure(bg="lightgrey")
+
+        self.is_game_over = False
+        self.won = False
+        self.first_click_done = False
+        self.start_time = None
+        self.timer_id = None
+        self.refresh_id = None
+        self.m_key_pressed = False
+        self.seed = seed if seed is not None else new_seed()
+        self.board_id = None
+
+        self.zoom = DEFAULT_ZOOM
+        self.cell_size = ZOOM_LEVELS[self.zoom]
+        self.tiles = {}     # (tile row, tile col) -> canvas tag of the tile's items
+        self.rect_ids = {}  # flat index -> rectangle item, for cells on drawn tiles
+        self.text_ids = {}  # flat index -> text item, for drawn cells with a label
+
+        top_frame = tk.Frame(self, bg=self.cget('bg'))
+        top_frame.pack(side="top", fill="x", pady=5)
+
+        self.mine_label = tk.Label(top_frame, text=f"Mines: {mines}", bg=top_frame.cget('bg'))
+        self.mine_label.pack(side="left", padx=10)
+
+        self.timer_label = tk.Label(top_frame, text="Time: 0.00", bg=top_frame.cget('bg'))
+        self.timer_label.pack(side="right", padx=10)
+
+        tk.Button(top_frame, text="+", width=2, command=lambda: self.set_zoom(self.zoom + 1)).pack(side="right")
+        tk.Button(top_frame, text="-", width=2, command=lambda: self.set_zoom(self.zoom - 1)).pack(side="right")
+
+        self.board_id_label = tk.Label(top_frame, text="Board: -", bg=top_frame.cget('bg'))
+        self.board_id_label.pack(side="left", expand=True)
+        self.board_id_label.bind("<Button-1>", self.copy_board_id)
+
+        board_frame = tk.Frame(self, bg=self.cget('bg'))
+        board_frame.pack(fill="both", expand=True)
+        board_frame.grid_rowconfigure(0, weight=1)
+        board_frame.grid_columnconfigure(0, weight=1)
+
+        view_w = min(width, VIEWPORT_CELLS) * self.cell_size
+        view_h = min(height, VIEWPORT_CELLS) * self.cell_size
+        self.canvas = tk.Canvas(board_frame, width=view_w, height=view_h, bg=REVEALED_FILL, highlightthickness=0)
+        self.x_scrollbar = tk.Scrollbar(board_frame, orient="horizontal", command=self.canvas.xview)
+        self.y_scrollbar = tk.Scrollbar(board_frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(xscrollcommand=self.on_x_scroll, yscrollcommand=self.on_y_scroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.y_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.x_scrollbar.grid(row=1, column=0, sticky="ew")
+        self.update_scroll_region()
+
+        self.model = HugeBoard(width, height, mines)
+        self.recorder = ReplayRecorder(ENGINE_HUGE)
+        self.redraws = RedrawQueue(self, self.draw_cell)
+        self.latency = latency_probe(self, f"huge {width}x{height}, {mines} mines")
+
+        self.canvas.bind("<Configure>", lambda e: self.schedule_refresh())
+        self.canvas.bind("<Button-1>", self.on_canvas_left_click)
+        self.canvas.bind("<Button-3>", self.on_canvas_right_click)
+        self.canvas.bind("<Button-2>", self.on_canvas_right_click)
+        self.canvas.bind("<Control-Button-1>", self.on_canvas_right_click)
+        self.canvas.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.canvas.bind("<Shift-MouseWheel>", lambda e: self.canvas.xview_scroll(-1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Control-MouseWheel>", lambda e: self.set_zoom(self.zoom + (1 if e.delta > 0 else -1)))
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+        self.focus_set()
+        self.bind("<KeyPress-m>", lambda e: setattr(self, 'm_key_pressed', True))
+        self.bind("<KeyRelease-m>", lambda e: setattr(self, 'm_key_pressed', False))
+        self.bind("<KeyPress-M>", lambda e: setattr(self, 'm_key_pressed', True))
+        self.bind("<KeyRelease-M>", lambda e: setattr(self, 'm_key_pressed', False))
+        self.bind("<Left>", lambda e: self.canvas.xview_scroll(-1, "units"))
+        self.bind("<Right>", lambda e: self.canvas.xview_scroll(1, "units"))
+        self.bind("<Up>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.bind("<Down>", lambda e: self.canvas.yview_scroll(1, "units"))
+        self.bind("<plus>", lambda e: self.set_zoom(self.zoom + 1))
+        self.bind("<minus>", lambda e: self.set_zoom(self.zoom - 1))
+
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        if first_click is not None:
+            self.scroll_to(*first_click)
+            self.on_left_click(*first_click)
+
+    def on_close(self):
+        self.latency.close()
+        self.redraws.cancel()
+        if self.refresh_id:
+            self.after_cancel(self.refresh_id)
+        if self.timer_id:
+            self.after_cancel(self.timer_id)
+        self.destroy()
+
+    def copy_board_id(self, event=None):
+        if self.board_id:
+            self.clipboard_clear()
+            self.clipboard_append(self.board_id)
+
+    # Viewport
+
+    def update_scroll_region(self):
+        self.canvas.configure(scrollregion=(0, 0, self.width * self.cell_size, self.height * self.cell_size),
+                              xscrollincrement=self.cell_size, yscrollincrement=self.cell_size)
+
+    def on_x_scroll(self, first, last):
+        self.x_scrollbar.set(first, last)
+        self.schedule_refresh()
+
+    def on_y_scroll(self, first, last):
+        self.y_scrollbar.set(first, last)
+        self.schedule_refresh()
+
+    def on_mouse_wheel(self, event):
+        self.canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
+    def scroll_to(self, r, c):
+        """Centres the view on cell (r, c)."""
+        self.update_idletasks()
+        view_w, view_h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        total_w, total_h = self.width * self.cell_size, self.height * self.cell_size
+        x = (c + 0.5) * self.cell_size - view_w / 2
+        y = (r + 0.5) * self.cell_size - view_h / 2
+        self.canvas.xview_moveto(max(0.0, x / total_w))
+        self.canvas.yview_moveto(max(0.0, y / total_h))
+
+    def set_zoom(self, zoom):
+        zoom = max(0, min(len(ZOOM_LEVELS) - 1, zoom))
+        if zoom == self.zoom:
+            return
+        # Keep the cell in the middle of the view where it is.
+        view_w, view_h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        center_c = (self.canvas.canvasx(view_w / 2)) / self.cell_size
+        center_r = (self.canvas.canvasy(view_h / 2)) / self.cell_size
+
+        self.zoom = zoom
+        self.cell_size = ZOOM_LEVELS[zoom]
+        self.redraws.flush()
+        self.canvas.delete("tile")
+        self.tiles.clear()
+        self.rect_ids.clear()
+        self.text_ids.clear()
+        self.update_scroll_region()
+        self.scroll_to(int(center_r), int(center_c))
+        self.schedule_refresh()
+
+    def schedule_refresh(self):
+        if self.refresh_id is None:
+            self.refresh_id = self.after_idle(self.refresh_view)
+
+    def refresh_view(self):
+        """Draws the tiles that came into view and drops the ones that left it."""
+        self.refresh_id = None
+        span = TILE * self.cell_size
+        left = int(self.canvas.canvasx(0)) // span - 1
+        top = int(self.canvas.canvasy(0)) // span - 1
+        right = int(self.canvas.canvasx(self.canvas.winfo_width())) // span + 1
+        bottom = int(self.canvas.canvasy(self.canvas.winfo_height())) // span + 1
+        max_tr, max_tc = (self.height - 1) // TILE, (self.width - 1) // TILE
+        wanted = {(tr, tc) for tr in range(max(0, top), min(max_tr, bottom) + 1)
+                  for tc in range(max(0, left), min(max_tc, right) + 1)}
+
+        for key in [key for key in self.tiles if key not in wanted]:
+            self.drop_tile(key)
+        for key in wanted:
+            if key not in self.tiles:
+                self.draw_tile(*key)
+
+    def draw_tile(self, tr, tc):
+        tag = f"tile{tr}_{tc}"
+        self.tiles[(tr, tc)] = tag
+        size = self.cell_size
+        for r in range(tr * TILE, min(self.height, (tr + 1) * TILE)):
+            for c in range(tc * TILE, min(self.width, (tc + 1) * TILE)):
+                idx = r * self.width + c
+                fill, text, color = self.cell_style(idx)
+                x, y = c * size, r * size
+                self.rect_ids[idx] = self.canvas.create_rectangle(
+                    x, y, x + size, y + size, fill=fill, outline=GRID_OUTLINE, tags=("tile", tag))
+                if text:
+                    self.text_ids[idx] = self.canvas.create_text(
+                        x + size / 2, y + size / 2, text=text, fill=color,
+                        font=("Arial", max(6, size * 2 // 5), "bold"), tags=("tile", tag))
+
+    def drop_tile(self, key):
+        tr, tc = key
+        self.canvas.delete(self.tiles.pop(key))
+        for r in range(tr * TILE, min(self.height, (tr + 1) * TILE)):
+            for c in range(tc * TILE, min(self.width, (tc + 1) * TILE)):
+                idx = r * self.width + c
+                del self.rect_ids[idx]
+                self.text_ids.pop(idx, None)
+
+    def cell_style(self, idx):
+        """(fill, text, text colour) for a cell, derived from the model and game state."""
+        model = self.model
+        if model.is_revealed(idx):
+            if model.is_mine(idx):
+                return ("red", "*", "white") if idx == model.exploded else ("lightgrey", "*", "black")
+            count = model.count(idx)
+            return REVEALED_FILL, str(count) if count else "", NUMBER_COLORS[count] if count else "black"
+        if model.is_flagged(idx):
+            if self.is_game_over and not self.won and not model.is_mine(idx):
+                return "lightcoral", "X", "black"
+            return UNREVEALED_FILL, "F", "red"
+        if self.is_game_over and model.is_mine(idx):
+            return ("lightgrey", "*", "black") if not self.won else (UNREVEALED_FILL, "F", "green")
+        return UNREVEALED_FILL, "", "black"
+
+    def draw_cell(self, idx):
+        rect_id = self.rect_ids.get(idx)
+        if rect_id is None:
+            return  # not on screen; drawn from the model when its tile appears
+        fill, text, color = self.cell_style(idx)
+        self.canvas.itemconfig(rect_id, fill=fill)
+        text_id = self.text_ids.get(idx)
+        if text_id is not None:
+            self.canvas.itemconfig(text_id, text=text, fill=color)
+        elif text:
+            r, c = divmod(idx, self.width)
+            size = self.cell_size
+            tr, tc = r // TILE, c // TILE
+            self.text_ids[idx] = self.canvas.create_text(
+                c * size + size / 2, r * size + size / 2, text=text, fill=color,
+                font=("Arial", max(6, size * 2 // 5), "bold"), tags=("tile", self.tiles[(tr, tc)]))
+
+    # Game
+
+    def on_canvas_left_click(self, event):
+        self.focus_set()
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_left_click(*cell)
+
+    def on_canvas_right_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_right_click(*cell)
+        return "break"
+
+    def cell_at(self, x, y):
+        c = int(self.canvas.canvasx(x) // self.cell_size)
+        r = int(self.canvas.canvasy(y) // self.cell_size)
+        if 0 <= r < self.height and 0 <= c < self.width:
+            return r, c
+        return None
+
+    def on_left_click(self, r, c):
+        self.latency.click("left")
+        if self.m_key_pressed:
+            self.on_right_click(r, c)
+            return
+
+        model = self.model
+        idx = model.index(r, c)
+        if self.is_game_over or model.is_flagged(idx):
+            return
+
+        if model.is_revealed(idx):
+            self.recorder.record(CHORD, idx)
+            with self.latency.model("chord"):
+                changed = model.chord(r, c)
+            self.handle_revealed(changed)
+            return
+
+        if not self.first_click_done:
+            self.first_click_done = True
+            self.config(cursor="watch")
+            self.update_idletasks()
+            with self.latency.model("place"):
+                self.mines_count = model.place_mines(r, c, rng=self.seed)
+            self.config(cursor="")
+            self.board_id = format_board_id("custom", self.width, self.height, self.initial_mines_count, r, c, self.seed)
+            self.board_id_label.config(text=f"Board: {self.board_id}")
+            self.mine_label.config(text=f"Mines: {model.mines_left()}")
+            self.start_time = time.time()
+            self.recorder.start(self.start_time)
+            self.update_timer()
+
+        self.recorder.record(REVEAL, idx)
+        with self.latency.model("reveal"):
+            changed = model.reveal(r, c)
+        self.handle_revealed(changed)
+
+    def on_right_click(self, r, c):
+        self.latency.click("right")
+        if self.is_game_over:
+            return
+        with self.latency.model("flag"):
+            is_flagged = self.model.toggle_flag(r, c)
+        if is_flagged is None:
+            return
+        self.recorder.record(FLAG, self.model.index(r, c))
+        self.draw_cell(self.model.index(r, c))
+        if self.first_click_done:
+            self.mine_label.config(text=f"Mines: {self.model.mines_left()}")
+
+    def handle_revealed(self, changed):
+        """
+        `changed` is the RevealedArea of the move; only its cells on drawn
+        tiles are queued, the others are drawn from the model with their tiles.
+        """
+        if self.tiles:
+            rect_ids = self.rect_ids
+            rows = [tr for tr, _ in self.tiles]
+            cols = [tc for _, tc in self.tiles]
+            visible = changed.within(min(rows) * TILE, min(cols) * TILE, (max(rows) + 1) * TILE, (max(cols) + 1) * TILE)
+            self.redraws.push(idx for idx in visible if idx in rect_ids)
+        if self.model.exploded is not None:
+            self.game_over(False)
+            return
+        with self.latency.model():
+            won = changed and self.model.is_won()
+        if won:
+            self.game_over(True)
+
+    def game_over(self, won):
+        self.redraws.flush()
+        self.is_game_over = True
+        self.won = won
+        if self.timer_id:
+            self.after_cancel(self.timer_id)
+        time_taken = time.time() - self.start_time if self.start_time else 0
+        save_replay(self.recorder, self.board_id, won, time_taken)
+
+        # Off-screen cells pick up the game-over look when their tiles are drawn.
+        for idx in list(self.rect_ids):
+            self.draw_cell(idx)
+        self.latency.finish()  # before the dialogs, which would otherwise count as paint time
+
+        if won:
+            messagebox.showinfo("You Win!", f"You cleared the huge board in {format_time(time_taken)}!")
+            update_custom_leaderboard(self.width, self.height, self.mines_count, time_taken, board_id=self.board_id)
+        else:
+            messagebox.showinfo("Game Over", "You hit a mine in Custom Mode!")
+
+    def update_timer(self):
+        if self.is_game_over:
+            return
+        elapsed = time.time() - self.start_time if self.start_time else 0
+        self.timer_label.config(text=f"Time: {elapsed:.2f}")
+        self.timer_id = self.after(100, self.update_timer)
@@ -1,14 +1,43 @@
 import tkinter as tk
 from tkinter import messagebox
-import random
 import time
 import math 
+from functools import lru_cache
 
 from leaderboard.leaderboard import update_leaderboard
-from utils.helpers import format_time
+from utils.helpers import format_time, probability_color
+from utils.redraw import RedrawQueue
+from logic.board_id import new_seed, format_board_id
+from logic.no_guess import generate_no_guess
+from logic.replay import ReplayRecorder, save_replay, REVEAL, FLAG
+from utils.latency import latency_probe
+from logic.board import Board, HEX
+from logic.topology import SQRT3, get_topology
+from logic.probability import ProbabilityMap
+
+# Corner directions of a pointy-top hex, (cos, sin) of -30, 30, ..., 270 degrees.
+UNIT_CORNERS = tuple((math.cos(math.radians(60 * i - 30)), math.sin(math.radians(60 * i - 30))) for i in range(6))
+
+
+@lru_cache(maxsize=8)
+def hex_geometry(rows, cols, radius, padding_x, padding_y):
+    """
+    Drawing geometry for a rows x cols grid of hexes with the given radius:
+    the six (dx, dy) corner offsets around a centre, and a flat list of cell
+    centres indexed like Board cells. Cached, so new games of the same size
+    reuse the tables.
+    """
+    corner_offsets = tuple((radius * dx, radius * dy) for dx, dy in UNIT_CORNERS)
+    topology = get_topology(HEX, cols, rows)
+    centers = []
+    for r_idx in range(rows):
+        for c_idx in range(cols):
+            x, y = topology.center(r_idx, c_idx)
+            centers.append((padding_x + radius * x, padding_y + radius * y))
+    return corner_offsets, centers
 
 class HexGameBoard(tk.Toplevel):
-    def __init__(self, controller, rows, cols, mines, difficulty):
+    def __init__(self, controller, rows, cols, mines, difficulty, seed=None, first_click=None, no_guess=False):
         super().__init__()
         self.controller = controller
         self.rows = rows
@@ -17,7 +46,8 @@ class HexGameBoard(tk.Toplevel):
         self.mines_count = mines 
         self.difficulty = difficulty
 
-        self.title(f"Hex Minesweeper - {self.difficulty}")
+        self.no_guess = no_guess
+        self.title(f"Hex Minesweeper - {self.difficulty}{' (No Guessing)' if no_guess else ''}")
         self.resizable(False, False)
         self.configure(bg="lightgrey")
 
@@ -26,6 +56,11 @@ class HexGameBoard(tk.Toplevel):
         self.start_time = None
         self.timer_id = None
         self.m_key_pressed = False
+        self.seed = seed if seed is not None else new_seed()
+        self.board_id = None
+        self.hints_on = False
+        self.probabilities = None  # ProbabilityMap, created the first time hints are shown
+        self.recorder = ReplayRecorder()
 
         self.hex_size = 20
 
@@ -37,6 +72,7 @@ class HexGameBoard(tk.Toplevel):
         # Canvas padding
         self.canvas_padding_x = self.hex_visual_width / 2 + 5
         self.canvas_padding_y = self.hex_visual_height / 2 + 5
+        self.corner_offsets, self.centers = hex_geometry(rows, cols, self.R, self.canvas_padding_x, self.canvas_padding_y)
 
 
         top_frame = tk.Frame(self, bg=self.cget('bg'))
@@ -48,6 +84,13 @@ class HexGameBoard(tk.Toplevel):
         self.timer_label = tk.Label(top_frame, text="Time: 0.00", bg=top_frame.cget('bg'))
         self.timer_label.pack(side="right", padx=10)
 
+        self.hint_button = tk.Button(top_frame, text="Hint", command=self.toggle_hints)
+        self.hint_button.pack(side="right", padx=5)
+
+        self.board_id_label = tk.Label(top_frame, text="Board: -", bg=top_frame.cget('bg'))
+        self.board_id_label.pack(side="left", expand=True)
+        self.board_id_label.bind("<Button-1>", self.copy_board_id)
+
         # Calculate canvas size
         max_c_idx = self.cols - 1
         canvas_w = self.canvas_padding_x * 2
@@ -71,272 +114,276 @@ class HexGameBoard(tk.Toplevel):
         self.canvas = tk.Canvas(self, bg="white", width=int(canvas_w), height=int(canvas_h))
         self.canvas.pack()
 
-        self.board = []
-        for r in range(rows):
-            row_data = []
-            for c in range(cols):
-                cell = {
-                    "is_mine": False, "adj_mines": 0, "is_revealed": False,
-                    "is_flagged": False, "polygon_id": None, "text_id": None
-                }
-                row_data.append(cell)
-            self.board.append(row_data)
+        self.model = Board(cols, rows, mines, topology=HEX)
+        self.polygon_ids = [None] * self.model.size
+        self.text_ids = [None] * self.model.size
 
         self.draw_hex_grid()
+        self.redraws = RedrawQueue(self, self.draw_revealed_hex)
+        self.latency = latency_probe(self, f"hexagon {cols}x{rows}, {mines} mines")
         
         self.focus_set()
         self.bind("<KeyPress-m>", lambda e: setattr(self, 'm_key_pressed', True))
         self.bind("<KeyRelease-m>", lambda e: setattr(self, 'm_key_pressed', False))
         self.bind("<KeyPress-M>", lambda e: setattr(self, 'm_key_pressed', True))
         self.bind("<KeyRelease-M>", lambda e: setattr(self, 'm_key_pressed', False))
+        self.bind("<KeyPress-h>", lambda e: self.toggle_hints())
+        self.bind("<KeyPress-H>", lambda e: self.toggle_hints())
         
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+        if first_click is not None:
+            self.on_left_click(*first_click)
+
     def on_close(self):
+        self.latency.close()
+        self.redraws.cancel()
         if self.timer_id:
             self.after_cancel(self.timer_id)
         self.destroy()
 
+    def copy_board_id(self, event=None):
+        if self.board_id:
+            self.clipboard_clear()
+            self.clipboard_append(self.board_id)
+
     def get_hex_corners(self, center_x, center_y):
         corners = []
-        for i in range(6):
-            angle_deg = 60 * i - 30 
-            angle_rad = math.pi / 180 * angle_deg
-            x = center_x + self.R * math.cos(angle_rad)
-            y = center_y + self.R * math.sin(angle_rad)
-            corners.extend([x, y])
+        for dx, dy in self.corner_offsets:
+            corners.extend((center_x + dx, center_y + dy))
         return corners
 
     def get_hex_center(self, r_idx, c_idx):
-        """Calculate screen coordinates for the center of a hex at (r_idx, c_idx)."""
-        center_x = self.canvas_padding_x + self.R * math.sqrt(3) * (c_idx + 0.5 * (r_idx % 2))
-        center_y = self.canvas_padding_y + self.R * 1.5 * r_idx
-        return center_x, center_y
+        """Screen coordinates for the center of a hex at (r_idx, c_idx), from the precomputed table."""
+        return self.centers[r_idx * self.cols + c_idx]
 
     def draw_hex_grid(self):
-        for r_idx in range(self.rows): 
-            for c_idx in range(self.cols): 
-                center_x, center_y = self.get_hex_center(r_idx, c_idx)
-                corners = self.get_hex_corners(center_x, center_y)
-                poly_id = self.canvas.create_polygon(
-                    corners, outline="black", fill="lightgray", activefill="gray", width=1
-                )
-                self.board[r_idx][c_idx]["polygon_id"] = poly_id
-                
-                def make_left_handler(r, c):
-                    def handler(event):
-                        self.focus_set()
-                        self.on_left_click(r, c)
-                    return handler
-                
-                hex_left_click_handler = make_left_handler(r_idx, c_idx)
-                hex_right_click_handler = lambda event, r=r_idx, c=c_idx: self.on_right_click(r, c)
-                
-                self.canvas.tag_bind(poly_id, "<Button-1>", hex_left_click_handler)
-                self.canvas.tag_bind(poly_id, "<Button-3>", hex_right_click_handler)
-                self.canvas.tag_bind(poly_id, "<Button-2>", hex_right_click_handler)
-                self.canvas.tag_bind(poly_id, "<Control-Button-1>", hex_right_click_handler)
-    
-    def place_hex_mines(self, safe_r, safe_c):
-        all_coords = [(r, c) for r in range(self.rows) for c in range(self.cols)]
-        safe_zone = set([(safe_r, safe_c)])
-        for nr, nc in self.get_hex_neighbors(safe_r, safe_c):
-            safe_zone.add((nr, nc))
-        possible_mine_coords = [coord for coord in all_coords if coord not in safe_zone]
-        random.shuffle(possible_mine_coords)
-        
-        actual_mines_to_place = min(self.initial_mines_count, len(possible_mine_coords))
-        if actual_mines_to_place < 0:
-            actual_mines_to_place = 0
-        
-        # Reset all cells to not be mines first
-        for r_loop in range(self.rows):
-            for c_loop in range(self.cols):
-                self.board[r_loop][c_loop]["is_mine"] = False
-                
-        for i in range(actual_mines_to_place):
-            r_mine, c_mine = possible_mine_coords[i]
-            self.board[r_mine][c_mine]["is_mine"] = True
-        self.mines_count = actual_mines_to_place
-
-    def calculate_adjacencies(self):
-        for r_loop in range(self.rows):
-            for c_loop in range(self.cols):
-                if not self.board[r_loop][c_loop]["is_mine"]:
-                    self.board[r_loop][c_loop]["adj_mines"] = self.count_adj_hex_mines(r_loop, c_loop)
-
-    def get_hex_neighbors(self, r, c): 
-        neighbors = []
-        if r % 2 == 1:  # Odd rows
-            potential_offsets = [(0, -1), (0, 1), (-1, 0), (-1, 1), (1, 0), (1, 1)]
-        else:  # Even rows
-            potential_offsets = [(0, -1), (0, 1), (-1, -1), (-1, 0), (1, -1), (1, 0)]
-        for dr, dc in potential_offsets:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < self.rows and 0 <= nc < self.cols:
-                neighbors.append((nr, nc))
-        return neighbors
-
-    def count_adj_hex_mines(self, r, c): 
-        count = 0
-        for nr, nc in self.get_hex_neighbors(r,c):
-            if self.board[nr][nc]["is_mine"]:
-                count += 1
-        return count
+        for idx, (center_x, center_y) in enumerate(self.centers):
+            corners = self.get_hex_corners(center_x, center_y)
+            self.polygon_ids[idx] = self.canvas.create_polygon(
+                corners, outline="black", fill="lightgray", activefill="gray", width=1, tags="hex"
+            )
+
+        # One set of bindings for the whole canvas; cell_at finds the hex.
+        self.canvas.bind("<Button-1>", self.on_canvas_left_click)
+        self.canvas.bind("<Button-3>", self.on_canvas_right_click)
+        self.canvas.bind("<Button-2>", self.on_canvas_right_click)
+        self.canvas.bind("<Control-Button-1>", self.on_canvas_right_click)
+
+    def cell_at(self, x, y):
+        """
+        Exact hit test: returns the (r, c) of the hex containing canvas pixel
+        (x, y), or None outside the grid. The pixel is converted to fractional
+        axial coordinates, rounded in cube space and mapped back to the
+        odd-row offset layout used by get_hex_center.
+        """
+        px = self.canvas.canvasx(x) - self.canvas_padding_x
+        py = self.canvas.canvasy(y) - self.canvas_padding_y
+        q = (SQRT3 / 3 * px - py / 3) / self.R
+        r = (2 / 3 * py) / self.R
+        s = -q - r
+
+        rq, rr, rs = round(q), round(r), round(s)
+        dq, dr, ds = abs(rq - q), abs(rr - r), abs(rs - s)
+        if dq > dr and dq > ds:
+            rq = -rr - rs
+        elif dr > ds:
+            rr = -rq - rs
+
+        row = rr
+        col = rq + (rr - (rr & 1)) // 2
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def on_canvas_left_click(self, event):
+        self.focus_set()
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_left_click(*cell)
+
+    def on_canvas_right_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_right_click(*cell)
+        return "break"
 
     def on_left_click(self, r, c):
+        self.latency.click("left")
         if self.m_key_pressed:
             self.on_right_click(r, c)
             return
-        
-        cell_data = self.board[r][c]
-        if self.is_game_over or cell_data["is_revealed"]:
+
+        model = self.model
+        idx = model.index(r, c)
+        if self.is_game_over or model.revealed[idx]:
             return
-        if cell_data["is_flagged"]:
+        if model.flagged[idx]:
             return
 
         if not self.first_click_done:
             self.first_click_done = True
-            self.place_hex_mines(r,c) 
-            self.calculate_adjacencies()
-            flagged_count = sum(item["is_flagged"] for row in self.board for item in row)
-            self.mine_label.config(text=f"Mines: {self.mines_count - flagged_count}")
+            with self.latency.model("place"):
+                if self.no_guess:
+                    result = generate_no_guess(model, r, c, rng=self.seed)
+                    self.mines_count = model.mines_count
+                else:
+                    self.mines_count = model.place_mines(r, c, rng=self.seed)
+            if self.no_guess and not result.solved:
+                messagebox.showinfo("No Guessing", "Could not find a guess-free layout in time; this board may need a guess.")
+            self.board_id = format_board_id("hexagon", self.cols, self.rows, self.initial_mines_count, r, c, self.seed, self.no_guess)
+            self.board_id_label.config(text=f"Board: {self.board_id}")
+            self.mine_label.config(text=f"Mines: {model.mines_left()}")
             self.start_time = time.time()
+            self.recorder.start(self.start_time)
             self.update_timer()
-        
-        if cell_data["is_mine"]:
-            self.reveal_hex_mine(r, c, exploded=True)
-            self.game_over(False)
-        else:
-            self.flood_fill_hex(r, c)
-            if self.check_win():
-                self.game_over(True)
+
+        self.recorder.record(REVEAL, idx)
+        self.flood_fill_hex(r, c)
 
     def on_right_click(self, r, c):
-        if self.is_game_over or self.board[r][c]["is_revealed"]:
+        self.latency.click("right")
+        if self.is_game_over:
+            return
+        with self.latency.model("flag"):
+            is_flagged = self.model.toggle_flag(r, c)
+        if is_flagged is None:
             return
-        cell = self.board[r][c]
-        cell["is_flagged"] = not cell["is_flagged"]
 
-        if cell["text_id"]:
-            self.canvas.delete(cell["text_id"])
-            cell["text_id"] = None
-        
-        if cell["is_flagged"]:
-            self.canvas.itemconfig(cell["polygon_id"], fill="pink")
+        idx = self.model.index(r, c)
+        self.recorder.record(FLAG, idx)
+        if self.text_ids[idx]:
+            self.canvas.delete(self.text_ids[idx])
+            self.text_ids[idx] = None
+
+        if is_flagged:
+            self.canvas.itemconfig(self.polygon_ids[idx], fill="pink")
             cx, cy = self.get_hex_center(r, c)
-            cell["text_id"] = self.canvas.create_text(cx, cy, text="F", fill="red", font=("Arial", int(self.R*0.6), "bold"))
+            self.text_ids[idx] = self.canvas.create_text(cx, cy, text="F", fill="red", font=("Arial", int(self.R*0.6), "bold"))
         else:
-            self.canvas.itemconfig(cell["polygon_id"], fill="lightgray")
-        
+            self.canvas.itemconfig(self.polygon_ids[idx], fill="lightgray")
+            self.update_hints()
+
         if self.first_click_done:
-            flagged_count = sum(item["is_flagged"] for row in self.board for item in row)
-            mines_left = self.mines_count - flagged_count
-            self.mine_label.config(text=f"Mines: {mines_left}")
-        
+            self.mine_label.config(text=f"Mines: {self.model.mines_left()}")
+
     def flood_fill_hex(self, r, c):
-        stack = [(r, c)]
-        visited = set()
-        while stack:
-            rr, cc = stack.pop()
-            if (rr, cc) in visited or self.board[rr][cc]["is_revealed"] or self.board[rr][cc]["is_flagged"]:
+        model = self.model
+        with self.latency.model("reveal"):
+            changed = model.reveal(r, c)
+        self.redraws.push(idx for idx in changed if not model.mines[idx])
+
+        if model.exploded is not None:
+            self.reveal_hex_mine(*model.coords(model.exploded), exploded=True)
+            self.game_over(False)
+        elif changed and self.check_win():
+            self.game_over(True)
+        elif changed:
+            self.update_hints()
+
+    def toggle_hints(self):
+        if self.is_game_over:
+            return
+        self.hints_on = not self.hints_on
+        self.hint_button.config(relief="sunken" if self.hints_on else "raised")
+        if self.hints_on:
+            self.update_hints()
+        else:
+            self.clear_hints()
+
+    def update_hints(self):
+        """Colours every unrevealed, unflagged hex by its exact mine probability."""
+        if not self.hints_on:
+            return
+        with self.latency.model():
+            if self.probabilities is None:
+                self.probabilities = ProbabilityMap(self.model)
+            probabilities = self.probabilities.compute()
+        flagged = self.model.flagged
+        for idx, probability in probabilities.items():
+            if flagged[idx]:
                 continue
-            visited.add((rr, cc))
-            cell = self.board[rr][cc]
-            cell["is_revealed"] = True
-
-            if cell["text_id"]:
-                self.canvas.delete(cell["text_id"])
-                cell["text_id"] = None
-            self.canvas.itemconfig(cell["polygon_id"], fill="white", activefill="white")
-
-            adj = cell["adj_mines"]
-            if adj > 0:
-                cx, cy = self.get_hex_center(rr, cc)
-                colors = ["", "blue", "green", "red", "darkblue", "maroon", "teal", "black", "gray"]
-                text_color = colors[adj] if 0 < adj < len(colors) else "black"
-                cell["text_id"] = self.canvas.create_text(cx, cy, text=str(adj), fill=text_color, font=("Arial", int(self.R*0.7), "bold"))
-
-            self.canvas.tag_unbind(cell["polygon_id"], "<Button-1>")
-            self.canvas.tag_unbind(cell["polygon_id"], "<Button-3>")
-            self.canvas.tag_unbind(cell["polygon_id"], "<Button-2>")
-            self.canvas.tag_unbind(cell["polygon_id"], "<Control-Button-1>")
-
-            if adj == 0:
-                for nr, nc in self.get_hex_neighbors(rr, cc):
-                    neighbor = self.board[nr][nc]
-                    if not neighbor["is_revealed"] and not neighbor["is_mine"] and not neighbor["is_flagged"]:
-                        stack.append((nr, nc))
-                        
+            fill = probability_color(probability) if probability is not None else "lightgray"
+            self.canvas.itemconfig(self.polygon_ids[idx], fill=fill)
+
+    def clear_hints(self):
+        model = self.model
+        for idx, poly_id in enumerate(self.polygon_ids):
+            if not model.revealed[idx] and not model.flagged[idx]:
+                self.canvas.itemconfig(poly_id, fill="lightgray")
+
+    def draw_revealed_hex(self, idx):
+        model = self.model
+        colors = ["", "blue", "green", "red", "darkblue", "maroon", "teal", "black", "gray"]
+        poly_id = self.polygon_ids[idx]
+        if self.text_ids[idx]:
+            self.canvas.delete(self.text_ids[idx])
+            self.text_ids[idx] = None
+        self.canvas.itemconfig(poly_id, fill="white", activefill="white")
+
+        adj = model.counts[idx]
+        if adj > 0:
+            cx, cy = self.get_hex_center(*model.coords(idx))
+            text_color = colors[adj] if 0 < adj < len(colors) else "black"
+            self.text_ids[idx] = self.canvas.create_text(cx, cy, text=str(adj), fill=text_color, font=("Arial", int(self.R*0.7), "bold"))
+
     def reveal_hex_mine(self, r, c, exploded=False):
-        cell = self.board[r][c]
-        cell["is_revealed"] = True
-        if cell["text_id"]:
-            self.canvas.delete(cell["text_id"])
-            cell["text_id"] = None
-        
+        idx = self.model.index(r, c)
+        self.model.revealed[idx] = 1
+        poly_id = self.polygon_ids[idx]
+        if self.text_ids[idx]:
+            self.canvas.delete(self.text_ids[idx])
+            self.text_ids[idx] = None
+
         fill_color = "red" if exploded else "darkgrey"
-        self.canvas.itemconfig(cell["polygon_id"], fill=fill_color, activefill=fill_color)
+        self.canvas.itemconfig(poly_id, fill=fill_color, activefill=fill_color)
         cx, cy = self.get_hex_center(r, c)
-        cell["text_id"] = self.canvas.create_text(cx, cy, text="*", fill="white" if exploded else "black", font=("Arial", int(self.R*0.8), "bold"))
-        self.canvas.tag_unbind(cell["polygon_id"], "<Button-1>")
-        self.canvas.tag_unbind(cell["polygon_id"], "<Button-3>")
-        self.canvas.tag_unbind(cell["polygon_id"], "<Button-2>")
-        self.canvas.tag_unbind(cell["polygon_id"], "<Control-Button-1>")
+        self.text_ids[idx] = self.canvas.create_text(cx, cy, text="*", fill="white" if exploded else "black", font=("Arial", int(self.R*0.8), "bold"))
 
     def check_win(self):
-        for row_board in self.board:
-            for cell_item in row_board:
-                if not cell_item["is_mine"] and not cell_item["is_revealed"]:
-                    return False
-        return True
+        with self.latency.model():
+            return self.model.is_won()
 
     def game_over(self, won):
+        self.redraws.flush()
+        self.latency.finish()  # before the dialogs, which would otherwise count as paint time
+        if self.hints_on:
+            self.hints_on = False
+            self.clear_hints()
         self.is_game_over = True
         if self.timer_id:
             self.after_cancel(self.timer_id)
         elapsed = time.time() - self.start_time if self.start_time else 0
+        model = self.model
+        save_replay(self.recorder, self.board_id, won, elapsed,
+                    mines=[idx for idx in range(model.size) if model.mines[idx]] if self.no_guess else None)
 
-        for r_idx in range(self.rows):
-            for c_idx in range(self.cols):
-                cell = self.board[r_idx][c_idx]
-                self.canvas.tag_unbind(cell["polygon_id"], "<Button-1>")
-                self.canvas.tag_unbind(cell["polygon_id"], "<Button-3>")
-                self.canvas.tag_unbind(cell["polygon_id"], "<Button-2>")
-                self.canvas.tag_unbind(cell["polygon_id"], "<Control-Button-1>")
-                current_fill = self.canvas.itemcget(cell["polygon_id"], "fill")
-                self.canvas.itemconfig(cell["polygon_id"], activefill=current_fill)
+        # An empty activefill turns the hover highlight off for every hex at once.
+        self.canvas.itemconfig("hex", activefill="")
 
         if won:
-            for r_idx in range(self.rows):
-                for c_idx in range(self.cols):
-                    cell = self.board[r_idx][c_idx]
-                    if cell["is_mine"] and not cell["is_flagged"]:
-                        if cell["text_id"]:
-                            self.canvas.delete(cell["text_id"])
-                            cell["text_id"] = None
-                        cx, cy = self.get_hex_center(r_idx, c_idx)
-                        self.canvas.itemconfig(cell["polygon_id"], fill="palegreen") 
-                        cell["text_id"] = self.canvas.create_text(cx, cy, text="F", fill="green", font=("Arial", int(self.R*0.6), "bold"))
+            for idx in range(model.size):
+                if model.mines[idx] and not model.flagged[idx]:
+                    if self.text_ids[idx]:
+                        self.canvas.delete(self.text_ids[idx])
+                        self.text_ids[idx] = None
+                    cx, cy = self.get_hex_center(*model.coords(idx))
+                    self.canvas.itemconfig(self.polygon_ids[idx], fill="palegreen")
+                    self.text_ids[idx] = self.canvas.create_text(cx, cy, text="F", fill="green", font=("Arial", int(self.R*0.6), "bold"))
             messagebox.showinfo("You Win!", f"You cleared the hex board in {format_time(elapsed)}!")
-            if self.difficulty == "Random":
-                update_leaderboard("hexagon", "Random", elapsed, width=self.cols, height=self.rows, mines=self.mines_count)
-            else:
-                update_leaderboard("hexagon", self.difficulty, elapsed)
-        else: 
-            for r_idx in range(self.rows):
-                for c_idx in range(self.cols):
-                    cell = self.board[r_idx][c_idx]
-                    if cell["is_mine"] and not cell["is_revealed"]:
-                        if not cell["is_flagged"]:
-                            self.reveal_hex_mine(r_idx, c_idx, exploded=False)
-                    elif not cell["is_mine"] and cell["is_flagged"]:
-                        if cell["text_id"]:
-                            self.canvas.delete(cell["text_id"])
-                            cell["text_id"] = None
-                        cx, cy = self.get_hex_center(r_idx, c_idx)
-                        self.canvas.itemconfig(cell["polygon_id"], fill="lightcoral")
-                        cell["text_id"] = self.canvas.create_text(cx, cy, text="X", fill="black", font=("Arial", int(self.R*0.6)))
+            update_leaderboard("hexagon", self.difficulty, elapsed, width=self.cols, height=self.rows, mines=self.mines_count, board_id=self.board_id)
+        else:
+            for idx in range(model.size):
+                if model.mines[idx] and not model.revealed[idx]:
+                    if not model.flagged[idx]:
+                        self.reveal_hex_mine(*model.coords(idx), exploded=False)
+                elif not model.mines[idx] and model.flagged[idx]:
+                    if self.text_ids[idx]:
+                        self.canvas.delete(self.text_ids[idx])
+                        self.text_ids[idx] = None
+                    cx, cy = self.get_hex_center(*model.coords(idx))
+                    self.canvas.itemconfig(self.polygon_ids[idx], fill="lightcoral")
+                    self.text_ids[idx] = self.canvas.create_text(cx, cy, text="X", fill="black", font=("Arial", int(self.R*0.6)))
             messagebox.showinfo("Game Over", "You hit a mine in Hex Mode!")
 
     def update_timer(self):
@@ -2,6 +2,14 @@ import tkinter as tk
 import random
 from tkinter import messagebox
 from .hex_game import HexGameBoard
+from logic.board_id import parse_board_id
+
+# (rows, cols, mines)
+HEX_PRESETS = {
+    "Beginner": (8, 8, 10),
+    "Intermediate": (12, 12, 25),
+    "Expert": (16, 16, 60),
+}
 
 class HexMenu(tk.Frame):
     def __init__(self, parent, controller):
@@ -11,21 +19,27 @@ class HexMenu(tk.Frame):
         label = tk.Label(self, text="Hex Mode", font=("Arial", 18, "bold"), bg=self.cget('bg'))
         label.pack(pady=10)
 
-        tk.Button(
-            self, text="Beginner (8x8, 10 mines)",
-            command=lambda: self.start_hex_game(8, 8, 10, "Beginner")
-        ).pack(pady=5)
-        tk.Button(
-            self, text="Intermediate (12x12, 25 mines)",
-            command=lambda: self.start_hex_game(12, 12, 25, "Intermediate")
-        ).pack(pady=5)
-        tk.Button(
-            self, text="Expert (16x16, 60 mines)",
-            command=lambda: self.start_hex_game(16, 16, 60, "Expert")
-        ).pack(pady=5)
+        for difficulty, (rows, cols, m) in HEX_PRESETS.items():
+            tk.Button(
+                self, text=f"{difficulty} ({rows}x{cols}, {m} mines)",
+                command=lambda rows=rows, cols=cols, m=m, d=difficulty: self.start_hex_game(rows, cols, m, d)
+            ).pack(pady=5)
         tk.Button(
             self, text="Random", command=self.start_random_hex_game
         ).pack(pady=5)
+
+        self.no_guess_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            self, text="No guessing", variable=self.no_guess_var, bg=self.cget('bg')
+        ).pack(pady=5)
+
+        board_id_frame = tk.Frame(self, bg=self.cget('bg'))
+        board_id_frame.pack(pady=5)
+        tk.Label(board_id_frame, text="Board ID:", bg=board_id_frame.cget('bg')).pack(side="left", padx=5)
+        self.board_id_entry = tk.Entry(board_id_frame, width=26)
+        self.board_id_entry.pack(side="left", padx=5)
+        tk.Button(board_id_frame, text="Play", command=self.start_from_board_id).pack(side="left", padx=5)
+
         tk.Button(
             self, text="View Hex Leaderboard",
             command=lambda: controller.show_frame("HexLeaderboardDisplay")
@@ -35,7 +49,19 @@ class HexMenu(tk.Frame):
         ).pack(pady=20)
 
     def start_hex_game(self, rows, cols, mines, difficulty):
-        HexGameBoard(self.controller, rows, cols, mines, difficulty)
+        HexGameBoard(self.controller, rows, cols, mines, difficulty, no_guess=self.no_guess_var.get())
+
+    def start_from_board_id(self):
+        try:
+            board_id = parse_board_id(self.board_id_entry.get(), expected_mode="hexagon", max_side=20)
+        except ValueError as e:
+            messagebox.showerror("Invalid Board ID", str(e))
+            return
+        config = (board_id.height, board_id.width, board_id.mines)
+        difficulty = next((d for d, preset in HEX_PRESETS.items() if preset == config), "Random")
+        HexGameBoard(self.controller, *config, difficulty,
+                     seed=board_id.seed, first_click=(board_id.first_r, board_id.first_c),
+                     no_guess=board_id.no_guess)
 
     def start_random_hex_game(self):
         rows = random.randint(6, 20)
@@ -63,4 +89,4 @@ class HexMenu(tk.Frame):
         if m < 0:
             m = 0
 
-        HexGameBoard(self.controller, rows, cols, m, "Random")
\ No newline at end of file
+        HexGameBoard(self.controller, rows, cols, m, "Random", no_guess=self.no_guess_var.get())
\ No newline at end of file
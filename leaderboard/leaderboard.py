@@ -1,9 +1,17 @@
+import atexit
+import bisect
 import json
 import os
+import shutil
+import tempfile
 from tkinter import simpledialog
 
 LEADERBOARD_FILE = os.path.join(os.path.dirname(__file__), "leaderboard_data.json")
 
+# Set to a database path to keep every completed game in SQLite instead of
+# only the top scores in LEADERBOARD_FILE (which is imported on first run).
+LEADERBOARD_DB = os.environ.get("MINESWEEPER_LEADERBOARD_DB")
+
 # This is the absolute minimal structure if the file is missing or totally corrupt.
 # The game will populate it as scores are added.
 MINIMAL_EMPTY_LEADERBOARD_STRUCTURE = {
@@ -24,16 +32,28 @@ MINIMAL_EMPTY_LEADERBOARD_STRUCTURE = {
   }
 }
 
-def load_leaderboard():
-    if os.path.exists(LEADERBOARD_FILE):
+TOP_N = 10
+JOURNAL_SYNC_EVERY = 8  # journal lines appended between fsyncs
+COMPACT_EVERY = 64      # journal lines before they are folded into the snapshot
+
+
+def _empty_leaderboard():
+    return json.loads(json.dumps(MINIMAL_EMPTY_LEADERBOARD_STRUCTURE))  # deep copy
+
+def _read_leaderboard(path):
+    """
+    Reads and validates a leaderboard file. Returns a fresh empty structure
+    if it is missing, empty, corrupted or shaped unexpectedly.
+    """
+    if os.path.exists(path):
         try:
-            with open(LEADERBOARD_FILE, "r") as f:
+            with open(path, "r") as f:
                 # Handle empty file case
                 content = f.read()
                 if not content.strip():
-                    print(f"Warning: Leaderboard file '{LEADERBOARD_FILE}' is empty. Initializing with empty structure.")
-                    return json.loads(json.dumps(MINIMAL_EMPTY_LEADERBOARD_STRUCTURE)) # Return a deep copy
-                
+                    print(f"Warning: Leaderboard file '{path}' is empty. Initializing with empty structure.")
+                    return _empty_leaderboard()
+
                 data = json.loads(content) # Use loads on content read
 
                 # Basic validation: ensure top-level keys and their expected types (dict/list) exist.
@@ -50,31 +70,260 @@ def load_leaderboard():
                                 break
                     if not valid_structure:
                         break
-                
+
                 if not valid_structure:
-                    print(f"Warning: Leaderboard file '{LEADERBOARD_FILE}' has an unexpected structure. Initializing with empty structure.")
-                    return json.loads(json.dumps(MINIMAL_EMPTY_LEADERBOARD_STRUCTURE))
-                
+                    print(f"Warning: Leaderboard file '{path}' has an unexpected structure. Initializing with empty structure.")
+                    return _empty_leaderboard()
+
                 return data
         except (json.JSONDecodeError, TypeError) as e: # Catch TypeError for unexpected data types
-            print(f"Warning: Leaderboard file '{LEADERBOARD_FILE}' is corrupted or malformed ({e}). Initializing with empty structure.")
+            print(f"Warning: Leaderboard file '{path}' is corrupted or malformed ({e}). Initializing with empty structure.")
+            # Keep the damaged file around; the next save would overwrite it.
+            try:
+                shutil.copyfile(path, path + ".corrupt")
+            except OSError:
+                pass
             # Fall through to return a copy of the minimal empty data
-            
+
     # If file doesn't exist or any error above, return a deep copy of the minimal empty structure
-    return json.loads(json.dumps(MINIMAL_EMPTY_LEADERBOARD_STRUCTURE))
+    return _empty_leaderboard()
+
+
+def _time_key(entry):
+    return (entry.get("time", float('inf')),)
+
+
+def _proportion_key(entry):
+    return (-entry.get("proportion", 0), entry.get("time", float('inf')))
+
+
+def _percentage_key(entry):
+    return (-entry.get("mine_percentage", 0), entry.get("time", float('inf')))
+
+
+def _sort_key_for(mode, difficulty, records):
+    if mode == "custom_mode":
+        return _percentage_key
+    if difficulty == "Random" and any("proportion" in e for e in records):
+        return _proportion_key
+    return _time_key
+
+
+class LeaderboardStore:
+    """
+    In-memory leaderboard backed by a JSON snapshot plus an append-only
+    journal of the results added since.
+
+    A new result is one JSONL line appended to the journal (flushed at once,
+    fsync'd every JOURNAL_SYNC_EVERY lines), so saving a score no longer
+    rewrites the whole document. After COMPACT_EVERY lines the journal is
+    folded into the snapshot, which is written to a temporary file that
+    then replaces the real one, and the journal is emptied. Loading reads
+    the snapshot and replays the journal on top of it; a torn last line
+    from a crash is skipped, and entries already in the snapshot (a crash
+    between writing it and emptying the journal) are not added twice.
+
+    Both files are read once and again only when their modification time
+    or size changes (e.g. edited by hand). Each (mode, difficulty) list is
+    kept sorted alongside a parallel list of sort keys, so checking whether
+    a result qualifies is a bisect.
+    """
+    def __init__(self, path=LEADERBOARD_FILE):
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + ".journal"
+        self.data = None
+        self.keys = {}  # (mode, difficulty) -> (key function, sorted sort keys parallel to the records)
+        self.stamp = None
+        self.journal = None       # open append handle
+        self.journal_lines = 0    # lines not yet folded into the snapshot
+        self.unsynced = 0         # lines written since the last fsync
+
+    def _file_stamp(self):
+        stamps = []
+        for path in (self.path, self.journal_path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                stamps.append(None)
+                continue
+            stamps.append((st.st_mtime_ns, st.st_size))
+        return tuple(stamps)
+
+    def invalidate(self):
+        """Forgets the cached data; the next access reads the files again."""
+        self.data = None
+
+    def load(self):
+        """Returns the cached leaderboard dict, reloading it if either file changed."""
+        stamp = self._file_stamp()
+        if self.data is None or stamp != self.stamp:
+            self.data = _read_leaderboard(self.path)
+            self.keys = {}
+            self.journal_lines = self._replay()
+            self.stamp = stamp
+        return self.data
+
+    def _replay(self):
+        try:
+            with open(self.journal_path, "r") as f:
+                lines = f.readlines()
+        except OSError:
+            return 0
+        for line in lines:
+            try:
+                item = json.loads(line)
+                mode, difficulty, entry = item["mode"], item["difficulty"], item["entry"]
+            except (ValueError, KeyError, TypeError):
+                print(f"Warning: Skipping unreadable line in '{self.journal_path}'.")
+                continue
+            if entry not in self.records(mode, difficulty):
+                self._insert(mode, difficulty, entry, _sort_key_for(mode, difficulty, [entry]))
+        return len(lines)
+
+    def records(self, mode, difficulty):
+        data = self.data if self.data is not None else self.load()
+        current_mode_data = data.setdefault(mode, _empty_leaderboard().get(mode, {}))
+        return current_mode_data.setdefault(difficulty, [])
+
+    def _category(self, mode, difficulty, key_func):
+        records = self.records(mode, difficulty)
+        cached_func, keys = self.keys.get((mode, difficulty), (None, None))
+        if cached_func is not key_func or len(keys) != len(records):
+            records.sort(key=key_func)
+            keys = [key_func(e) for e in records]
+            self.keys[(mode, difficulty)] = (key_func, keys)
+        return records, keys
+
+    def _insert(self, mode, difficulty, entry, key_func, limit=TOP_N):
+        records, keys = self._category(mode, difficulty, key_func)
+        key = key_func(entry)
+        pos = bisect.bisect_right(keys, key)
+        keys.insert(pos, key)
+        records.insert(pos, entry)
+        del keys[limit:]
+        del records[limit:]
+
+    def qualifies(self, mode, difficulty, key, key_func, limit=TOP_N):
+        """True if an entry with sort key `key` would make the top `limit`."""
+        self.load()
+        records, keys = self._category(mode, difficulty, key_func)
+        return bisect.bisect_right(keys, key) < limit
+
+    def add(self, mode, difficulty, entry, key_func, limit=TOP_N, game=None):
+        """Inserts `entry` in order, keeps the top `limit` and journals it."""
+        self.load()
+        self._insert(mode, difficulty, entry, key_func, limit)
+        try:
+            self._append({"mode": mode, "difficulty": difficulty, "entry": entry})
+        except OSError as e:
+            print(f"Error writing leaderboard journal: {e}")
+            self.save()
+            return
+        if self.journal_lines >= COMPACT_EVERY:
+            self.save()
+
+    def record(self, mode, difficulty, entry, game=None):
+        """Games that miss the top `limit` are not kept in the JSON file."""
+        return
+
+    def page(self, mode, difficulty, offset, limit):
+        """Up to `limit` entries of a category in rank order, starting at `offset`."""
+        self.load()
+        records, _ = self._category(mode, difficulty, _sort_key_for(mode, difficulty, self.records(mode, difficulty)))
+        return records[offset:offset + limit]
+
+    def _append(self, item):
+        if self.journal is None:
+            self.journal = open(self.journal_path, "a")
+        self.journal.write(json.dumps(item, separators=(",", ":")) + "\n")
+        self.journal.flush()
+        self.journal_lines += 1
+        self.unsynced += 1
+        if self.unsynced >= JOURNAL_SYNC_EVERY:
+            self.sync()
+        self.stamp = self._file_stamp()
+
+    def sync(self):
+        """Forces journal lines written so far to disk."""
+        if self.journal is not None and self.unsynced:
+            os.fsync(self.journal.fileno())
+        self.unsynced = 0
+
+    def close(self):
+        if self.journal is not None:
+            self.sync()
+            self.journal.close()
+            self.journal = None
+
+    def save(self, data=None):
+        """Writes the snapshot atomically and empties the journal it now contains."""
+        if data is not None:
+            self.data = data
+        self.keys = {}  # entries may have been edited in place since the keys were taken
+        try:
+            # Ensure the 'leaderboard' directory exists
+            leaderboard_dir = os.path.dirname(self.path)
+            if not os.path.exists(leaderboard_dir) and leaderboard_dir: # Check if leaderboard_dir is not empty string
+                os.makedirs(leaderboard_dir)
+
+            fd, tmp_path = tempfile.mkstemp(dir=leaderboard_dir or ".", prefix=".leaderboard-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(self.data, f, separators=(",", ":"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            self.close()
+            with open(self.journal_path, "w") as f:
+                os.fsync(f.fileno())
+            self.journal_lines = 0
+            self.stamp = self._file_stamp()
+        except Exception as e:
+            print(f"Error saving leaderboard: {e}")
+
+
+def _make_store():
+    if LEADERBOARD_DB:
+        from leaderboard.sqlite_store import SQLiteLeaderboardStore
+        categories = {mode: list(mode_data) for mode, mode_data in MINIMAL_EMPTY_LEADERBOARD_STRUCTURE.items()}
+        return SQLiteLeaderboardStore(LEADERBOARD_DB, TOP_N, categories,
+                                      legacy=lambda: LeaderboardStore(LEADERBOARD_FILE).load())
+    return LeaderboardStore()
+
+
+_store = _make_store()
+atexit.register(lambda: _store.close())
+
+
+def get_store():
+    return _store
+
+
+def load_leaderboard():
+    """
+    Returns the leaderboard as a dict. Served from the shared store's cache;
+    the per-category lists are copies, so callers may modify them freely.
+    """
+    data = _store.load()
+    return {mode: ({difficulty: list(records) for difficulty, records in mode_data.items()}
+                   if isinstance(mode_data, dict) else mode_data)
+            for mode, mode_data in data.items()}
 
 
 def save_leaderboard(data):
-    try:
-        # Ensure the 'leaderboard' directory exists
-        leaderboard_dir = os.path.dirname(LEADERBOARD_FILE)
-        if not os.path.exists(leaderboard_dir) and leaderboard_dir: # Check if leaderboard_dir is not empty string
-            os.makedirs(leaderboard_dir)
-            
-        with open(LEADERBOARD_FILE, "w") as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        print(f"Error saving leaderboard: {e}")
+    _store.save(data)
+
+
+def leaderboard_page(mode, difficulty, offset=0, limit=TOP_N):
+    """
+    Up to `limit` ranked entries of one category starting at `offset`. With
+    the SQLite backend this pages through the whole history, not just the top.
+    """
+    return _store.page(mode, difficulty, offset, limit)
 
 def _get_player_name(title="New High Score!"):
     name = simpledialog.askstring(title, "You made the leaderboard! Enter your name:")
@@ -83,15 +332,7 @@ def _get_player_name(title="New High Score!"):
     name = name.strip()
     return name if name else "Player"
 
-def update_leaderboard(mode, difficulty, time_value, width=None, height=None, mines=None):
-    data = load_leaderboard()
-    
-    # Ensure the path to the records list exists, creating if necessary
-    # This uses the minimal structure as a reference for keys if they are missing entirely
-    current_mode_data = data.setdefault(mode, MINIMAL_EMPTY_LEADERBOARD_STRUCTURE[mode])
-    records = current_mode_data.setdefault(difficulty, MINIMAL_EMPTY_LEADERBOARD_STRUCTURE[mode][difficulty])
-
-
+def update_leaderboard(mode, difficulty, time_value, width=None, height=None, mines=None, board_id=None):
     new_entry_data = {"time": time_value}
     is_random_proportional = difficulty == "Random" and all(v is not None for v in [width, height, mines])
 
@@ -100,65 +341,47 @@ def update_leaderboard(mode, difficulty, time_value, width=None, height=None, mi
         total_tiles = width * height
         new_entry_data["proportion"] = mines / total_tiles if total_tiles > 0 else 0
         current_config = f"{width}x{height}, {mines}m"
-        sort_key = lambda e: (-e.get("proportion", 0), e.get("time", float('inf')))
-        if len(records) >= 10:
-            temp_records = sorted(list(records), key=sort_key) # Sort a copy
-            last_prop = temp_records[-1].get("proportion", 0)
-            last_time = temp_records[-1].get("time", float('inf'))
-            if new_entry_data["proportion"] < last_prop or \
-               (new_entry_data["proportion"] == last_prop and new_entry_data["time"] >= last_time):
-                return 
+        key_func = _proportion_key
     else:
-        sort_key = lambda e: e.get("time", float('inf'))
-        if len(records) >= 10:
-            temp_records = sorted(list(records), key=sort_key) # Sort a copy
-            if time_value >= temp_records[-1].get("time", float('inf')):
-                return
+        key_func = _time_key
+
+    game = {"width": width, "height": height, "mines": mines}
+    if not _store.qualifies(mode, difficulty, key_func(new_entry_data), key_func):
+        _store.record(mode, difficulty, {**new_entry_data, "board_id": board_id}, game)
+        return
 
     name = _get_player_name()
     if name is None:
+        _store.record(mode, difficulty, {**new_entry_data, "board_id": board_id}, game)
         return 
 
     new_entry = {"name": name, **new_entry_data}
     if is_random_proportional or difficulty == "Random": 
         new_entry["config"] = current_config
+    if board_id:
+        new_entry["board_id"] = board_id
+    _store.add(mode, difficulty, new_entry, key_func, game=game)
 
-    records.append(new_entry)
-    records.sort(key=sort_key)
-    data[mode][difficulty] = records[:10] # Assign back to the original data structure
-    save_leaderboard(data)
-
-def update_custom_leaderboard(width, height, mines, time_value):
-    data = load_leaderboard()
-    
-    # Ensure the path to custom_mode records exists
-    custom_mode_data = data.setdefault("custom_mode", MINIMAL_EMPTY_LEADERBOARD_STRUCTURE["custom_mode"])
-    records = custom_mode_data.setdefault("records", MINIMAL_EMPTY_LEADERBOARD_STRUCTURE["custom_mode"]["records"])
-
-
+def update_custom_leaderboard(width, height, mines, time_value, board_id=None):
     total_tiles = width * height
     mine_percentage = mines / total_tiles if total_tiles > 0 else 0
-    
     current_config = f"{width}x{height}, {mines}m ({mine_percentage*100:.1f}%)"
-    sort_key = lambda e: (-e.get("mine_percentage",0), e.get("time", float('inf')))
-
-    if len(records) >= 10:
-        temp_records = sorted(list(records), key=sort_key) # Sort a copy
-        last_perc = temp_records[-1].get("mine_percentage",0)
-        last_time = temp_records[-1].get("time", float('inf'))
-        if mine_percentage < last_perc or \
-           (mine_percentage == last_perc and time_value >= last_time):
-            return
+
+    new_entry = {
+        "mine_percentage": mine_percentage, "time": time_value,
+        "config": current_config
+    }
+    game = {"width": width, "height": height, "mines": mines}
+    if not _store.qualifies("custom_mode", "records", _percentage_key(new_entry), _percentage_key):
+        _store.record("custom_mode", "records", {**new_entry, "board_id": board_id}, game)
+        return
 
     name = _get_player_name("Custom Mode Leaderboard")
     if name is None:
+        _store.record("custom_mode", "records", {**new_entry, "board_id": board_id}, game)
         return
 
-    new_entry = {
-        "name": name, "mine_percentage": mine_percentage, "time": time_value,
-        "config": current_config
-    }
-    records.append(new_entry)
-    records.sort(key=sort_key)
-    data["custom_mode"]["records"] = records[:10] # Assign back
-    save_leaderboard(data)
\ No newline at end of file
+    new_entry = {"name": name, **new_entry}
+    if board_id:
+        new_entry["board_id"] = board_id
+    _store.add("custom_mode", "records", new_entry, _percentage_key, game=game)
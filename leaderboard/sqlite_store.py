@@ -0,0 +1,241 @@
+import re
+import sqlite3
+import time
+
+from logic.board_id import parse_board_id
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT,
+    mode TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    mines INTEGER,
+    density REAL,
+    time REAL NOT NULL,
+    seed INTEGER,
+    board_id TEXT,
+    played_at REAL
+);
+CREATE INDEX IF NOT EXISTS games_by_time ON games (mode, difficulty, time);
+CREATE INDEX IF NOT EXISTS games_by_density ON games (mode, difficulty, density DESC, time);
+CREATE INDEX IF NOT EXISTS games_by_player ON games (player, mode, difficulty, time);
+CREATE TABLE IF NOT EXISTS totals (
+    mode TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    PRIMARY KEY (mode, difficulty)
+);
+CREATE TRIGGER IF NOT EXISTS count_game AFTER INSERT ON games BEGIN
+    INSERT INTO totals VALUES (NEW.mode, NEW.difficulty, 1)
+        ON CONFLICT (mode, difficulty) DO UPDATE SET games = games + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS uncount_game AFTER DELETE ON games BEGIN
+    UPDATE totals SET games = games - 1 WHERE mode = OLD.mode AND difficulty = OLD.difficulty;
+END;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Categories ranked by density (then time) rather than by time alone.
+_DENSITY_RANKED = {("classic", "Random"), ("hexagon", "Random"), ("custom_mode", "records")}
+
+_CONFIG_RE = re.compile(r"^(\d+)x(\d+), (\d+)m")
+
+
+def _order(mode, difficulty):
+    return "density DESC, time" if (mode, difficulty) in _DENSITY_RANKED else "time"
+
+
+def _dimensions(entry):
+    """(width, height, mines, seed) recovered from a JSON entry's board ID or config text."""
+    if entry.get("board_id"):
+        try:
+            board = parse_board_id(entry["board_id"])
+            return board.width, board.height, board.mines, board.seed
+        except ValueError:
+            pass
+    match = _CONFIG_RE.match(entry.get("config", ""))
+    if match:
+        width, height, mines = map(int, match.groups())
+        return width, height, mines, None
+    return None, None, None, None
+
+
+class SQLiteLeaderboardStore:
+    """
+    Leaderboard backed by an SQLite database that keeps every completed
+    game, not only the top TOP_N per category.
+
+    It has the same interface as LeaderboardStore, so load_leaderboard()
+    and the update functions work unchanged: load() rebuilds the usual
+    dict from top-N queries. On first use the JSON leaderboard returned by
+    `legacy` is imported. The indexes serve top-N (by time, or by density
+    then time for Random and custom), per-player best and percentile
+    queries from index ranges; per-category game counts are kept by a
+    trigger so a percentile only counts the games slower than the result.
+    """
+    def __init__(self, path, top_n, categories, legacy=None):
+        self.path = path
+        self.top_n = top_n
+        self.categories = categories  # {mode: [difficulty, ...]} always present in load()
+        self.data = None
+        self.version = None
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        if legacy is not None and self._meta("migrated") is None:
+            with self.conn:
+                self._import(legacy())
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('migrated', ?)", (str(time.time()),))
+
+    def _meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _import(self, data, skip_stored=False):
+        """Inserts the entries of a leaderboard dict; with `skip_stored`, not those already in the history."""
+        rows = []
+        for mode, mode_data in data.items():
+            if not isinstance(mode_data, dict):
+                continue
+            for difficulty, records in mode_data.items():
+                for entry in records:
+                    width, height, mines, seed = _dimensions(entry)
+                    density = entry.get("proportion", entry.get("mine_percentage"))
+                    if density is None and width:
+                        density = mines / (width * height)
+                    row = (entry.get("name"), mode, difficulty, width, height, mines, density,
+                           entry.get("time", float('inf')), seed, entry.get("board_id"), None)
+                    if skip_stored and self._stored(row[0], mode, difficulty, row[7], row[9]):
+                        continue
+                    rows.append(row)
+        self.conn.executemany("INSERT INTO games (player, mode, difficulty, width, height, mines, density, "
+                              "time, seed, board_id, played_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _stored(self, player, mode, difficulty, time_value, board_id):
+        return self.conn.execute(
+            "SELECT 1 FROM games WHERE mode = ? AND difficulty = ? AND time = ? AND player IS ? AND board_id IS ? LIMIT 1",
+            (mode, difficulty, time_value, player, board_id)).fetchone() is not None
+
+    def _insert(self, player, mode, difficulty, entry, game):
+        width, height, mines = (game or {}).get("width"), (game or {}).get("height"), (game or {}).get("mines")
+        density = mines / (width * height) if width and height and mines is not None else None
+        seed = None
+        if entry.get("board_id"):
+            try:
+                seed = parse_board_id(entry["board_id"]).seed
+            except ValueError:
+                pass
+        with self.conn:
+            self.conn.execute("INSERT INTO games (player, mode, difficulty, width, height, mines, density, "
+                              "time, seed, board_id, played_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                              (player, mode, difficulty, width, height, mines, density, entry["time"],
+                               seed, entry.get("board_id"), time.time()))
+        self.data = None
+
+    # LeaderboardStore interface
+
+    def invalidate(self):
+        self.data = None
+
+    def load(self):
+        """The leaderboard dict, rebuilt when this or another connection changed the database."""
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if self.data is None or version != self.version:
+            data = {mode: {difficulty: [] for difficulty in difficulties}
+                    for mode, difficulties in self.categories.items()}
+            for mode, difficulty in self.conn.execute("SELECT mode, difficulty FROM totals WHERE games > 0"):
+                data.setdefault(mode, {})[difficulty] = self.top(mode, difficulty)
+            self.data, self.version = data, version
+        return self.data
+
+    def qualifies(self, mode, difficulty, key, key_func, limit=None):
+        """True if a result with sort key `key` would make the top `limit` (ties rank below)."""
+        limit = limit or self.top_n
+        if len(key) == 1:
+            where, args = "time <= ?", key
+        else:
+            density, time_value = -key[0], key[1]
+            where, args = "(density > ? OR (density = ? AND time <= ?))", (density, density, time_value)
+        sql = (f"SELECT COUNT(*) FROM (SELECT 1 FROM games WHERE mode = ? AND difficulty = ? "
+               f"AND player IS NOT NULL AND {where} LIMIT ?)")
+        return self.conn.execute(sql, (mode, difficulty, *args, limit)).fetchone()[0] < limit
+
+    def add(self, mode, difficulty, entry, key_func, limit=None, game=None):
+        self._insert(entry["name"], mode, difficulty, entry, game)
+
+    def record(self, mode, difficulty, entry, game=None):
+        """
+        Keeps a game that did not make the leaderboard (or whose name prompt
+        was cancelled) in the history, unnamed so it never ranks.
+        """
+        self._insert(None, mode, difficulty, entry, game)
+
+    def save(self, data=None):
+        """
+        Adds the entries of a leaderboard dict that are not in the history
+        yet (same name, category, time and board ID), so saving a loaded
+        and edited leaderboard does not store it twice.
+        """
+        if data is not None:
+            with self.conn:
+                self._import(data, skip_stored=True)
+            self.data = None
+
+    def page(self, mode, difficulty, offset, limit):
+        return self.top(mode, difficulty, limit, offset)
+
+    # History queries
+
+    def top(self, mode, difficulty, limit=None, offset=0):
+        """The best `limit` named results of a category (after skipping `offset`), as leaderboard entries."""
+        rows = self.conn.execute(
+            f"SELECT player, width, height, mines, density, time, board_id FROM games "
+            f"WHERE mode = ? AND difficulty = ? AND player IS NOT NULL "
+            f"ORDER BY {_order(mode, difficulty)} LIMIT ? OFFSET ?", (mode, difficulty, limit or self.top_n, offset))
+        entries = []
+        for player, width, height, mines, density, time_value, board_id in rows:
+            entry = {"name": player, "time": time_value}
+            config = f"{width}x{height}, {mines}m" if width else "N/A"
+            if mode == "custom_mode":
+                entry = {"name": player, "mine_percentage": density or 0, "time": time_value,
+                         "config": f"{config} ({(density or 0)*100:.1f}%)"}
+            elif difficulty == "Random":
+                if density is not None:
+                    entry["proportion"] = density
+                entry["config"] = config
+            if board_id:
+                entry["board_id"] = board_id
+            entries.append(entry)
+        return entries
+
+    def best(self, player, mode, difficulty):
+        """A player's fastest time in a category, or None."""
+        row = self.conn.execute("SELECT MIN(time) FROM games WHERE player = ? AND mode = ? AND difficulty = ?",
+                                (player, mode, difficulty)).fetchone()
+        return row[0]
+
+    def percentile(self, mode, difficulty, time_value):
+        """Percentage of recorded games in a category that were slower than `time_value`."""
+        row = self.conn.execute("SELECT games FROM totals WHERE mode = ? AND difficulty = ?",
+                                (mode, difficulty)).fetchone()
+        if not row or not row[0]:
+            return None
+        total = row[0]
+        # Walk the index on whichever side of `time_value` is likely shorter,
+        # judged by the midpoint of the category's fastest and slowest times.
+        where = "mode = ? AND difficulty = ?"
+        fastest = self.conn.execute(f"SELECT MIN(time) FROM games WHERE {where}", (mode, difficulty)).fetchone()[0]
+        slowest = self.conn.execute(f"SELECT MAX(time) FROM games WHERE {where}", (mode, difficulty)).fetchone()[0]
+        if time_value <= (fastest + slowest) / 2:
+            faster = self.conn.execute(f"SELECT COUNT(*) FROM games WHERE {where} AND time <= ?",
+                                       (mode, difficulty, time_value)).fetchone()[0]
+            slower = total - faster
+        else:
+            slower = self.conn.execute(f"SELECT COUNT(*) FROM games WHERE {where} AND time > ?",
+                                       (mode, difficulty, time_value)).fetchone()[0]
+        return 100.0 * slower / total
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,172 @@
+from logic.generation import place_mines_in_array, count_adjacent_mines_for
+from logic.topology import SQUARE, HEX, Topology, get_topology
+
+# Boards up to TABLE_EAGER_CELLS build their shape's neighbour table on the
+# first flood fill (a few ms at most). Bigger ones expand that many
+# zero-count cells with per-cell lookups first, so placing mines and the
+# small openings of most clicks never pay for a table of the whole board.
+TABLE_EAGER_CELLS = 128 * 128
+TABLE_AFTER_CELLS = 4096
+
+
+class Board:
+    """
+    Tk-free Minesweeper game state.
+
+    Cells are addressed by a flat index (r * width + c) and every per-cell
+    property lives in its own bytearray, so a board costs a few bytes per cell
+    and can be driven without a window (simulations, solvers, tests).
+    `topology` is a logic.topology name (SQUARE, HEX, TORUS) or Topology;
+    neighbour lookups go through it, using its shared flat neighbour table
+    once a large flood fill has built it.
+    """
+    def __init__(self, width, height, mines, topology=SQUARE):
+        if not isinstance(topology, Topology):
+            topology = get_topology(topology, width, height)
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.topology = topology
+        self.initial_mines_count = mines
+        self.mines_count = mines
+
+        self.mines = bytearray(self.size)
+        self.counts = bytearray(self.size)
+        self.revealed = bytearray(self.size)
+        self.flagged = bytearray(self.size)
+
+        # Running totals kept up to date by reveal/toggle_flag so that the
+        # win check and the mine counter never need to scan the board.
+        self.revealed_safe_count = 0
+        self.flags_placed = 0
+
+        self.mines_placed = False
+        self.exploded = None
+
+    def index(self, r, c):
+        return r * self.width + c
+
+    def coords(self, idx):
+        return divmod(idx, self.width)
+
+    def neighbor_table(self):
+        """The shared (starts, neighbors) CSR table for this board's shape."""
+        return self.topology.neighbor_table()
+
+    def neighbors(self, idx):
+        return self.topology.neighbors(idx)
+
+    def place_mines(self, safe_r, safe_c, rng=None):
+        """
+        Places mines so that (safe_r, safe_c) and its neighbors are safe,
+        then fills in the adjacency counts. Returns the number of mines placed.
+        `rng` is passed to logic.generation.resolve_rng (seed or random.Random).
+        """
+        safe_idx = self.index(safe_r, safe_c)
+        safe_zone = set(self.neighbors(safe_idx))
+        safe_zone.add(safe_idx)
+
+        self.mines = bytearray(self.size)
+        self.mines_count = place_mines_in_array(self.mines, self.initial_mines_count, safe_zone, rng)
+        self.counts = count_adjacent_mines_for(self.mines, self.topology)
+        self.mines_placed = True
+        return self.mines_count
+
+    def move_mine(self, src, dst):
+        """
+        Moves a mine from flat index `src` to the empty cell `dst`,
+        adjusting the adjacency counts around both.
+        """
+        counts = self.counts
+        self.mines[src] = 0
+        for n in self.neighbors(src):
+            counts[n] -= 1
+        self.mines[dst] = 1
+        for n in self.neighbors(dst):
+            counts[n] += 1
+
+    def reveal(self, r, c):
+        """
+        Reveals (r, c), flood filling through zero-count cells.
+        Returns the list of newly revealed indices. Revealing a mine sets
+        `exploded` to its index.
+        """
+        start = self.index(r, c)
+        revealed, flagged, mines, counts = self.revealed, self.flagged, self.mines, self.counts
+        if revealed[start] or flagged[start]:
+            return []
+        if mines[start]:
+            revealed[start] = 1
+            self.exploded = start
+            return [start]
+
+        topology = self.topology
+        if topology.has_table() or self.size <= TABLE_EAGER_CELLS:
+            starts, neighbors = topology.neighbor_table()
+        else:
+            starts = neighbors = None
+        expanded = 0
+        changed = []
+        stack = [start]
+        while stack:
+            idx = stack.pop()
+            if revealed[idx] or flagged[idx]:
+                continue
+            revealed[idx] = 1
+            changed.append(idx)
+            if counts[idx] == 0:
+                if starts is not None:
+                    adjacent = neighbors[starts[idx]:starts[idx + 1]]
+                else:
+                    adjacent = topology.neighbors_of(idx)
+                    expanded += 1
+                    if expanded == TABLE_AFTER_CELLS:
+                        starts, neighbors = topology.neighbor_table()
+                for n in adjacent:
+                    if not revealed[n] and not mines[n] and not flagged[n]:
+                        stack.append(n)
+        self.revealed_safe_count += len(changed)
+        return changed
+
+    def toggle_flag(self, r, c):
+        """
+        Flags or unflags an unrevealed cell. Returns the new flag state,
+        or None if the cell is already revealed.
+        """
+        idx = self.index(r, c)
+        if self.revealed[idx]:
+            return None
+        self.flagged[idx] ^= 1
+        if self.flagged[idx]:
+            self.flags_placed += 1
+            return True
+        self.flags_placed -= 1
+        return False
+
+    def chord(self, r, c):
+        """
+        Reveals every unflagged neighbor of a revealed number whose flag count
+        matches it. Returns the list of newly revealed indices.
+        """
+        idx = self.index(r, c)
+        if not self.revealed[idx] or self.mines[idx] or self.counts[idx] == 0:
+            return []
+        neighbors = self.neighbors(idx)
+        if sum(self.flagged[n] for n in neighbors) != self.counts[idx]:
+            return []
+        changed = []
+        for n in neighbors:
+            nr, nc = divmod(n, self.width)
+            changed.extend(self.reveal(nr, nc))
+        return changed
+
+    def flagged_count(self):
+        return self.flags_placed
+
+    def mines_left(self):
+        return self.mines_count - self.flags_placed
+
+    def is_won(self):
+        if not self.mines_placed or self.exploded is not None:
+            return False
+        return self.revealed_safe_count == self.size - self.mines_count
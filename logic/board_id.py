@@ -0,0 +1,49 @@
+import random
+import re
+from collections import namedtuple
+
+# A board ID fully determines a layout: mode, dimensions, requested mine count,
+# first-click cell and the seed fed to the generator, e.g. "C-30x16-99-7.12-9f3a61c2".
+# Boards from the no-guess generator carry a trailing "-ng".
+BoardId = namedtuple("BoardId", ["mode", "width", "height", "mines", "first_r", "first_c", "seed", "no_guess"],
+                     defaults=[False])
+
+MODE_CODES = {"classic": "C", "custom": "U", "hexagon": "H"}
+_CODE_MODES = {code: mode for mode, code in MODE_CODES.items()}
+
+_BOARD_ID_RE = re.compile(r"^([A-Z])-(\d+)x(\d+)-(\d+)-(\d+)\.(\d+)-([0-9A-F]+)(-NG)?$", re.IGNORECASE)
+
+
+def new_seed():
+    return random.SystemRandom().getrandbits(32)
+
+
+def format_board_id(mode, width, height, mines, first_r, first_c, seed, no_guess=False):
+    suffix = "-ng" if no_guess else ""
+    return f"{MODE_CODES[mode]}-{width}x{height}-{mines}-{first_r}.{first_c}-{seed:08x}{suffix}"
+
+
+def parse_board_id(text, expected_mode=None, max_side=None):
+    """
+    Parses a board ID string into a BoardId.
+    Raises ValueError if it is malformed, belongs to a different mode or
+    describes a board the caller cannot open (sides above `max_side`).
+    """
+    match = _BOARD_ID_RE.match(text.strip())
+    if not match or match.group(1).upper() not in _CODE_MODES:
+        raise ValueError(f"'{text.strip()}' is not a valid board ID.")
+    code, w, h, m, r, c, seed, no_guess = match.groups()
+    board_id = BoardId(_CODE_MODES[code.upper()], int(w), int(h), int(m), int(r), int(c), int(seed, 16),
+                       no_guess is not None)
+
+    if expected_mode is not None and board_id.mode != expected_mode:
+        raise ValueError(f"Board ID is for {board_id.mode} mode, not {expected_mode}.")
+    if board_id.width <= 0 or board_id.height <= 0:
+        raise ValueError("Board dimensions cannot be zero.")
+    if max_side is not None and (board_id.width > max_side or board_id.height > max_side):
+        raise ValueError(f"Board sides must be at most {max_side} in {board_id.mode} mode.")
+    if board_id.mines >= board_id.width * board_id.height:
+        raise ValueError("Board ID has more mines than cells.")
+    if not (0 <= board_id.first_r < board_id.height and 0 <= board_id.first_c < board_id.width):
+        raise ValueError("First click lies outside the board.")
+    return board_id
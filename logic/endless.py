@@ -0,0 +1,244 @@
+import random
+from collections import OrderedDict, namedtuple
+
+from logic.generation import count_adjacent_mines_grid, place_mines_in_array
+
+CHUNK = 32                # cells per side of a chunk
+DEFAULT_DENSITY = 0.16
+LIVE_CHUNK_LIMIT = 256    # live chunks kept before far, resolved ones are compacted
+EVICT_DISTANCE = 4        # chunks closer than this to the last click stay live
+LAYOUT_CACHE_SIZE = 1024  # mine layouts kept around for counting (they can be regenerated)
+MAX_FLOOD = 200000        # cells one click may reveal; the rest stays for later clicks
+
+_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+# A fully resolved chunk (every safe cell revealed) only needs its flags to
+# be rebuilt: mines come from the seed and every other cell is revealed.
+ChunkSummary = namedtuple("ChunkSummary", ["flagged"])
+
+
+class Chunk:
+    __slots__ = ("mines", "counts", "revealed", "flagged", "safe_left")
+
+    def __init__(self, mines, counts):
+        self.mines = mines
+        self.counts = counts
+        self.revealed = bytearray(CHUNK * CHUNK)
+        self.flagged = bytearray(CHUNK * CHUNK)
+        self.safe_left = CHUNK * CHUNK - sum(mines)
+
+
+class EndlessBoard:
+    """
+    Unbounded square board for the endless mode, addressed by (r, c) in any
+    direction.
+
+    The board is split into CHUNK x CHUNK chunks. A chunk's mines come from a
+    random.Random seeded with (seed, chunk row, chunk column), so any chunk
+    can be generated on demand, in any order, and always comes out the same.
+    A chunk becomes live (with counts and play state) the first time the
+    player's reveals reach it; counting its border cells needs the mine
+    layouts of the eight chunks around it, which are generated but not made
+    live. Once there are more than LIVE_CHUNK_LIMIT live chunks, fully
+    resolved ones far from the last click are replaced by a ChunkSummary,
+    so memory is bounded by the unresolved frontier rather than by how far
+    the player has travelled.
+    """
+    def __init__(self, seed, density=DEFAULT_DENSITY):
+        self.seed = seed
+        self.density = density
+        self.mines_per_chunk = max(1, round(density * CHUNK * CHUNK))
+        self.safe_zone = None
+        self.chunks = {}              # (chunk row, chunk col) -> Chunk
+        self.summaries = {}           # (chunk row, chunk col) -> ChunkSummary
+        self.layouts = OrderedDict()  # (chunk row, chunk col) -> mine bytearray, LRU
+        self.revealed_count = 0
+        self.flags_placed = 0
+        self.exploded = None
+        self.focus = (0, 0)
+
+    @staticmethod
+    def chunk_key(r, c):
+        return r // CHUNK, c // CHUNK
+
+    @staticmethod
+    def local_index(r, c):
+        return (r % CHUNK) * CHUNK + c % CHUNK
+
+    def start(self, safe_r, safe_c):
+        """Fixes the first click; its cell and neighbors never hold mines."""
+        self.safe_zone = {(safe_r + dr, safe_c + dc) for dr, dc in _OFFSETS}
+        self.safe_zone.add((safe_r, safe_c))
+
+    # Generation
+
+    def layout(self, key):
+        """The mine bytearray of a chunk, generated from the seed if needed."""
+        mines = self.layouts.get(key)
+        if mines is not None:
+            self.layouts.move_to_end(key)
+            return mines
+        cr, cc = key
+        safe_local = {self.local_index(r, c) for r, c in self.safe_zone
+                      if self.chunk_key(r, c) == key}
+        mines = bytearray(CHUNK * CHUNK)
+        place_mines_in_array(mines, self.mines_per_chunk, safe_local, random.Random(f"{self.seed}:{cr}:{cc}"))
+        self.layouts[key] = mines
+        if len(self.layouts) > LAYOUT_CACHE_SIZE:
+            self.layouts.popitem(last=False)
+        return mines
+
+    def chunk(self, key):
+        """
+        The live Chunk for `key`, materialising it (or rebuilding it from its
+        summary) on first use.
+        """
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            return chunk
+        cr, cc = key
+        # Count on a (CHUNK + 2)-wide grid whose border comes from the
+        # neighbouring chunks' layouts, then keep the inner CHUNK x CHUNK.
+        side = CHUNK + 2
+        padded = bytearray(side * side)
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                mines = self.layout((cr + dr, cc + dc))
+                rows = range(CHUNK - 1, CHUNK) if dr < 0 else range(0, 1) if dr > 0 else range(CHUNK)
+                cols = range(CHUNK - 1, CHUNK) if dc < 0 else range(0, 1) if dc > 0 else range(CHUNK)
+                for lr in rows:
+                    pr = lr - (CHUNK - 1) if dr < 0 else lr + CHUNK + 1 if dr > 0 else lr + 1
+                    for lc in cols:
+                        pc = lc - (CHUNK - 1) if dc < 0 else lc + CHUNK + 1 if dc > 0 else lc + 1
+                        padded[pr * side + pc] = mines[lr * CHUNK + lc]
+        padded_counts = count_adjacent_mines_grid(padded, side, side)
+        counts = bytearray()
+        for lr in range(CHUNK):
+            start = (lr + 1) * side + 1
+            counts += padded_counts[start:start + CHUNK]
+
+        chunk = Chunk(self.layout(key), counts)
+        summary = self.summaries.pop(key, None)
+        if summary is not None:
+            for i in range(CHUNK * CHUNK):
+                chunk.revealed[i] = not chunk.mines[i]
+            for i in summary.flagged:
+                chunk.flagged[i] = 1
+            chunk.safe_left = 0
+        self.chunks[key] = chunk
+        return chunk
+
+    def compact(self):
+        """Replaces far, fully resolved live chunks by summaries."""
+        if len(self.chunks) <= LIVE_CHUNK_LIMIT:
+            return 0
+        fr, fc = self.focus
+        compacted = 0
+        for key, chunk in list(self.chunks.items()):
+            if chunk.safe_left or max(abs(key[0] - fr), abs(key[1] - fc)) < EVICT_DISTANCE:
+                continue
+            self.summaries[key] = ChunkSummary(frozenset(i for i, f in enumerate(chunk.flagged) if f))
+            del self.chunks[key]
+            compacted += 1
+        return compacted
+
+    # Queries used for drawing; they never create chunks or rebuild summarised ones.
+
+    def cell_state(self, r, c):
+        """
+        Returns (revealed, flagged, mine, count) for a cell that has been
+        reached, or None for a cell whose chunk the player has not touched.
+        Cells of summarised chunks are answered from the summary and the
+        (cached, regenerable) mine layouts, so panning across old territory
+        keeps them compacted.
+        """
+        key = self.chunk_key(r, c)
+        i = self.local_index(r, c)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            return chunk.revealed[i], chunk.flagged[i], chunk.mines[i], chunk.counts[i]
+        summary = self.summaries.get(key)
+        if summary is None:
+            return None
+        mine = self.layout(key)[i]
+        count = sum(self.is_mine(r + dr, c + dc) for dr, dc in _OFFSETS)
+        return int(not mine), int(i in summary.flagged), mine, count
+
+    def is_mine(self, r, c):
+        return self.layout(self.chunk_key(r, c))[self.local_index(r, c)]
+
+    # Play
+
+    def reveal(self, r, c):
+        """
+        Reveals (r, c), flood filling through zero-count cells across chunks.
+        Returns the list of newly revealed (r, c) cells; revealing a mine sets
+        `exploded`. At most MAX_FLOOD cells are revealed per call.
+        """
+        if self.safe_zone is None:
+            self.start(r, c)
+        self.focus = self.chunk_key(r, c)
+        chunk = self.chunk(self.focus)
+        i = self.local_index(r, c)
+        if chunk.revealed[i] or chunk.flagged[i]:
+            return []
+        if chunk.mines[i]:
+            chunk.revealed[i] = 1
+            self.exploded = (r, c)
+            return [(r, c)]
+
+        changed = []
+        stack = [(r, c)]
+        while stack and len(changed) < MAX_FLOOD:
+            r, c = stack.pop()
+            chunk = self.chunk(self.chunk_key(r, c))
+            i = self.local_index(r, c)
+            if chunk.revealed[i] or chunk.flagged[i] or chunk.mines[i]:
+                continue
+            chunk.revealed[i] = 1
+            chunk.safe_left -= 1
+            changed.append((r, c))
+            if chunk.counts[i] == 0:
+                stack.extend((r + dr, c + dc) for dr, dc in _OFFSETS)
+        self.revealed_count += len(changed)
+        self.compact()
+        return changed
+
+    def toggle_flag(self, r, c):
+        """
+        Flags or unflags an unrevealed cell. Returns the new flag state, or
+        None if the cell is revealed or the game has not started yet.
+        """
+        if self.safe_zone is None:
+            return None
+        chunk = self.chunk(self.chunk_key(r, c))
+        i = self.local_index(r, c)
+        if chunk.revealed[i]:
+            return None
+        chunk.flagged[i] ^= 1
+        self.flags_placed += 1 if chunk.flagged[i] else -1
+        return bool(chunk.flagged[i])
+
+    def chord(self, r, c):
+        """
+        Reveals every unflagged neighbor of a revealed number whose flag count
+        matches it. Returns the list of newly revealed cells.
+        """
+        state = self.cell_state(r, c)
+        if state is None:
+            return []
+        revealed, _, mine, count = state
+        if not revealed or mine or count == 0:
+            return []
+        neighbors = [(r + dr, c + dc) for dr, dc in _OFFSETS]
+        flags = 0
+        for nr, nc in neighbors:
+            flags += self.chunk(self.chunk_key(nr, nc)).flagged[self.local_index(nr, nc)]
+        if flags != count:
+            return []
+        changed = []
+        for nr, nc in neighbors:
+            changed.extend(self.reveal(nr, nc))
+            if self.exploded is not None:
+                break
+        return changed
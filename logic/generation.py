@@ -1,6 +1,66 @@
 import random
+from operator import add
 
-def place_mines_safely(board, width, height, mines_count, safe_r, safe_c):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path below is used instead
+    np = None
+
+from logic.topology import SQUARE, HEX
+
+
+def resolve_rng(rng=None):
+    """
+    Returns a random.Random for `rng`, which may be None (fresh OS-seeded
+    generator), an int/str seed, or an existing random.Random instance.
+    """
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
+
+
+def sample_mine_indices(size, mines_count, safe_zone=(), rng=None):
+    """
+    Picks up to `mines_count` distinct indices in range(size) that are not in
+    `safe_zone`, without materialising the list of candidate cells.
+    Sparse requests use Floyd's algorithm, so the work is proportional to the
+    mine count; dense ones sample the (smaller) set of safe cells instead.
+    """
+    rng = resolve_rng(rng)
+    excluded = sorted(i for i in set(safe_zone) if 0 <= i < size)
+    available = size - len(excluded)
+    k = max(0, min(mines_count, available))
+
+    if k * 2 <= available:
+        ranks = _floyd_sample(available, k, rng)
+    else:
+        skipped = _floyd_sample(available, available - k, rng)
+        ranks = [j for j in range(available) if j not in skipped]
+
+    if not excluded:
+        return list(ranks)
+    # Map the j-th allowed cell back to its board index by stepping over
+    # the (few, sorted) excluded indices.
+    indices = []
+    for idx in ranks:
+        for e in excluded:
+            if e <= idx:
+                idx += 1
+            else:
+                break
+        indices.append(idx)
+    return indices
+
+
+def _floyd_sample(n, k, rng):
+    chosen = set()
+    for j in range(n - k, n):
+        t = rng.randrange(j + 1)
+        chosen.add(j if t in chosen else t)
+    return chosen
+
+
+def place_mines_safely(board, width, height, mines_count, safe_r, safe_c, rng=None):
     """
     Randomly places `mines_count` mines on the board,
     ensuring (safe_r, safe_c) and its direct neighbors are NOT mines.
@@ -8,31 +68,19 @@ def place_mines_safely(board, width, height, mines_count, safe_r, safe_c):
     mines_count if the board is too small for the requested number of mines
     plus the safe area.
     """
-    safe_zone = set([(safe_r, safe_c)])
+    safe_zone = set()
     for dr in range(-1, 2):
         for dc in range(-1, 2):
             nr, nc = safe_r + dr, safe_c + dc
             if 0 <= nr < height and 0 <= nc < width:
-                safe_zone.add((nr, nc))
-    
-    possible_mine_coords = []
-    for r in range(height):
-        for c in range(width):
-            if (r, c) not in safe_zone:
-                possible_mine_coords.append((r, c))
+                safe_zone.add(nr * width + nc)
 
-    random.shuffle(possible_mine_coords)
-    
-    actual_mines_to_place = min(mines_count, len(possible_mine_coords))
-    if actual_mines_to_place < 0:
-        actual_mines_to_place = 0
-
-
-    for i in range(actual_mines_to_place):
-        r_mine, c_mine = possible_mine_coords[i]
+    mine_indices = sample_mine_indices(width * height, mines_count, safe_zone, rng)
+    for idx in mine_indices:
+        r_mine, c_mine = divmod(idx, width)
         board[r_mine][c_mine]["is_mine"] = True
-    
-    return actual_mines_to_place
+
+    return len(mine_indices)
 
 
 def count_adjacent_mines(board, row, col):
@@ -46,4 +94,97 @@ def count_adjacent_mines(board, row, col):
             rr, cc = row + rr_offset, col + cc_offset
             if 0 <= rr < height and 0 <= cc < width and board[rr][cc]["is_mine"]:
                 count += 1
-    return count
\ No newline at end of file
+    return count
+
+def place_mines_in_array(mines, mines_count, safe_zone, rng=None):
+    """
+    Flat-array counterpart of `place_mines_safely`: sets mines[i] = 1 for
+    `mines_count` random indices outside the `safe_zone` set of indices.
+    Returns the actual number of mines placed.
+    """
+    mine_indices = sample_mine_indices(len(mines), mines_count, safe_zone, rng)
+    for idx in mine_indices:
+        mines[idx] = 1
+    return len(mine_indices)
+
+
+def count_adjacent_mines_grid(mines, width, height, topology=SQUARE):
+    """
+    Computes the adjacent-mine count of every cell in one pass.
+    `mines` is a flat 0/1 sequence indexed by r * width + c; the result is a
+    bytearray in the same layout. Counts are filled in for mine cells too.
+    `topology` is SQUARE (8 neighbors) or HEX (odd-row-offset, 6 neighbors).
+    """
+    if width <= 0 or height <= 0:
+        return bytearray(max(width * height, 0))
+    if np is not None:
+        return _count_grid_numpy(mines, width, height, topology)
+    return _count_grid_python(mines, width, height, topology)
+
+
+def count_adjacent_mines_for(mines, topology):
+    """
+    Adjacent-mine counts for a flat `mines` array on any logic.topology
+    Topology. Plain square and hex grids take the shifted-row fast path of
+    count_adjacent_mines_grid; other shapes (e.g. a torus) are counted from
+    the topology's neighbour table.
+    """
+    if topology.name in (SQUARE, HEX):
+        return count_adjacent_mines_grid(mines, topology.width, topology.height, topology.name)
+    return count_adjacent_mines_table(mines, *topology.neighbor_table())
+
+
+def count_adjacent_mines_table(mines, starts, neighbors):
+    # Each mine adds one to its neighbours, so the work is O(cells + 8 * mines).
+    counts = bytearray(len(mines))
+    for idx, is_mine in enumerate(mines):
+        if is_mine:
+            for n in neighbors[starts[idx]:starts[idx + 1]]:
+                counts[n] += 1
+    return counts
+
+
+def _count_grid_numpy(mines, width, height, topology):
+    grid = np.frombuffer(bytes(mines), dtype=np.uint8).reshape(height, width)
+    padded = np.pad(grid, 1)
+    h, w = height, width
+
+    left, right = padded[1:h+1, 0:w], padded[1:h+1, 2:w+2]
+    up_left, up, up_right = padded[0:h, 0:w], padded[0:h, 1:w+1], padded[0:h, 2:w+2]
+    down_left, down, down_right = padded[2:h+2, 0:w], padded[2:h+2, 1:w+1], padded[2:h+2, 2:w+2]
+
+    if topology == HEX:
+        even = left + right + up_left + up + down_left + down
+        odd = left + right + up + up_right + down + down_right
+        odd_rows = (np.arange(h) % 2 == 1)[:, None]
+        counts = np.where(odd_rows, odd, even)
+    else:
+        counts = left + right + up_left + up + up_right + down_left + down + down_right
+    return bytearray(counts.astype(np.uint8).tobytes())
+
+
+def _count_grid_python(mines, width, height, topology):
+    # Each row is summed with shifted copies of itself and of the rows above
+    # and below, so the per-cell work happens inside map()/bytes operations.
+    rows = [bytes(mines[r * width:(r + 1) * width]) for r in range(height)]
+    zero_row = [0] * width
+    prev = [b"\x00" + row[:-1] for row in rows]  # value at c is row[c - 1]
+    nxt = [row[1:] + b"\x00" for row in rows]    # value at c is row[c + 1]
+    same_row = [list(map(add, p, n)) for p, n in zip(prev, nxt)]
+
+    if topology == HEX:
+        pair_left = [list(map(add, p, row)) for p, row in zip(prev, rows)]
+        pair_right = [list(map(add, row, n)) for row, n in zip(rows, nxt)]
+    else:
+        triple = [list(map(add, s, row)) for s, row in zip(same_row, rows)]
+
+    counts = bytearray()
+    for r in range(height):
+        if topology == HEX:
+            vertical = pair_right if r % 2 == 1 else pair_left
+        else:
+            vertical = triple
+        above = vertical[r - 1] if r > 0 else zero_row
+        below = vertical[r + 1] if r < height - 1 else zero_row
+        counts.extend(map(add, same_row[r], map(add, above, below)))
+    return counts
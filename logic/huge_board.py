@@ -0,0 +1,365 @@
+from logic.generation import resolve_rng
+
+# Cells generated per step of place_mines; a multiple of 8 so every step
+# fills whole bytes of the bitset.
+GENERATION_CHUNK = 1 << 22
+
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+_INVERT = bytes(255 - i for i in range(256))
+_REVERSE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+_SQUARE_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def _new_bitset(size):
+    return bytearray((size + 7) // 8)
+
+
+def _popcount(bitset):
+    return sum(bitset.translate(_POPCOUNT))
+
+
+def _row(bitset, start, width):
+    """Cells start .. start + width - 1 of a bitset as an int, cell `start` in the top bit."""
+    first, last = start >> 3, (start + width + 7) >> 3
+    bits = int.from_bytes(bitset[first:last], "big")
+    return bits >> ((last << 3) - start - width) & ((1 << width) - 1)
+
+
+def _or_row(bitset, start, width, bits):
+    """Sets the cells of `bits` (laid out as _row returns them) in a bitset."""
+    first, last = start >> 3, (start + width + 7) >> 3
+    merged = int.from_bytes(bitset[first:last], "big") | bits << ((last << 3) - start - width)
+    bitset[first:last] = merged.to_bytes(last - first, "big")
+
+
+def _reverse_bits(bits, width):
+    n = (width + 7) >> 3
+    return int.from_bytes(bits.to_bytes(n, "little").translate(_REVERSE), "big") >> ((n << 3) - width)
+
+
+def _fill_upwards(passable, seeds):
+    # passable + (the lowest bit of each run) sets the bit just above every
+    # run; taking the seeds away from that borrows down to the lowest seed
+    # of each seeded run, however many seeds it holds.
+    ends = passable + (passable & ~(passable << 1))
+    return (ends - seeds) & passable | seeds
+
+
+def _fill_runs(passable, seeds, width):
+    """The runs of set bits of `passable` that contain a bit of `seeds` (a subset of it)."""
+    up = _fill_upwards(passable, seeds)
+    down = _fill_upwards(_reverse_bits(passable, width), _reverse_bits(seeds, width))
+    return up | _reverse_bits(down, width)
+
+
+def _bit_count(bits):
+    return _popcount(bits.to_bytes((bits.bit_length() + 7) >> 3, "big"))
+
+
+def _threshold_table(threshold):
+    # Maps byte values below `threshold` to "1" and the rest to "0".
+    return bytes.maketrans(bytes(range(256)), b"1" * threshold + b"0" * (256 - threshold))
+
+
+def _invert_bitset(bitset, size, excluded):
+    """Flips every bit of the first `size` cells except those in `excluded`, which end up clear."""
+    inverted = bitset.translate(_INVERT)
+    if size & 7:
+        inverted[-1] &= 0xFF << (8 - (size & 7)) & 0xFF  # cells past the end of the board
+    for idx in excluded:
+        inverted[idx >> 3] &= ~(0x80 >> (idx & 7))
+    return inverted
+
+
+def _sample_bitset(size, count, excluded, rng):
+    """
+    A bitset of `size` cells with exactly `count` set bits, none in
+    `excluded`, every such layout equally likely. Meant for count at most
+    half of the allowed cells.
+
+    Each cell is first set with probability floor(256 * density) / 256,
+    decided for a whole chunk at once: one random byte per cell is mapped
+    to b"0"/b"1" with bytes.translate and packed with int(..., 2).to_bytes.
+    Rounding the probability down means the exact count is then reached
+    mostly by setting uniformly random clear cells (and clearing a few
+    random set ones); with the density at most one half, each retry hits
+    a usable cell at least about half the time.
+    """
+    table = _threshold_table(count * 256 // size)
+    bitset = bytearray()
+    for start in range(0, size, GENERATION_CHUNK):
+        n = min(GENERATION_CHUNK, size - start)
+        padded = (n + 7) // 8 * 8
+        bits = int(rng.getrandbits(8 * padded).to_bytes(padded, "little").translate(table), 2)
+        if n != padded:
+            bits &= ~((1 << (padded - n)) - 1)  # cells past the end of the board
+        bitset += bits.to_bytes(padded // 8, "big")
+
+    for idx in excluded:
+        bitset[idx >> 3] &= ~(0x80 >> (idx & 7))
+    placed = _popcount(bitset)
+
+    while placed > count:
+        idx = rng.randrange(size)
+        if bitset[idx >> 3] & (0x80 >> (idx & 7)):
+            bitset[idx >> 3] &= ~(0x80 >> (idx & 7))
+            placed -= 1
+    while placed < count:
+        idx = rng.randrange(size)
+        if not bitset[idx >> 3] & (0x80 >> (idx & 7)) and idx not in excluded:
+            bitset[idx >> 3] |= 0x80 >> (idx & 7)
+            placed += 1
+    return bitset
+
+
+class RevealedArea:
+    """
+    Cells revealed by one HugeBoard move, kept as one int per row (column c
+    at bit width - 1 - c) rather than as a list of indices, so a fill over
+    millions of cells stays small. Iterating yields flat indices; `within`
+    yields only those in a window, e.g. the part of the board on screen.
+    """
+    def __init__(self, width):
+        self.width = width
+        self.rows = {}  # row -> bits
+        self.count = 0
+
+    def add(self, r, bits):
+        new = bits & ~self.rows.get(r, 0)
+        if new:
+            self.rows[r] = self.rows.get(r, 0) | new
+            self.count += _bit_count(new)
+
+    def update(self, other):
+        for r, bits in other.rows.items():
+            self.add(r, bits)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return self.within(0, 0, max(self.rows, default=-1) + 1, self.width)
+
+    def within(self, top, left, bottom, right):
+        """Flat indices of the cells in rows top .. bottom - 1, columns left .. right - 1."""
+        width = self.width
+        left, right = max(0, left), min(width, right)
+        if left >= right:
+            return
+        window = (1 << (right - left)) - 1
+        rows = self.rows
+        for r in range(max(0, top), min(bottom, max(rows, default=-1) + 1)):
+            bits = rows.get(r, 0) >> (width - right) & window
+            while bits:
+                high = bits.bit_length() - 1
+                yield r * width + right - 1 - high
+                bits ^= 1 << high
+
+
+class HugeBoard:
+    """
+    Square board for sizes up to 10,000 x 10,000, with the same game
+    interface as logic.board.Board (reveal, toggle_flag, chord, is_won...).
+
+    Mines, revealed and flagged cells are bitsets (one bit per cell, cell i
+    at byte i >> 3, bit 7 - (i & 7)), so the whole board costs three bits
+    per cell. Adjacency counts are not stored; `count` works them out from
+    the mine bitset when a cell is revealed or drawn.
+    """
+    def __init__(self, width, height, mines):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.initial_mines_count = mines
+        self.mines_count = mines
+
+        self.mines = _new_bitset(self.size)
+        self.revealed = _new_bitset(self.size)
+        self.flagged = _new_bitset(self.size)
+
+        self.revealed_safe_count = 0
+        self.flags_placed = 0
+        self.mines_placed = False
+        self.exploded = None
+
+    def index(self, r, c):
+        return r * self.width + c
+
+    def coords(self, idx):
+        return divmod(idx, self.width)
+
+    def is_mine(self, idx):
+        return self.mines[idx >> 3] >> (7 - (idx & 7)) & 1
+
+    def is_revealed(self, idx):
+        return self.revealed[idx >> 3] >> (7 - (idx & 7)) & 1
+
+    def is_flagged(self, idx):
+        return self.flagged[idx >> 3] >> (7 - (idx & 7)) & 1
+
+    def neighbors(self, idx):
+        r, c = divmod(idx, self.width)
+        width, height = self.width, self.height
+        return [(r + dr) * width + c + dc for dr, dc in _SQUARE_OFFSETS
+                if 0 <= r + dr < height and 0 <= c + dc < width]
+
+    def count(self, idx):
+        """Number of mines around flat index `idx`, computed from the bitset."""
+        mines = self.mines
+        total = 0
+        for n in self.neighbors(idx):
+            total += mines[n >> 3] >> (7 - (n & 7)) & 1
+        return total
+
+    def place_mines(self, safe_r, safe_c, rng=None):
+        """
+        Places exactly min(mines, cells outside the safe zone) mines so that
+        (safe_r, safe_c) and its neighbors are safe. Returns the number placed.
+
+        Above half density the cells left free are sampled instead and the
+        bitset inverted, so the sampling always works on the sparser side.
+        """
+        rng = resolve_rng(rng)
+        size = self.size
+        safe_idx = self.index(safe_r, safe_c)
+        safe_zone = set(self.neighbors(safe_idx))
+        safe_zone.add(safe_idx)
+        available = size - len(safe_zone)
+        target = max(0, min(self.initial_mines_count, available))
+
+        if target * 2 <= available:
+            self.mines = _sample_bitset(size, target, safe_zone, rng)
+        else:
+            self.mines = _invert_bitset(_sample_bitset(size, available - target, safe_zone, rng), size, safe_zone)
+
+        self.mines_count = target
+        self.mines_placed = True
+        return target
+
+    def reveal(self, r, c):
+        """
+        Reveals (r, c), flood filling through zero-count cells.
+        Returns a RevealedArea of the newly revealed cells. Revealing a mine
+        sets `exploded` to its index.
+
+        The fill works a row at a time on ints taken from the bitsets: the
+        zero-count cells of a row are those with no mine in the rows' mine
+        bits shifted by -1, 0 and +1, whole runs of them are filled at once
+        (see _fill_runs) and spread to the rows above and below. The cost
+        grows with the number of rows touched, not of cells.
+        """
+        start = self.index(r, c)
+        area = RevealedArea(self.width)
+        if self.is_revealed(start) or self.is_flagged(start):
+            return area
+        self.revealed[start >> 3] |= 0x80 >> (start & 7)
+        area.add(r, 1 << (self.width - 1 - c))
+        if self.is_mine(start):
+            self.exploded = start
+            return area
+        if self.count(start) == 0:
+            self._flood(r, c, area)
+        self.revealed_safe_count += area.count
+        return area
+
+    def _flood(self, r, c, area):
+        """Fills the zero-count region around (r, c) and reveals its border into `area`."""
+        width, height = self.width, self.height
+        mask = (1 << width) - 1
+        mines, revealed, flagged = self.mines, self.revealed, self.flagged
+        near_mines = {}  # row -> cells that are, or are beside, a mine in the row
+        hidden_cells = {}  # row -> cells neither revealed nor flagged (before this move)
+        passable = {}    # row -> zero-count hidden cells
+
+        def near(row):
+            if row not in near_mines:
+                if 0 <= row < height:
+                    m = _row(mines, row * width, width)
+                    near_mines[row] = (m | m << 1 | m >> 1) & mask
+                else:
+                    near_mines[row] = 0
+            return near_mines[row]
+
+        def hidden(row):
+            if row not in hidden_cells:
+                start = row * width
+                hidden_cells[row] = ~(_row(revealed, start, width) | _row(flagged, start, width)) & mask
+            return hidden_cells[row]
+
+        def zero(row):
+            if row not in passable:
+                passable[row] = ~(near(row - 1) | near(row) | near(row + 1)) & hidden(row)
+            return passable[row]
+
+        # The start cell was marked revealed above; it is still part of the fill.
+        hidden_cells[r] = hidden(r) | 1 << (width - 1 - c)
+        region = {}  # row -> zero-count cells filled so far
+        pending = {r: 1 << (width - 1 - c)}
+        stack = [r]
+        while stack:
+            row = stack.pop()
+            seeds = pending.pop(row)
+            filled = _fill_runs(zero(row), seeds, width)
+            new = filled & ~region.get(row, 0)
+            region[row] = region.get(row, 0) | new
+            spread = (new | new << 1 | new >> 1) & mask
+            for next_row in (row - 1, row + 1):
+                if not 0 <= next_row < height:
+                    continue
+                reached = spread & zero(next_row) & ~region.get(next_row, 0)
+                if reached:
+                    if next_row not in pending:
+                        pending[next_row] = 0
+                        stack.append(next_row)
+                    pending[next_row] |= reached
+
+        # Every hidden cell next to the region is revealed, zero-count or not.
+        for row in {row + dr for row in region for dr in (-1, 0, 1) if 0 <= row + dr < height}:
+            bits = region.get(row - 1, 0) | region.get(row, 0) | region.get(row + 1, 0)
+            bits = (bits | bits << 1 | bits >> 1) & hidden(row)
+            if bits:
+                _or_row(revealed, row * width, width, bits)
+                area.add(row, bits)
+
+    def toggle_flag(self, r, c):
+        """
+        Flags or unflags an unrevealed cell. Returns the new flag state,
+        or None if the cell is already revealed.
+        """
+        idx = self.index(r, c)
+        if self.is_revealed(idx):
+            return None
+        self.flagged[idx >> 3] ^= 0x80 >> (idx & 7)
+        if self.is_flagged(idx):
+            self.flags_placed += 1
+            return True
+        self.flags_placed -= 1
+        return False
+
+    def chord(self, r, c):
+        """
+        Reveals every unflagged neighbor of a revealed number whose flag count
+        matches it. Returns a RevealedArea of the newly revealed cells.
+        """
+        idx = self.index(r, c)
+        area = RevealedArea(self.width)
+        if not self.is_revealed(idx) or self.is_mine(idx):
+            return area
+        count = self.count(idx)
+        neighbors = self.neighbors(idx)
+        if count == 0 or sum(self.is_flagged(n) for n in neighbors) != count:
+            return area
+        for n in neighbors:
+            area.update(self.reveal(*divmod(n, self.width)))
+        return area
+
+    def flagged_count(self):
+        return self.flags_placed
+
+    def mines_left(self):
+        return self.mines_count - self.flags_placed
+
+    def is_won(self):
+        if not self.mines_placed or self.exploded is not None:
+            return False
+        return self.revealed_safe_count == self.size - self.mines_count
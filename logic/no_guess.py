@@ -0,0 +1,104 @@
+import time
+from collections import namedtuple
+
+from logic.board import Board
+from logic.generation import resolve_rng
+from logic.solver import Solver
+
+NoGuessResult = namedtuple("NoGuessResult", ["solved", "attempts", "relocations", "elapsed"])
+
+TIME_BUDGET = 1.0  # seconds
+
+
+def generate_no_guess(board, safe_r, safe_c, rng=None, time_budget=TIME_BUDGET):
+    """
+    Places mines on `board` so that the game can be won from (safe_r, safe_c)
+    by deduction alone, as judged by logic.solver.Solver.
+
+    The solver plays a scratch copy of the layout. Whenever it gets stuck,
+    the mines of one unresolved constraint are moved into the unexplored
+    interior and the solve carries on from where it stopped instead of
+    starting over. Because a move changes numbers that earlier deductions
+    used, every attempt that needed a move is followed by a fresh attempt
+    from the first click; the first one that needs none proves the layout.
+    If no move can unstick the solver, the mines are placed afresh.
+    Returns a NoGuessResult; `solved` is False if `time_budget` ran out.
+    """
+    rng = resolve_rng(rng)
+    start = time.perf_counter()
+    board.place_mines(safe_r, safe_c, rng)
+
+    attempts = 0
+    relocations = 0
+    while True:
+        attempts += 1
+        sim = _simulation_board(board)
+        sim.reveal(safe_r, safe_c)
+        solver = Solver(sim)
+        known_mines = set()
+        moved = False
+        while not _solve_until_stuck(sim, solver, known_mines):
+            moved = True
+            if time.perf_counter() - start > time_budget:
+                return NoGuessResult(False, attempts, relocations, time.perf_counter() - start)
+            if not _relocate(sim, solver, known_mines, rng):
+                board.place_mines(safe_r, safe_c, rng)
+                break
+            relocations += 1
+        if not moved:
+            return NoGuessResult(True, attempts, relocations, time.perf_counter() - start)
+
+
+def _simulation_board(board):
+    # Shares the mine and count arrays with `board`, so relocations made
+    # during the simulation apply to the real layout.
+    sim = Board(board.width, board.height, board.initial_mines_count, board.topology)
+    sim.mines = board.mines
+    sim.counts = board.counts
+    sim.mines_count = board.mines_count
+    sim.mines_placed = True
+    return sim
+
+
+def _solve_until_stuck(sim, solver, known_mines):
+    """Reveals deduced safe cells until the board is won (True) or stuck (False)."""
+    while not sim.is_won():
+        safe, mines = solver.solve(known_mines)
+        known_mines |= mines
+        if not safe:
+            return False
+        for idx in safe:
+            sim.reveal(*sim.coords(idx))
+    return True
+
+
+def _relocate(sim, solver, known_mines, rng):
+    """
+    Resolves one stuck constraint, preferring those with the fewest mines:
+    either its mines move to unexplored cells (it becomes all-safe) or mines
+    from elsewhere fill its safe cells (it becomes all-mine).
+    Returns False if no constraint can be resolved this way.
+    """
+    constraints = list(solver.constraints.values())
+    rng.shuffle(constraints)
+    constraints.sort(key=lambda constraint: constraint[1])
+    mines, revealed = sim.mines, sim.revealed
+
+    unknown = [idx for idx in range(sim.size) if not revealed[idx] and idx not in known_mines]
+    interior_free = [idx for idx in unknown if not mines[idx] and idx not in solver.cell_map]
+    for cells, _ in constraints:
+        cells = sorted(cells)
+        mine_cells = [idx for idx in cells if mines[idx]]
+        if len(interior_free) >= len(mine_cells):
+            for src, dst in zip(mine_cells, rng.sample(interior_free, len(mine_cells))):
+                sim.move_mine(src, dst)
+            return True
+
+        safe_cells = [idx for idx in cells if not mines[idx]]
+        cell_set = set(cells)
+        donors = [idx for idx in unknown if mines[idx] and idx not in cell_set]
+        if len(donors) >= len(safe_cells):
+            for src, dst in zip(rng.sample(donors, len(safe_cells)), safe_cells):
+                sim.move_mine(src, dst)
+            return True
+    return False
@@ -0,0 +1,198 @@
+import math
+from functools import lru_cache
+
+from logic.solver import Solver, NODE_LIMIT, component_index, frontier_components
+
+# Components above these limits are not enumerated; their cells get None.
+# compute() runs after every click while hints are shown, so the limits keep
+# one call to about 50 ms on Expert boards (it was up to half a second at 60
+# cells and 4 * NODE_LIMIT nodes) at the cost of a few more unknown cells.
+MAX_COMPONENT_SIZE = 40
+COUNT_NODE_LIMIT = NODE_LIMIT // 2
+
+
+@lru_cache(maxsize=4096)
+def binomial(n, k):
+    if k < 0 or k > n:
+        return 0
+    return math.comb(n, k)
+
+
+class ProbabilityMap:
+    """
+    Exact probability that each unrevealed cell of a Board is a mine, given
+    only what the player can see (revealed numbers and the total mine count).
+
+    Frontier cells are split into independent components. Each component's
+    solutions are counted per number of mines used, and the counts are
+    combined with binomial weights for how the remaining mines can sit in
+    the unconstrained interior. Component counts are cached by their
+    constraints, so after a click only the components it changed are
+    enumerated again.
+    """
+    def __init__(self, board):
+        self.board = board
+        self.solver = Solver(board)
+        self.cache = {}
+
+    def compute(self):
+        """
+        Returns {flat index: probability} for every unrevealed cell;
+        the value is None for cells in components too large to enumerate.
+        """
+        board = self.board
+        solver = self.solver
+        certain_safe, certain_mines = solver.solve()
+        probabilities = {idx: 0.0 for idx in certain_safe}
+        probabilities.update((idx, 1.0) for idx in certain_mines)
+
+        remaining_mines = board.mines_count - len(certain_mines)
+        components = []
+        cache = {}
+        unknown_frontier = []
+        for cells, constraints in frontier_components(solver.constraints, solver.cell_map):
+            key = frozenset((frozenset(cell_set), rem) for cell_set, rem in constraints)
+            entry = self.cache.get(key)
+            if entry is None:
+                entry = (cells, count_component(cells, constraints)
+                         if len(cells) <= MAX_COMPONENT_SIZE else None)
+            cache[key] = entry
+            if entry[1] is None:
+                unknown_frontier.extend(cells)
+            else:
+                components.append(entry)
+        # Only components seen in this position are kept for the next one.
+        self.cache = cache
+
+        revealed = board.revealed
+        interior = [idx for idx in range(board.size)
+                    if not revealed[idx] and idx not in probabilities and idx not in solver.cell_map]
+        for idx in unknown_frontier:
+            probabilities[idx] = None
+
+        # polynomials[i][k] = number of ways component i can hold k mines
+        polynomials = []
+        for _, result in components:
+            poly = [0] * (max(result) + 1)
+            for k, (ways, _) in result.items():
+                poly[k] = ways
+            polynomials.append(poly)
+        prefix = [[1]]
+        for poly in polynomials:
+            prefix.append(_multiply(prefix[-1], poly))
+        suffix = [[1]]
+        for poly in reversed(polynomials):
+            suffix.append(_multiply(suffix[-1], poly))
+        suffix.reverse()
+
+        n_interior = len(interior)
+        total = _weigh(prefix[-1], n_interior, remaining_mines)
+        if total == 0:
+            # The visible state is inconsistent (e.g. before mines are placed
+            # with an impossible count); fall back to a uniform estimate.
+            unknown = n_interior + sum(len(cells) for cells, _ in components)
+            share = remaining_mines / unknown if unknown else 0.0
+            for cells, _ in components:
+                probabilities.update((idx, share) for idx in cells)
+            probabilities.update((idx, share) for idx in interior)
+            return probabilities
+
+        for i, (cells, result) in enumerate(components):
+            others = _multiply(prefix[i], suffix[i + 1])
+            weighted = [0] * len(cells)
+            for k, (_, cell_counts) in result.items():
+                weight = _weigh(others, n_interior, remaining_mines - k)
+                if weight:
+                    for pos, count in enumerate(cell_counts):
+                        weighted[pos] += count * weight
+            for pos, idx in enumerate(cells):
+                probabilities[idx] = weighted[pos] / total
+
+        if interior:
+            interior_mines = sum(ways * binomial(n_interior - 1, remaining_mines - m - 1)
+                                 for m, ways in enumerate(prefix[-1]))
+            share = interior_mines / total
+            probabilities.update((idx, share) for idx in interior)
+        return probabilities
+
+
+def _multiply(a, b):
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _weigh(poly, n_interior, mines):
+    """Sum over m of poly[m] * C(n_interior, mines - m)."""
+    return sum(ways * binomial(n_interior, mines - m) for m, ways in enumerate(poly) if ways)
+
+
+def count_component(cells, constraints, node_limit=COUNT_NODE_LIMIT):
+    """
+    Counts every mine assignment of a frontier component.
+    Returns {mines used: (solution count, per-cell mine counts)}, with the
+    per-cell list aligned with `cells`, or None if `node_limit` was exceeded.
+    """
+    cell_constraints, remaining, unassigned = component_index(cells, constraints)
+    n = len(cells)
+
+    results = {}
+    assignment = [0] * n
+    nodes = 0
+    # Same iterative depth-first walk as logic.solver.find_assignment, but it
+    # records every solution instead of stopping at the first one.
+    tried = [0] * (n + 1)
+    i = 0
+    mines_used = 0
+    while i >= 0:
+        if i == n:
+            entry = results.get(mines_used)
+            if entry is None:
+                entry = results[mines_used] = [0, [0] * n]
+            entry[0] += 1
+            counts = entry[1]
+            for pos in range(n):
+                if assignment[pos]:
+                    counts[pos] += 1
+            i -= 1
+            continue
+        if tried[i] > 0:
+            value = assignment[i]
+            for ci in cell_constraints[i]:
+                remaining[ci] += value
+                unassigned[ci] += 1
+            mines_used -= value
+        placed = False
+        while tried[i] < 2:
+            value = tried[i]
+            tried[i] += 1
+            touched = cell_constraints[i]
+            ok = True
+            for ci in touched:
+                rem = remaining[ci] - value
+                if rem < 0 or rem > unassigned[ci] - 1:
+                    ok = False
+                    break
+            if not ok:
+                continue
+            for ci in touched:
+                remaining[ci] -= value
+                unassigned[ci] -= 1
+            assignment[i] = value
+            mines_used += value
+            placed = True
+            break
+        nodes += 1
+        if nodes > node_limit:
+            return None
+        if placed:
+            i += 1
+            tried[i] = 0
+        else:
+            tried[i] = 0
+            assignment[i] = 0
+            i -= 1
+    return {k: (ways, counts) for k, (ways, counts) in results.items()}
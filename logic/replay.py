@@ -0,0 +1,370 @@
+import math
+import os
+import time
+
+from logic.board import Board, SQUARE, HEX
+from logic.board_id import parse_board_id
+from logic.generation import count_adjacent_mines_for
+from logic.huge_board import HugeBoard
+
+REPLAY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "replays")
+REPLAY_SUFFIX = ".msr"
+MAGIC = b"MSR\x01"
+
+# Actions, stored in the low two bits of each event's cell field.
+REVEAL = 0
+FLAG = 1
+CHORD = 2
+
+# Engines a replay can be played back on.
+ENGINE_BOARD = 0  # logic.board.Board (classic, hexagon and normal custom boards)
+ENGINE_HUGE = 1   # logic.huge_board.HugeBoard (Huge custom boards)
+
+# Outcomes.
+UNFINISHED = 0
+WON = 1
+LOST = 2
+
+# Replays keep milliseconds. The window stops its clock a little after the
+# last move (it still has to draw it), hence the tolerance when checking that
+# the move timestamps add up to the recorded time.
+TIME_RESOLUTION = 0.001  # seconds
+TIME_TOLERANCE = 0.5     # seconds
+
+KEYFRAME_EVERY = 256               # events between keyframes, at least
+KEYFRAME_BUDGET = 64 * 1024 * 1024  # bytes of keyframes kept per player, at most
+REDRAW_ALL_AFTER = 4096            # changed cells past which a step asks for a full redraw
+
+
+def write_varint(out, value):
+    """Appends a non-negative int to bytearray `out`, seven bits per byte."""
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    """Returns (value, next position) for the varint at data[pos]."""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """
+    A recorded game: its board ID (which holds the seed and first click),
+    the engine it ran on, how it ended, the time the window reported and the
+    list of (dt_ms, action, idx) events, dt_ms being milliseconds since the
+    previous event.
+
+    Encoded, each event is two varints, dt_ms and idx << 2 | action, so a
+    move costs two to five bytes even on a 10,000 x 10,000 board. No-guess
+    boards are not reproducible from the seed alone (the generator works to
+    a time budget), so their mine layout is stored as varint index gaps.
+    """
+    def __init__(self, board_id, engine, outcome, duration, events, mines=None):
+        self.board_id = board_id
+        self.engine = engine
+        self.outcome = outcome
+        self.duration = duration  # seconds
+        self.events = events
+        self.mines = mines  # sorted mine indices, or None to regenerate from the seed
+
+    def encode(self):
+        out = bytearray(MAGIC)
+        board_id = self.board_id.encode("ascii")
+        write_varint(out, len(board_id))
+        out += board_id
+        out.append(self.engine)
+        out.append(self.outcome)
+        write_varint(out, round(self.duration * 1000))
+        if self.mines is None:
+            out.append(0)
+        else:
+            out.append(1)
+            write_varint(out, len(self.mines))
+            previous = 0
+            for idx in self.mines:
+                write_varint(out, idx - previous)
+                previous = idx
+        write_varint(out, len(self.events))
+        for dt, action, idx in self.events:
+            write_varint(out, dt)
+            write_varint(out, idx << 2 | action)
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data):
+        """Raises ValueError if `data` is not a replay or does not fit its board ID."""
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a replay file.")
+        try:
+            pos = len(MAGIC)
+            length, pos = read_varint(data, pos)
+            board_id = data[pos:pos + length].decode("ascii")
+            pos += length
+            engine, outcome = data[pos], data[pos + 1]
+            duration, pos = read_varint(data, pos + 2)
+            mines = None
+            if data[pos]:
+                count, pos = read_varint(data, pos + 1)
+                mines = []
+                idx = 0
+                for _ in range(count):
+                    gap, pos = read_varint(data, pos)
+                    idx += gap
+                    mines.append(idx)
+            else:
+                pos += 1
+            count, pos = read_varint(data, pos)
+            events = []
+            for _ in range(count):
+                dt, pos = read_varint(data, pos)
+                packed, pos = read_varint(data, pos)
+                events.append((dt, packed & 3, packed >> 2))
+        except (IndexError, UnicodeDecodeError):
+            raise ValueError("Replay file is truncated or corrupted.")
+        board = parse_board_id(board_id)
+        if engine not in (ENGINE_BOARD, ENGINE_HUGE) or (engine == ENGINE_HUGE and board.mode != "custom"):
+            raise ValueError("Replay file names an unknown engine for its board.")
+        if outcome not in (UNFINISHED, WON, LOST):
+            raise ValueError("Replay file has an unknown outcome.")
+        if mines is not None:
+            size = board.width * board.height
+            if any(b <= a for a, b in zip(mines, mines[1:])) or (mines and mines[-1] >= size):
+                raise ValueError("Replay file has duplicate or out-of-range mines.")
+        return cls(board_id, engine, outcome, duration / 1000, events, mines)
+
+    def save(self, directory=REPLAY_DIR):
+        """Writes the replay to `directory` and returns its path."""
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.board_id}-{int(time.time() * 1000)}{REPLAY_SUFFIX}")
+        with open(path, "wb") as f:
+            f.write(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.decode(f.read())
+
+    def recorded_time(self):
+        """Seconds from the first click to the last event, from the event timestamps."""
+        return sum(dt for dt, _, _ in self.events) / 1000
+
+    def new_model(self):
+        """A fresh board with this replay's mines in place, ready for the first event."""
+        board_id = parse_board_id(self.board_id)
+        if self.engine == ENGINE_HUGE:
+            model = HugeBoard(board_id.width, board_id.height, board_id.mines)
+        else:
+            model = Board(board_id.width, board_id.height, board_id.mines,
+                          topology=HEX if board_id.mode == "hexagon" else SQUARE)
+        if self.mines is None:
+            model.place_mines(board_id.first_r, board_id.first_c, rng=board_id.seed)
+        else:
+            set_mines(model, self.mines)
+        return model
+
+
+def set_mines(model, mines):
+    """Lays out the given mine indices on a fresh board of either engine."""
+    if isinstance(model, HugeBoard):
+        bitset = model.mines
+        for idx in mines:
+            bitset[idx >> 3] |= 0x80 >> (idx & 7)
+    else:
+        for idx in mines:
+            model.mines[idx] = 1
+        model.counts = count_adjacent_mines_for(model.mines, model.topology)
+    model.mines_count = len(mines)
+    model.mines_placed = True
+
+
+def apply_event(model, action, idx):
+    """
+    Applies one recorded move to a board; returns the flat indices it changed
+    (a RevealedArea for a HugeBoard reveal or chord).
+    """
+    r, c = model.coords(idx)
+    if action == FLAG:
+        return [idx] if model.toggle_flag(r, c) is not None else []
+    if action == CHORD:
+        return model.chord(r, c)
+    return model.reveal(r, c)
+
+
+def check_replay(replay, expected_time=None, require_win=True):
+    """
+    Re-plays `replay` headlessly and returns a list of problems (empty if
+    it holds up): the moves must start with the board ID's first click,
+    stay on the board, stop when the game ends and end the way the replay
+    says (a win when `require_win`); the move timestamps must add up to the
+    recorded time, and that must equal `expected_time` (e.g. a leaderboard
+    time) when given.
+    """
+    problems = []
+    try:
+        board_id = parse_board_id(replay.board_id)
+    except ValueError as e:
+        return [str(e)]
+    if require_win and replay.outcome != WON:
+        problems.append("replay is not a win")
+
+    model = replay.new_model()
+    first_reveal = next((idx for _, action, idx in replay.events if action != FLAG), None)
+    if first_reveal != model.index(board_id.first_r, board_id.first_c):
+        problems.append("first reveal is not the board's first click")
+    for n, (_, action, idx) in enumerate(replay.events):
+        if model.exploded is not None or model.is_won():
+            problems.append(f"{len(replay.events) - n} move(s) after the game ended")
+            break
+        if not 0 <= idx < model.size or action not in (REVEAL, FLAG, CHORD):
+            problems.append(f"move {n + 1} is not a valid action on this board")
+            break
+        apply_event(model, action, idx)
+
+    won = model.is_won()
+    if replay.outcome == WON and not won:
+        problems.append("hit a mine" if model.exploded is not None else "board was not cleared")
+    elif replay.outcome == LOST and won:
+        problems.append("recorded as a loss but the moves win")
+
+    move_time = replay.recorded_time()
+    if move_time > replay.duration + TIME_RESOLUTION:
+        problems.append(f"moves span {move_time:.3f}s, longer than the recorded {replay.duration:.3f}s")
+    elif replay.duration - move_time > TIME_TOLERANCE:
+        problems.append(f"recorded {replay.duration:.3f}s but the moves only span {move_time:.3f}s")
+    if expected_time is not None and abs(expected_time - replay.duration) > TIME_RESOLUTION:
+        problems.append(f"leaderboard time {expected_time:.3f}s does not match the replay's {replay.duration:.3f}s")
+    return problems
+
+
+class ReplayRecorder:
+    """
+    Collects a game's events as it is played. `start` is called with the
+    game's start time at the first click; events before it (flags placed
+    before the first click) get a delta of zero.
+    """
+    def __init__(self, engine=ENGINE_BOARD):
+        self.engine = engine
+        self.events = []
+        self.start_time = None
+        self.last_ms = 0
+
+    def start(self, start_time):
+        self.start_time = start_time
+
+    def record(self, action, idx):
+        # Deltas come from rounded totals, so they add up to the elapsed time exactly.
+        elapsed = round((time.time() - self.start_time) * 1000) if self.start_time is not None else 0
+        self.events.append((elapsed - self.last_ms, action, idx))
+        self.last_ms = elapsed
+
+    def finish(self, board_id, won, duration, mines=None):
+        return Replay(board_id, self.engine, WON if won else LOST, duration, self.events, mines)
+
+
+def save_replay(recorder, board_id, won, duration, mines=None):
+    """Writes a finished game's replay; returns its path, or None if it could not be saved."""
+    if board_id is None:
+        return None
+    try:
+        return recorder.finish(board_id, won, duration, mines).save()
+    except OSError as e:
+        print(f"Error saving replay: {e}")
+        return None
+
+
+class ReplayPlayer:
+    """
+    Re-runs a Replay on a headless board, one event at a time.
+
+    Every `keyframe_every` events the revealed/flagged state is snapshotted,
+    so `seek` restores the nearest earlier keyframe and replays at most that
+    many events, whichever move it is asked for. The interval grows past
+    KEYFRAME_EVERY when needed to keep the snapshots of a huge board within
+    KEYFRAME_BUDGET bytes.
+    """
+    def __init__(self, replay):
+        self.replay = replay
+        self.model = replay.new_model()
+        self.position = 0
+        self.elapsed_ms = 0  # replay clock at the current position
+        snapshot = self._snapshot()
+        snapshot_size = len(snapshot[0]) + len(snapshot[1])
+        self.keyframe_every = max(KEYFRAME_EVERY,
+                                  math.ceil(len(replay.events) * snapshot_size / KEYFRAME_BUDGET))
+        self.keyframes = {0: snapshot}
+
+    def __len__(self):
+        return len(self.replay.events)
+
+    def _snapshot(self):
+        m = self.model
+        return bytes(m.revealed), bytes(m.flagged), m.revealed_safe_count, m.flags_placed, m.exploded, self.elapsed_ms
+
+    def _restore(self, position):
+        revealed, flagged, revealed_safe_count, flags_placed, exploded, elapsed_ms = self.keyframes[position]
+        m = self.model
+        m.revealed = bytearray(revealed)
+        m.flagged = bytearray(flagged)
+        m.revealed_safe_count = revealed_safe_count
+        m.flags_placed = flags_placed
+        m.exploded = exploded
+        self.position = position
+        self.elapsed_ms = elapsed_ms
+
+    def step(self):
+        """
+        Applies the next event; returns the flat indices it changed, or None
+        if it changed more than REDRAW_ALL_AFTER cells (redrawing the view
+        is then cheaper than listing them).
+        """
+        dt, action, idx = self.replay.events[self.position]
+        changed = apply_event(self.model, action, idx)
+        self.position += 1
+        self.elapsed_ms += dt
+        if self.position % self.keyframe_every == 0 and self.position not in self.keyframes:
+            self.keyframes[self.position] = self._snapshot()
+        if len(changed) > REDRAW_ALL_AFTER:
+            return None
+        return list(changed)
+
+    def seek(self, position):
+        """
+        Moves to just after event `position - 1` (0 = before the first event).
+        Returns None if the whole board must be redrawn, else the changed indices.
+        """
+        position = max(0, min(position, len(self)))
+        if self.position <= position <= self.position + self.keyframe_every:
+            changed = []
+            while self.position < position:
+                step = self.step()
+                if step is None:
+                    changed = None
+                elif changed is not None:
+                    changed.extend(step)
+            return changed
+        keyframe = max(k for k in self.keyframes if k <= position)
+        if not keyframe <= self.position <= position:
+            self._restore(keyframe)
+        while self.position < position:
+            self.step()
+        return None
+
+    def cell_state(self, idx):
+        """(revealed, flagged, mine, count) of a cell, on either engine."""
+        m = self.model
+        if self.replay.engine == ENGINE_HUGE:
+            return m.is_revealed(idx), m.is_flagged(idx), m.is_mine(idx), m.count(idx)
+        return m.revealed[idx], m.flagged[idx], m.mines[idx], m.counts[idx]
+
+    def is_done(self):
+        return self.position >= len(self)
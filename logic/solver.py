@@ -0,0 +1,344 @@
+SINGLE = "single"
+PAIR = "pair"
+ENUMERATION = "enumeration"
+
+# Components larger than this (or needing more search nodes) are left to the
+# caller rather than enumerated, which keeps the worst case bounded.
+MAX_COMPONENT_SIZE = 40
+NODE_LIMIT = 100000
+
+
+class Solver:
+    """
+    Deduces safe cells and certain mines from the visible state of a Board
+    (revealed cells and their counts), for any topology the Board supports.
+
+    Rules are tried cheapest first: single-cell rules, pair rules between
+    overlapping constraints, then exhaustive enumeration of each connected
+    frontier component. `stats` counts how many cells each tier deduced.
+    The total mine count is only used as an upper bound per component.
+    """
+    def __init__(self, board, max_component_size=MAX_COMPONENT_SIZE, node_limit=NODE_LIMIT):
+        self.board = board
+        self.max_component_size = max_component_size
+        self.node_limit = node_limit
+        self.neighbors = [board.neighbors(idx) for idx in range(board.size)]
+        # Revealed cells that may still constrain something. Cells whose
+        # neighbors are all revealed or known mines drop out for good (until
+        # known_mines shrinks), and only newly revealed cells are added, so
+        # building the constraints costs O(frontier) rather than O(board).
+        self.active = set()
+        self.active_known = set()
+        self.seen_revealed = bytearray(board.size)
+        self.stats = {SINGLE: 0, PAIR: 0, ENUMERATION: 0, "components_skipped": 0}
+
+    def solve(self, known_mines=()):
+        """
+        Returns (safe, mines): sets of unrevealed cells that are certainly safe
+        and certainly mines. Cells in `known_mines` (e.g. trusted flags) are
+        treated as mines and are not repeated in the result.
+        """
+        self.known_mines = set(known_mines)
+        self.safe = set()
+        self.mines = set()
+        self._build_constraints()
+
+        while True:
+            if self._apply_single_rules():
+                continue
+            if self._apply_pair_rules():
+                continue
+            if self._apply_enumeration():
+                continue
+            if self._apply_mine_total():
+                continue
+            break
+        return self.safe, self.mines
+
+    def _update_active(self):
+        board = self.board
+        revealed, seen = board.revealed, self.seen_revealed
+        if not self.active_known <= self.known_mines:
+            seen = self.seen_revealed = bytearray(board.size)
+            self.active = set()
+        self.active_known = set(self.known_mines)
+
+        step = 64
+        for start in range(0, board.size, step):
+            end = start + step
+            if revealed[start:end] == seen[start:end]:
+                continue
+            for idx in range(start, min(end, board.size)):
+                if revealed[idx] and not seen[idx]:
+                    self.active.add(idx)
+        seen[:] = revealed
+        self.active.discard(board.exploded)
+
+    def _build_constraints(self):
+        self._update_active()
+        revealed, counts, neighbors = self.board.revealed, self.board.counts, self.neighbors
+        known_mines = self.known_mines
+
+        self.constraints = {}  # constraint id -> [set of unknown cells, mines among them]
+        self.cell_map = {}     # unknown cell -> set of constraint ids
+        finished = []
+        for idx in self.active:
+            unknown = []
+            remaining = counts[idx]
+            for n in neighbors[idx]:
+                if revealed[n]:
+                    continue
+                if n in known_mines:
+                    remaining -= 1
+                else:
+                    unknown.append(n)
+            if not unknown:
+                finished.append(idx)
+                continue
+            self.constraints[idx] = [set(unknown), remaining]
+            for n in unknown:
+                cell_constraints = self.cell_map.get(n)
+                if cell_constraints is None:
+                    self.cell_map[n] = {idx}
+                else:
+                    cell_constraints.add(idx)
+        self.active.difference_update(finished)
+        self.pending = set(self.constraints)
+
+    def _mark(self, cell, is_mine, tier):
+        if cell in self.safe or cell in self.mines:
+            return
+        (self.mines if is_mine else self.safe).add(cell)
+        self.stats[tier] += 1
+        for cid in self.cell_map.pop(cell, ()):
+            constraint = self.constraints[cid]
+            constraint[0].discard(cell)
+            if is_mine:
+                constraint[1] -= 1
+            if constraint[0]:
+                self.pending.add(cid)
+            else:
+                del self.constraints[cid]
+                self.pending.discard(cid)
+
+    def _apply_single_rules(self):
+        found = False
+        while self.pending:
+            cid = self.pending.pop()
+            constraint = self.constraints.get(cid)
+            if constraint is None:
+                continue
+            cells, remaining = constraint
+            if remaining == 0:
+                for cell in list(cells):
+                    self._mark(cell, False, SINGLE)
+                found = True
+            elif remaining == len(cells):
+                for cell in list(cells):
+                    self._mark(cell, True, SINGLE)
+                found = True
+        return found
+
+    def _apply_pair_rules(self):
+        constraints, cell_map = self.constraints, self.cell_map
+        for a_id, (a_cells, a_rem) in list(constraints.items()):
+            partners = set()
+            for cell in a_cells:
+                partners.update(cell_map[cell])
+            for b_id in partners:
+                if b_id <= a_id:
+                    continue
+                b_cells, b_rem = constraints[b_id]
+                a_only = a_cells - b_cells
+                b_only = b_cells - a_cells
+                # The shared cells hold at most min(a_rem, b_rem) mines, so if
+                # one side needs every exclusive cell to be a mine the other
+                # side's exclusive cells must all be safe.
+                if b_rem - a_rem == len(b_only):
+                    mine_cells, safe_cells = b_only, a_only
+                elif a_rem - b_rem == len(a_only):
+                    mine_cells, safe_cells = a_only, b_only
+                else:
+                    continue
+                if not mine_cells and not safe_cells:
+                    continue
+                for cell in mine_cells:
+                    self._mark(cell, True, PAIR)
+                for cell in safe_cells:
+                    self._mark(cell, False, PAIR)
+                return True
+        return False
+
+    def _apply_enumeration(self):
+        # A cell is certain exactly when no valid assignment of its component
+        # gives it the other value. One solution is found first; every further
+        # search tries to flip a still-undecided cell, and each solution found
+        # rules out all the cells it flips, so few searches are needed.
+        remaining_mines = self.board.mines_count - len(self.known_mines) - len(self.mines)
+        found = False
+        for cells, constraints in list(frontier_components(self.constraints, self.cell_map)):
+            if len(cells) > self.max_component_size:
+                self.stats["components_skipped"] += 1
+                continue
+            index = component_index(cells, constraints)
+            base = find_assignment(index, None, remaining_mines, self.node_limit)
+            if not base:
+                self.stats["components_skipped"] += 1
+                continue
+            ambiguous = set()
+            certain = []
+            for pos in range(len(cells)):
+                if pos in ambiguous:
+                    continue
+                other = find_assignment(index, (pos, 1 - base[pos]), remaining_mines, self.node_limit)
+                if other is None:
+                    continue
+                if other is False:
+                    certain.append(pos)
+                    continue
+                for p, value in enumerate(other):
+                    if value != base[p]:
+                        ambiguous.add(p)
+            for pos in certain:
+                self._mark(cells[pos], bool(base[pos]), ENUMERATION)
+                found = True
+        return found
+
+
+    def _apply_mine_total(self):
+        # Once every mine is accounted for, all other unknown cells are safe;
+        # if only mines can be left, every unknown cell is one.
+        board = self.board
+        remaining_mines = board.mines_count - len(self.known_mines) - len(self.mines)
+        revealed = board.revealed
+        unknown = [idx for idx in range(board.size)
+                   if not revealed[idx] and idx not in self.known_mines
+                   and idx not in self.mines and idx not in self.safe]
+        if not unknown:
+            return False
+        if remaining_mines == 0:
+            for idx in unknown:
+                self._mark(idx, False, SINGLE)
+            return True
+        if remaining_mines == len(unknown):
+            for idx in unknown:
+                self._mark(idx, True, SINGLE)
+            return True
+        return False
+
+
+def frontier_components(constraints, cell_map):
+    """
+    Splits the frontier into independent groups of cells linked by shared
+    constraints. Yields (cells, [(cell set, remaining), ...]) per component.
+    """
+    visited = set()
+    for start in constraints:
+        if start in visited:
+            continue
+        visited.add(start)
+        stack = [start]
+        component_ids = []
+        cells = []
+        seen_cells = set()
+        while stack:
+            cid = stack.pop()
+            component_ids.append(cid)
+            for cell in constraints[cid][0]:
+                if cell in seen_cells:
+                    continue
+                seen_cells.add(cell)
+                cells.append(cell)
+                for other in cell_map[cell]:
+                    if other not in visited:
+                        visited.add(other)
+                        stack.append(other)
+        yield cells, [(constraints[cid][0], constraints[cid][1]) for cid in component_ids]
+
+
+def component_index(cells, constraints):
+    """
+    Precomputes, for a component's `cells` list and (cell set, remaining)
+    constraints, the constraint positions touching each cell plus the
+    constraints' initial remaining/unassigned tallies.
+    """
+    position = {cell: pos for pos, cell in enumerate(cells)}
+    cell_constraints = [[] for _ in cells]
+    for ci, (cell_set, _) in enumerate(constraints):
+        for cell in cell_set:
+            cell_constraints[position[cell]].append(ci)
+    remaining = [rem for _, rem in constraints]
+    unassigned = [len(cell_set) for cell_set, _ in constraints]
+    return cell_constraints, remaining, unassigned
+
+
+def find_assignment(index, forced=None, max_mines=None, node_limit=NODE_LIMIT):
+    """
+    Backtracking search for one mine assignment of a component (as prepared
+    by component_index) that satisfies every constraint with at most
+    `max_mines` mines. `forced` optionally pins (position, value).
+    Returns the assignment as a list aligned with the component's cells,
+    False if none exists, or None if `node_limit` nodes were not enough.
+    """
+    cell_constraints, remaining, unassigned = index
+    remaining, unassigned = remaining[:], unassigned[:]
+    n = len(cell_constraints)
+    if max_mines is None:
+        max_mines = n
+
+    assignment = [0] * n
+    choices = [(0, 1)] * n
+    if forced is not None:
+        choices[forced[0]] = (forced[1],)
+
+    # Iterative depth-first search; tried[i] is how many of choices[i] have
+    # been attempted at depth i.
+    tried = [0] * (n + 1)
+    i = 0
+    mines_used = 0
+    nodes = 0
+    while True:
+        if i == n:
+            return assignment[:]
+        if tried[i] > 0:
+            # Undo the value previously assigned at this depth.
+            value = assignment[i]
+            for ci in cell_constraints[i]:
+                remaining[ci] += value
+                unassigned[ci] += 1
+            mines_used -= value
+        options = choices[i]
+        placed = False
+        while tried[i] < len(options):
+            value = options[tried[i]]
+            tried[i] += 1
+            if value and mines_used >= max_mines:
+                continue
+            touched = cell_constraints[i]
+            ok = True
+            for ci in touched:
+                rem = remaining[ci] - value
+                if rem < 0 or rem > unassigned[ci] - 1:
+                    ok = False
+                    break
+            if not ok:
+                continue
+            for ci in touched:
+                remaining[ci] -= value
+                unassigned[ci] -= 1
+            assignment[i] = value
+            mines_used += value
+            placed = True
+            break
+        nodes += 1
+        if nodes > node_limit:
+            return None
+        if placed:
+            i += 1
+            tried[i] = 0
+        else:
+            tried[i] = 0
+            assignment[i] = 0
+            i -= 1
+            if i < 0:
+                return False
@@ -0,0 +1,154 @@
+import math
+from array import array
+from functools import lru_cache
+
+SQUARE = "square"
+HEX = "hex"
+TORUS = "torus"
+
+SQRT3 = math.sqrt(3)
+
+
+class Topology:
+    """
+    Shape of a board: how many cells it has, which cells touch and where
+    each cell sits when drawn.
+
+    Cells are flat indices (r * width + c). Everything else in logic/
+    (generation, counting, flood fill, solving) only talks to the board
+    through the flat neighbour table, so a new grid shape only needs a
+    subclass that says which (dr, dc) offsets are neighbours.
+    """
+    name = None
+    wraps = False  # whether offsets past an edge continue on the opposite side
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self._table = None
+
+    def offsets(self, r):
+        """The (dr, dc) neighbour offsets of the cells in row r."""
+        raise NotImplementedError
+
+    def center(self, r, c):
+        """Centre of cell (r, c) in drawing units (one unit = cell size or hex radius)."""
+        raise NotImplementedError
+
+    def neighbor_table(self):
+        """
+        CSR-style neighbour table: the neighbours of flat index i are
+        neighbors[starts[i]:starts[i + 1]]. Built on first use and shared
+        by every board of this shape, so treat it as read-only.
+        """
+        if self._table is None:
+            self._table = self._build_wrapped_table() if self.wraps else self._build_table()
+        return self._table
+
+    def has_table(self):
+        return self._table is not None
+
+    def neighbors(self, idx):
+        """Neighbours of one cell: from the table once it is built, else worked out from the offsets."""
+        if self._table is None:
+            return self.neighbors_of(idx)
+        starts, neighbors = self._table
+        return neighbors[starts[idx]:starts[idx + 1]]
+
+    def neighbors_of(self, idx):
+        """Neighbours of one cell from its offsets, in table order, without building the table."""
+        width, height = self.width, self.height
+        r, c = divmod(idx, width)
+        if not self.wraps:
+            return [(r + dr) * width + c + dc for dr, dc in self.offsets(r)
+                    if 0 <= r + dr < height and 0 <= c + dc < width]
+        seen = {idx}
+        result = []
+        for dr, dc in self.offsets(r):
+            n = ((r + dr) % height) * width + (c + dc) % width
+            if n not in seen:
+                seen.add(n)
+                result.append(n)
+        return result
+
+    def _build_table(self):
+        width, height = self.width, self.height
+        starts = array("i", [0])
+        neighbors = array("i")
+        for r in range(height):
+            row_offsets = [(dr * width + dc, dc) for dr, dc in self.offsets(r) if 0 <= r + dr < height]
+            deltas = [delta for delta, _ in row_offsets]
+            base = r * width
+            for c in range(width):
+                idx = base + c
+                if 0 < c < width - 1:
+                    neighbors.extend([idx + delta for delta in deltas])
+                else:
+                    neighbors.extend([idx + delta for delta, dc in row_offsets if 0 <= c + dc < width])
+                starts.append(len(neighbors))
+        return starts, neighbors
+
+    def _build_wrapped_table(self):
+        # On narrow boards several offsets can wrap onto the same cell (or the
+        # cell itself); each neighbour is listed once and never the cell itself.
+        width, height = self.width, self.height
+        starts = array("i", [0])
+        neighbors = array("i")
+        for r in range(height):
+            offsets = self.offsets(r)
+            for c in range(width):
+                idx = r * width + c
+                seen = {idx}
+                for dr, dc in offsets:
+                    n = ((r + dr) % height) * width + (c + dc) % width
+                    if n not in seen:
+                        seen.add(n)
+                        neighbors.append(n)
+                starts.append(len(neighbors))
+        return starts, neighbors
+
+
+class SquareTopology(Topology):
+    name = SQUARE
+    OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+    def offsets(self, r):
+        return self.OFFSETS
+
+    def center(self, r, c):
+        return c + 0.5, r + 0.5
+
+
+class HexTopology(Topology):
+    """Pointy-top hexes in the odd-row-offset layout: odd rows sit half a cell to the right."""
+    name = HEX
+    EVEN_ROW_OFFSETS = ((0, -1), (0, 1), (-1, -1), (-1, 0), (1, -1), (1, 0))
+    ODD_ROW_OFFSETS = ((0, -1), (0, 1), (-1, 0), (-1, 1), (1, 0), (1, 1))
+
+    def offsets(self, r):
+        return self.ODD_ROW_OFFSETS if r % 2 else self.EVEN_ROW_OFFSETS
+
+    def center(self, r, c):
+        return SQRT3 * (c + 0.5 * (r % 2)), 1.5 * r
+
+
+class TorusTopology(SquareTopology):
+    """Square cells whose edges wrap around: the top row touches the bottom one, and so on."""
+    name = TORUS
+    wraps = True
+
+
+TOPOLOGIES = {cls.name: cls for cls in (SquareTopology, HexTopology, TorusTopology)}
+
+
+@lru_cache(maxsize=16)
+def get_topology(name, width, height):
+    """
+    Returns the shared Topology for a board shape, so that games of the
+    same size reuse its neighbour table. Raises ValueError for unknown names.
+    """
+    cls = TOPOLOGIES.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown topology '{name}'.")
+    return cls(width, height)
@@ -1,64 +1,81 @@
+import time
+
+STARTED = time.perf_counter()
+
+import importlib
+import os
+import sys
 import tkinter as tk
 
-from start_menu import StartMenu
-from about_us import AboutUs
+# Set to any non-empty value to print startup timings (imports, app
+# construction, first paint and each frame's first build) to stderr.
+STARTUP_TIMING = bool(os.environ.get("MINESWEEPER_STARTUP_TIMING"))
+
+# Frame name -> (module, class). Modules are imported, and frames built,
+# the first time show_frame asks for them.
+FRAMES = {
+    "StartMenu": ("start_menu", "StartMenu"),
+    "AboutUs": ("about_us", "AboutUs"),
+    "ClassicMenu": ("classic_mode.classic_menu", "ClassicMenu"),
+    "ClassicLeaderboardDisplay": ("classic_mode.classic_leaderboard_display", "ClassicLeaderboardDisplay"),
+    "CustomMenu": ("custom_mode.custom_menu", "CustomMenu"),
+    "CustomLeaderboardDisplay": ("custom_mode.custom_leaderboard_display", "CustomLeaderboardDisplay"),
+    "HexMenu": ("hexagon_mode.hex_menu", "HexMenu"),
+    "HexLeaderboardDisplay": ("hexagon_mode.hex_leaderboard_display", "HexLeaderboardDisplay"),
+}
 
-# Classic
-from classic_mode.classic_menu import ClassicMenu
-from classic_mode.classic_leaderboard_display import ClassicLeaderboardDisplay
+IMPORTED = time.perf_counter()
 
-# Custom
-from custom_mode.custom_menu import CustomMenu
-from custom_mode.custom_leaderboard_display import CustomLeaderboardDisplay
 
-# Hex
-from hexagon_mode.hex_menu import HexMenu
-from hexagon_mode.hex_leaderboard_display import HexLeaderboardDisplay
+def report_timing(label, start, end=None):
+    if STARTUP_TIMING:
+        end = time.perf_counter() if end is None else end
+        print(f"[startup] {label}: {(end - start) * 1000:.1f} ms", file=sys.stderr)
+
 
 class MinesweeperApp(tk.Tk):
     """
     Main application class that creates and stores frames by string keys.
+    Frames are built lazily, on the first show_frame for their name.
     """
     def __init__(self):
         super().__init__()
         self.title("Minesweeper Application")
-        self.configure(bg="lightgrey") 
+        self.configure(bg="lightgrey")
         self.resizable(False, False)
 
-        container = tk.Frame(self, bg=self.cget('bg')) 
+        container = tk.Frame(self, bg=self.cget('bg'))
         container.pack(side="top", fill="both", expand=True)
 
         container.grid_rowconfigure(0, weight=1)
         container.grid_columnconfigure(0, weight=1)
+        self.container = container
 
         self.frames = {}
-        self.current_frame_name = None 
-
-        frame_classes = {
-            "StartMenu": StartMenu,
-            "AboutUs": AboutUs,
-            "ClassicMenu": ClassicMenu,
-            "ClassicLeaderboardDisplay": ClassicLeaderboardDisplay,
-            "CustomMenu": CustomMenu,
-            "CustomLeaderboardDisplay": CustomLeaderboardDisplay,
-            "HexMenu": HexMenu,
-            "HexLeaderboardDisplay": HexLeaderboardDisplay,
-        }
-
-        for name, FrameClass in frame_classes.items():
-            frame = FrameClass(container, self) 
-            self.frames[name] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
-            frame.grid_remove() 
+        self.current_frame_name = None
 
         self.show_frame("StartMenu")
 
+    def get_frame(self, name):
+        """Returns the frame registered as `name`, importing and building it on first use."""
+        frame = self.frames.get(name)
+        if frame is None:
+            start = time.perf_counter()
+            module_name, class_name = FRAMES[name]
+            FrameClass = getattr(importlib.import_module(module_name), class_name)
+            frame = FrameClass(self.container, self)
+            frame.grid(row=0, column=0, sticky="nsew")
+            frame.grid_remove()
+            self.frames[name] = frame
+            report_timing(f"build {name}", start)
+        return frame
+
     def show_frame(self, frame_name_to_show: str):
-        if frame_name_to_show not in self.frames:
+        if frame_name_to_show not in FRAMES:
             print(f"Error: Frame '{frame_name_to_show}' not found.")
             return
 
-        target_frame = self.frames[frame_name_to_show]
+        target_frame = self.get_frame(frame_name_to_show)
 
         if hasattr(target_frame, "update_display"):
             target_frame.update_display()
@@ -66,18 +83,24 @@ class MinesweeperApp(tk.Tk):
         if self.current_frame_name and self.current_frame_name != frame_name_to_show and self.current_frame_name in self.frames:
             current_frame_instance = self.frames[self.current_frame_name]
             current_frame_instance.grid_remove()
-        
-        target_frame.grid() 
+
+        target_frame.grid()
         target_frame.tkraise()
-        
+
         self.current_frame_name = frame_name_to_show
-        
+
         self.update_idletasks()
 
 
 def main():
+    report_timing("imports", STARTED, IMPORTED)
+    start = time.perf_counter()
     app = MinesweeperApp()
+    report_timing("app construction", start)
+    if STARTUP_TIMING:
+        app.update()  # process the initial events so the first frame is on screen
+        report_timing("first paint (since process start)", STARTED)
     app.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,256 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import os
+import time
+
+from utils.helpers import format_time
+from utils.board_canvas import UNREVEALED_FILL, REVEALED_FILL, GRID_OUTLINE, NUMBER_COLORS
+from utils.redraw import FRAME_BUDGET
+from logic.board_id import parse_board_id
+from logic.topology import SQRT3
+from logic.replay import Replay, ReplayPlayer, REPLAY_DIR, REPLAY_SUFFIX, WON
+
+CELL_SIZE = 20
+HEX_RADIUS = 14
+VIEW_CELLS = (40, 30)  # most (columns, rows) of a square board shown at once
+SPEEDS = (1, 2, 5, 10, 25, 50, 100)
+MAX_WAIT = 100  # ms between playback ticks while waiting for a slow move
+
+
+def open_replay(controller):
+    """Asks for a replay file and opens it in a ReplayViewer."""
+    path = filedialog.askopenfilename(title="Open Replay", initialdir=REPLAY_DIR if os.path.isdir(REPLAY_DIR) else None,
+                                      filetypes=[("Minesweeper replays", f"*{REPLAY_SUFFIX}"), ("All files", "*")])
+    if not path:
+        return None
+    try:
+        replay = Replay.load(path)
+        parse_board_id(replay.board_id)
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Invalid Replay", str(e))
+        return None
+    return ReplayViewer(controller, replay, title=os.path.basename(path))
+
+
+class ReplayViewer(tk.Toplevel):
+    """
+    Plays a recorded game back through the headless logic at 1x to 100x,
+    or jumps to any move with the slider (ReplayPlayer seeks from its
+    keyframes). Square boards are shown through a window of at most
+    VIEW_CELLS cells that follows the moves, so huge boards cost no more to
+    draw than small ones; hex boards are drawn whole.
+    """
+    def __init__(self, controller, replay, title=None):
+        super().__init__()
+        self.controller = controller
+        self.replay = replay
+        self.player = ReplayPlayer(replay)
+        self.board = parse_board_id(replay.board_id)
+        self.hex = self.board.mode == "hexagon"
+        self.title(f"Replay - {title or replay.board_id}")
+        self.configure(bg="lightgrey")
+        self.resizable(False, False)
+
+        self.playing = False
+        self.speed = 1
+        self.after_id = None
+        self.clock = None  # (perf_counter, replay ms) when playback last (re)started
+        self.syncing_scale = False
+
+        top_frame = tk.Frame(self, bg=self.cget('bg'))
+        top_frame.pack(side="top", fill="x", pady=5)
+        tk.Label(top_frame, text=f"Board: {replay.board_id}", bg=top_frame.cget('bg')).pack(side="left", padx=10)
+        result = "Won" if replay.outcome == WON else "Lost"
+        tk.Label(top_frame, text=f"{result} in {format_time(replay.duration)}",
+                 bg=top_frame.cget('bg')).pack(side="right", padx=10)
+
+        width, height = self.board.width, self.board.height
+        if self.hex:
+            from hexagon_mode.hex_game import hex_geometry
+            self.view_rows, self.view_cols = height, width
+            corner_offsets, self.centers = hex_geometry(height, width, HEX_RADIUS, HEX_RADIUS, HEX_RADIUS)
+            canvas_w = HEX_RADIUS * (2 + SQRT3 * (width + 0.5))
+            canvas_h = HEX_RADIUS * (2 + 1.5 * (height - 1)) + HEX_RADIUS
+        else:
+            self.view_cols, self.view_rows = min(width, VIEW_CELLS[0]), min(height, VIEW_CELLS[1])
+            canvas_w, canvas_h = self.view_cols * CELL_SIZE, self.view_rows * CELL_SIZE
+        self.origin = (0, 0)  # board cell at the top-left of the view
+        self.canvas = tk.Canvas(self, width=int(canvas_w), height=int(canvas_h), bg=REVEALED_FILL, highlightthickness=0)
+        self.canvas.pack(padx=5)
+
+        # One shape and one text item per visible cell, restyled as the game moves.
+        self.shape_ids = []
+        self.text_ids = []
+        for vr in range(self.view_rows):
+            for vc in range(self.view_cols):
+                if self.hex:
+                    cx, cy = self.centers[vr * width + vc]
+                    corners = [v for dx, dy in corner_offsets for v in (cx + dx, cy + dy)]
+                    shape = self.canvas.create_polygon(corners, outline="black", fill="lightgray")
+                else:
+                    x, y = vc * CELL_SIZE, vr * CELL_SIZE
+                    shape = self.canvas.create_rectangle(x, y, x + CELL_SIZE, y + CELL_SIZE,
+                                                         fill=UNREVEALED_FILL, outline=GRID_OUTLINE)
+                    cx, cy = x + CELL_SIZE / 2, y + CELL_SIZE / 2
+                self.shape_ids.append(shape)
+                self.text_ids.append(self.canvas.create_text(cx, cy, text="", font=("Arial", 9, "bold")))
+
+        controls = tk.Frame(self, bg=self.cget('bg'))
+        controls.pack(fill="x", padx=5, pady=5)
+        self.play_button = tk.Button(controls, text="Play", width=6, command=self.toggle_play)
+        self.play_button.pack(side="left")
+        tk.Button(controls, text="|<", command=lambda: self.seek(0)).pack(side="left", padx=(5, 0))
+        tk.Button(controls, text="<", command=lambda: self.seek(self.player.position - 1)).pack(side="left")
+        tk.Button(controls, text=">", command=lambda: self.seek(self.player.position + 1)).pack(side="left")
+        tk.Button(controls, text=">|", command=lambda: self.seek(len(self.player))).pack(side="left")
+        self.speed_var = tk.StringVar(value="1x")
+        speed_combo = ttk.Combobox(controls, textvariable=self.speed_var, values=[f"{s}x" for s in SPEEDS],
+                                   state="readonly", width=5)
+        speed_combo.pack(side="left", padx=5)
+        speed_combo.bind("<<ComboboxSelected>>", self.on_speed_change)
+        self.position_label = tk.Label(controls, bg=self.cget('bg'))
+        self.position_label.pack(side="right")
+
+        self.scale = tk.Scale(self, from_=0, to=len(self.player), orient="horizontal", showvalue=False,
+                              command=lambda value: self.on_scale(int(value)))
+        self.scale.pack(fill="x", padx=5, pady=(0, 5))
+
+        self.bind("<space>", lambda e: self.toggle_play())
+        self.bind("<Left>", lambda e: self.seek(self.player.position - 1))
+        self.bind("<Right>", lambda e: self.seek(self.player.position + 1))
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.redraw_all()
+        self.update_position()
+
+    def on_close(self):
+        if self.after_id:
+            self.after_cancel(self.after_id)
+        self.destroy()
+
+    # Drawing
+
+    def cell_style(self, idx):
+        revealed, flagged, mine, count = self.player.cell_state(idx)
+        if revealed:
+            if mine:
+                return ("red", "*", "white") if idx == self.player.model.exploded else ("lightgrey", "*", "black")
+            return (REVEALED_FILL if not self.hex else "white",
+                    str(count) if count else "", NUMBER_COLORS[count] if count else "black")
+        if flagged:
+            return ("pink" if self.hex else UNREVEALED_FILL), "F", "red"
+        return ("lightgray" if self.hex else UNREVEALED_FILL), "", "black"
+
+    def draw_cell(self, idx):
+        r, c = divmod(idx, self.board.width)
+        vr, vc = r - self.origin[0], c - self.origin[1]
+        if not (0 <= vr < self.view_rows and 0 <= vc < self.view_cols):
+            return
+        fill, text, color = self.cell_style(idx)
+        item = vr * self.view_cols + vc
+        self.canvas.itemconfig(self.shape_ids[item], fill=fill)
+        self.canvas.itemconfig(self.text_ids[item], text=text, fill=color)
+
+    def redraw_all(self):
+        r0, c0 = self.origin
+        width = self.board.width
+        for vr in range(self.view_rows):
+            for vc in range(self.view_cols):
+                self.draw_cell((r0 + vr) * width + c0 + vc)
+
+    def follow(self, idx):
+        """Recentres the view on `idx` if it is off screen; returns True if it moved."""
+        r, c = divmod(idx, self.board.width)
+        r0, c0 = self.origin
+        if r0 <= r < r0 + self.view_rows and c0 <= c < c0 + self.view_cols:
+            return False
+        self.origin = (max(0, min(r - self.view_rows // 2, self.board.height - self.view_rows)),
+                       max(0, min(c - self.view_cols // 2, self.board.width - self.view_cols)))
+        return True
+
+    def show_changes(self, changed):
+        """Draws cells changed by the last moves (None: everything may have changed)."""
+        position = self.player.position
+        moved = position > 0 and self.follow(self.replay.events[position - 1][2])
+        if changed is None or moved:
+            self.redraw_all()
+        else:
+            for idx in changed:
+                self.draw_cell(idx)
+        self.update_position()
+
+    def update_position(self):
+        player = self.player
+        self.position_label.config(text=f"Move {player.position} / {len(player)}   "
+                                        f"{format_time(player.elapsed_ms / 1000)}")
+        self.syncing_scale = True
+        self.scale.set(player.position)
+        self.syncing_scale = False
+
+    # Playback
+
+    def seek(self, position):
+        self.show_changes(self.player.seek(position))
+        self.clock = (time.perf_counter(), self.player.elapsed_ms)
+        if self.player.is_done():
+            self.pause()
+
+    def on_scale(self, position):
+        if not self.syncing_scale and position != self.player.position:
+            self.seek(position)
+
+    def on_speed_change(self, event=None):
+        self.speed = int(self.speed_var.get().rstrip("x"))
+        self.clock = (time.perf_counter(), self.player.elapsed_ms)
+
+    def toggle_play(self):
+        if self.playing:
+            self.pause()
+            return
+        if self.player.is_done():
+            self.seek(0)
+        self.playing = True
+        self.play_button.config(text="Pause")
+        self.clock = (time.perf_counter(), self.player.elapsed_ms)
+        self.tick()
+
+    def pause(self):
+        self.playing = False
+        self.play_button.config(text="Play")
+        if self.after_id:
+            self.after_cancel(self.after_id)
+            self.after_id = None
+
+    def tick(self):
+        """
+        Applies every move due by the replay clock (real time x speed), within
+        one frame budget, then waits for the next one.
+        """
+        self.after_id = None
+        player, events = self.player, self.replay.events
+        started, start_ms = self.clock
+        now = time.perf_counter()
+        target_ms = start_ms + (now - started) * 1000 * self.speed
+        changed = []
+        redraw_all = False
+        while not player.is_done() and player.elapsed_ms + events[player.position][0] <= target_ms:
+            step = player.step()
+            if step is None:
+                redraw_all = True
+            else:
+                changed.extend(step)
+            if time.perf_counter() - now > FRAME_BUDGET:
+                # Behind schedule: restart the clock here rather than skip moves.
+                self.clock = (time.perf_counter(), player.elapsed_ms)
+                break
+        if redraw_all:
+            self.show_changes(None)
+        elif changed:
+            self.show_changes(changed)
+        else:
+            self.update_position()
+        if player.is_done():
+            self.pause()
+            return
+        wait = (player.elapsed_ms + events[player.position][0] - target_ms) / self.speed
+        self.after_id = self.after(max(1, min(MAX_WAIT, int(wait))), self.tick)
@@ -0,0 +1,185 @@
+"""
+Headless batch simulation: plays many games with the built-in solver and
+reports win rate, guesses per game, time per game and throughput.
+
+    python simulate.py --mode classic --width 30 --height 16 --mines 99 --games 5000
+    python simulate.py --mode hexagon --width 16 --height 16 --mines 60 --out hex.jsonl
+
+Every game gets its own seed derived from --seed and the game number, so a
+run gives the same results whatever the number of worker processes, and any
+game can be replayed in the app from the board ID written to the JSONL file.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from logic.board import Board
+from logic.topology import HEX, SQUARE, TORUS
+from logic.board_id import MODE_CODES, format_board_id
+from logic.no_guess import generate_no_guess
+from logic.probability import ProbabilityMap
+from logic.solver import Solver
+
+# Default board per mode: Expert for square boards, the largest hex preset.
+# "torus" is an engine-only shape (square cells, wrapping edges) with no
+# window or board ID yet.
+DEFAULT_SIZES = {
+    "classic": (30, 16, 99),
+    "custom": (30, 16, 99),
+    "hexagon": (16, 16, 60),
+    "torus": (30, 16, 99),
+}
+TOPOLOGIES = {"hexagon": HEX, "torus": TORUS}
+
+
+def game_seed(base_seed, game):
+    return (base_seed * 1000003 + game) & 0xFFFFFFFF
+
+
+def play_game(mode, width, height, mines, seed, no_guess=False):
+    """
+    Plays one game from a first click in the middle of the board. Whenever
+    the solver finds no safe cell, the cell with the lowest exact mine
+    probability is revealed and counted as a guess.
+    Returns a dict describing the game.
+    """
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    board = Board(width, height, mines, topology=TOPOLOGIES.get(mode, SQUARE))
+    first_r, first_c = height // 2, width // 2
+    if no_guess:
+        generate_no_guess(board, first_r, first_c, rng=rng)
+    else:
+        board.place_mines(first_r, first_c, rng=rng)
+    board.reveal(first_r, first_c)
+
+    solver = Solver(board)
+    probabilities = ProbabilityMap(board)
+    known_mines = set()
+    guesses = 0
+    while not board.is_won() and board.exploded is None:
+        safe, found_mines = solver.solve(known_mines)
+        known_mines |= found_mines
+        if not safe:
+            guesses += 1
+            safe = [_pick_guess(board, probabilities, known_mines, rng)]
+        for idx in safe:
+            board.reveal(*board.coords(idx))
+            if board.exploded is not None:
+                break
+
+    return {
+        "board_id": format_board_id(mode, width, height, mines, first_r, first_c, seed, no_guess)
+                    if mode in MODE_CODES else None,
+        "won": board.is_won(),
+        "guesses": guesses,
+        "revealed": board.revealed_safe_count,
+        "time": time.perf_counter() - start,
+    }
+
+
+def _pick_guess(board, probabilities, known_mines, rng):
+    revealed = board.revealed
+    candidates = [(p, idx) for idx, p in probabilities.compute().items()
+                  if p is not None and idx not in known_mines and not revealed[idx]]
+    if candidates:
+        return min(candidates)[1]
+    return rng.choice([idx for idx in range(board.size) if not revealed[idx] and idx not in known_mines])
+
+
+def _play(job):
+    return play_game(*job)
+
+
+def _collect(stream, results, out):
+    for game, result in enumerate(stream):
+        results.append(result)
+        out.write(json.dumps({"game": game, **result}) + "\n")
+
+
+class _NoOutput:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write(self, text):
+        pass
+
+
+def summarize(results, wall_time):
+    games = len(results)
+    wins = sum(result["won"] for result in results)
+    return {
+        "games": games,
+        "wins": wins,
+        "win_rate": wins / games if games else 0.0,
+        "guesses_per_game": sum(result["guesses"] for result in results) / games if games else 0.0,
+        "time_per_game": sum(result["time"] for result in results) / games if games else 0.0,
+        "games_per_second": games / wall_time if wall_time > 0 else 0.0,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Play Minesweeper games headlessly with the built-in solver.")
+    parser.add_argument("--mode", choices=sorted(DEFAULT_SIZES), default="classic")
+    parser.add_argument("--width", type=int, help="columns (default: Expert, or 16 for hexagon)")
+    parser.add_argument("--height", type=int, help="rows")
+    parser.add_argument("--mines", type=int, help="mine count")
+    parser.add_argument("--density", type=float, help="mine density; overrides --mines")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="base seed for the per-game seeds")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes (default: all cores)")
+    parser.add_argument("--no-guess", action="store_true", help="use the no-guess generator")
+    parser.add_argument("--out", help="stream one JSON line per game to this file")
+    args = parser.parse_args(argv)
+
+    default_w, default_h, default_m = DEFAULT_SIZES[args.mode]
+    args.width = args.width or default_w
+    args.height = args.height or default_h
+    if args.density is not None:
+        args.mines = round(args.width * args.height * args.density)
+    elif args.mines is None:
+        args.mines = default_m
+    if args.width <= 0 or args.height <= 0:
+        parser.error("board dimensions must be positive")
+    if not 0 < args.mines < args.width * args.height:
+        parser.error("mine count must be between 1 and the number of cells minus one")
+    if args.games <= 0 or args.workers <= 0:
+        parser.error("--games and --workers must be positive")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    jobs = [(args.mode, args.width, args.height, args.mines, game_seed(args.seed, game), args.no_guess)
+            for game in range(args.games)]
+
+    results = []
+    start = time.perf_counter()
+    with open(args.out, "w") if args.out else _NoOutput() as out:
+        if args.workers == 1:
+            _collect(map(_play, jobs), results, out)
+        else:
+            chunksize = max(1, min(64, args.games // (args.workers * 8)))
+            with multiprocessing.Pool(args.workers) as pool:
+                _collect(pool.imap(_play, jobs, chunksize=chunksize), results, out)
+    wall_time = time.perf_counter() - start
+
+    summary = summarize(results, wall_time)
+    print(f"{args.mode} {args.width}x{args.height}, {args.mines} mines"
+          f"{' (no guessing)' if args.no_guess else ''}, {args.workers} worker(s)")
+    print(f"  games:            {summary['games']}")
+    print(f"  win rate:         {summary['win_rate']:.2%}")
+    print(f"  guesses per game: {summary['guesses_per_game']:.2f}")
+    print(f"  time per game:    {summary['time_per_game'] * 1000:.2f} ms")
+    print(f"  throughput:       {summary['games_per_second']:.1f} games/s")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -38,6 +38,15 @@ class StartMenu(tk.Frame):
         )
         hex_button.pack(pady=5)
 
+        replay_button = tk.Button(
+            self,
+            text="Watch Replay",
+            width=20,
+            height=2,
+            command=self.open_replay
+        )
+        replay_button.pack(pady=5)
+
         about_button = tk.Button(
             self,
             text="About Us",
@@ -45,4 +54,8 @@ class StartMenu(tk.Frame):
             height=2,
             command=lambda: controller.show_frame("AboutUs")
         )
-        about_button.pack(pady=5)
\ No newline at end of file
+        about_button.pack(pady=5)
+
+    def open_replay(self):
+        from replay_viewer import open_replay
+        open_replay(self.controller)
@@ -0,0 +1,86 @@
+import tkinter as tk
+
+CELL_SIZE = 24
+
+# Cell colours, chosen to look like the tk.Button grid this canvas replaces.
+UNREVEALED_FILL = "#d9d9d9"
+REVEALED_FILL = "#f0f0f0"
+GRID_OUTLINE = "#808080"
+
+NUMBER_COLORS = ["", "blue", "green", "red", "darkblue", "maroon", "teal", "black", "gray"]
+
+
+class BoardCanvas(tk.Canvas):
+    """
+    Draws a rectangular board on a single canvas: one rectangle per cell,
+    plus a text item created the first time a cell needs a label.
+    Clicks are mapped to cells by arithmetic and handled by one set of
+    canvas-level bindings, which call on_left_click(r, c) / on_right_click(r, c).
+    """
+    def __init__(self, master, width, height, on_left_click, on_right_click, cell_size=CELL_SIZE):
+        super().__init__(master, width=width * cell_size, height=height * cell_size,
+                         bg=REVEALED_FILL, highlightthickness=0)
+        self.board_width = width
+        self.board_height = height
+        self.cell_size = cell_size
+        self.on_left_click = on_left_click
+        self.on_right_click = on_right_click
+        self.font = ("Arial", max(6, cell_size * 2 // 5), "bold")
+
+        self.rect_ids = []
+        self.text_ids = [None] * (width * height)
+        for r in range(height):
+            y = r * cell_size
+            for c in range(width):
+                x = c * cell_size
+                self.rect_ids.append(self.create_rectangle(x, y, x + cell_size, y + cell_size,
+                                                           fill=UNREVEALED_FILL, outline=GRID_OUTLINE))
+
+        self.bind("<Button-1>", self._left_click)
+        self.bind("<Button-3>", self._right_click)
+        self.bind("<Button-2>", self._right_click)
+        self.bind("<Control-Button-1>", self._right_click)
+
+    def cell_at(self, x, y):
+        """Returns the (r, c) under canvas pixel (x, y), or None outside the board."""
+        c = int(self.canvasx(x) // self.cell_size)
+        r = int(self.canvasy(y) // self.cell_size)
+        if 0 <= r < self.board_height and 0 <= c < self.board_width:
+            return r, c
+        return None
+
+    def _left_click(self, event):
+        self.winfo_toplevel().focus_set()
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_left_click(*cell)
+
+    def _right_click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.on_right_click(*cell)
+        return "break"
+
+    def set_cell(self, idx, fill=None, text=None, color="black"):
+        """
+        Updates one cell's background and/or label. `text=None` leaves the
+        label alone; an empty string clears it.
+        """
+        if fill is not None:
+            self.itemconfig(self.rect_ids[idx], fill=fill)
+        if text is None:
+            return
+        text_id = self.text_ids[idx]
+        if text_id is None:
+            if not text:
+                return
+            r, c = divmod(idx, self.board_width)
+            half = self.cell_size / 2
+            self.text_ids[idx] = self.create_text(c * self.cell_size + half, r * self.cell_size + half,
+                                                  text=text, fill=color, font=self.font)
+        else:
+            self.itemconfig(text_id, text=text, fill=color)
+
+    def show_number(self, idx, count):
+        color = NUMBER_COLORS[count] if 0 < count < len(NUMBER_COLORS) else "black"
+        self.set_cell(idx, REVEALED_FILL, str(count) if count > 0 else "", color)
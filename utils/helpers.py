@@ -6,4 +6,13 @@ def format_time(seconds):
         seconds = 0 
     m = int(seconds // 60)
     s = seconds % 60
-    return f"{m:02d}:{s:05.2f}"
\ No newline at end of file
+    return f"{m:02d}:{s:05.2f}"
+
+def probability_color(probability):
+    """
+    Heatmap colour for a mine probability: green (safe) through yellow to red (mine).
+    """
+    p = min(max(probability, 0.0), 1.0)
+    red = int(255 * min(1.0, 2 * p))
+    green = int(255 * min(1.0, 2 * (1 - p)))
+    return f"#{red:02x}{green:02x}40"
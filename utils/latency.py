@@ -0,0 +1,196 @@
+import json
+import os
+import time
+import tkinter as tk
+from bisect import bisect_left
+from contextlib import nullcontext
+
+# Set to a file path (or 1 for latency.jsonl) to time every click in the game
+# windows; each window appends one JSON line of histograms when it closes,
+# and F12 shows them in an overlay while playing.
+LATENCY_ENV = "MINESWEEPER_LATENCY"
+DEFAULT_OUT = "latency.jsonl"
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open.
+BUCKETS_MS = (0.5, 1, 2, 4, 8, 16, 33, 66, 133, 266, 533, 1066)
+FRAME_MS = 1000 / 60  # a click slower than one frame at 60 Hz counts as over budget
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+
+    def percentile(self, p):
+        """Upper bound of the bucket holding the p-th percentile (max for the open bucket)."""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            "buckets_ms": list(BUCKETS_MS) + [None],
+            "counts": self.counts,
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "max_ms": self.max,
+        }
+
+
+class _NullProbe:
+    """Stands in for LatencyProbe when instrumentation is off; every call is a no-op."""
+    def click(self, kind):
+        pass
+
+    def model(self, operation=None):
+        return nullcontext()
+
+    def finish(self):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_PROBE = _NullProbe()
+
+
+def latency_probe(window, board):
+    """
+    A LatencyProbe for a game window if LATENCY_ENV is set, else NULL_PROBE.
+    `board` describes the session, e.g. "classic 30x16, 99 mines".
+    """
+    out = os.environ.get(LATENCY_ENV)
+    if not out:
+        return NULL_PROBE
+    return LatencyProbe(window, board, DEFAULT_OUT if out == "1" else out)
+
+
+class LatencyProbe:
+    """
+    Click-to-paint latency for one game window.
+
+    `click` is called as a click enters on_left_click/on_right_click. Model
+    work (placement, adjacency, flood fill, win check, hint probabilities)
+    runs inside `model(operation)` blocks and is timed on its own; the rest,
+    up to the second idle callback after the click (the first lets Tk
+    redisplay the widgets changed by the handler), is widget-update time. Each click is
+    filed under its model operation ("place" for the first click) in
+    per-session model and widget histograms.
+    """
+    def __init__(self, window, board, out):
+        self.window = window
+        self.board = board
+        self.out = out
+        self.started = time.time()
+        self.histograms = {}  # operation -> {"model": Histogram, "widget": Histogram}
+        self.over_frame = {}  # operation -> clicks slower than FRAME_MS end to end
+        self.click_start = None
+        self.model_ms = 0.0
+        self.operation = None
+        self.depth = 0
+        self.overlay = None
+        window.bind("<F12>", lambda e: self.toggle_overlay(), add="+")
+
+    def click(self, kind):
+        if self.click_start is not None:
+            return  # e.g. M + left click handing over to on_right_click
+        self.click_start = time.perf_counter()
+        self.model_ms = 0.0
+        self.operation = None
+        self.window.after_idle(lambda: self.window.after_idle(self.finish))
+
+    def model(self, operation=None):
+        return _ModelTimer(self, operation)
+
+    def finish(self):
+        """Files the current click; called at the second idle, or early before a modal dialog."""
+        if self.click_start is None:
+            return
+        total_ms = (time.perf_counter() - self.click_start) * 1000
+        self.click_start = None
+        if self.operation is None:
+            return  # the click changed nothing in the model
+        histograms = self.histograms.setdefault(self.operation, {"model": Histogram(), "widget": Histogram()})
+        histograms["model"].add(self.model_ms)
+        histograms["widget"].add(max(0.0, total_ms - self.model_ms))
+        if total_ms > FRAME_MS:
+            self.over_frame[self.operation] = self.over_frame.get(self.operation, 0) + 1
+        if self.overlay is not None:
+            self.overlay.config(text=self.summary())
+
+    def to_dict(self):
+        return {
+            "board": self.board,
+            "started": self.started,
+            "operations": {operation: {"model": h["model"].to_dict(), "widget": h["widget"].to_dict(),
+                                       "over_frame": self.over_frame.get(operation, 0)}
+                           for operation, h in self.histograms.items()},
+        }
+
+    def close(self):
+        """Appends this session's histograms to the output file."""
+        self.finish()
+        self.overlay = None
+        if not self.histograms:
+            return
+        try:
+            with open(self.out, "a") as f:
+                f.write(json.dumps(self.to_dict()) + "\n")
+        except OSError as e:
+            print(f"Error writing latency histograms: {e}")
+
+    def summary(self):
+        lines = [f"{self.board} (ms: p50 / p95 / max)"]
+        for operation, h in sorted(self.histograms.items()):
+            model, widget = h["model"], h["widget"]
+            lines.append(f"{operation:<7} x{model.count:<5} "
+                         f"model {model.percentile(50):.1f}/{model.percentile(95):.1f}/{model.max:.1f}  "
+                         f"widget {widget.percentile(50):.1f}/{widget.percentile(95):.1f}/{widget.max:.1f}  "
+                         f"over frame {self.over_frame.get(operation, 0)}")
+        return "\n".join(lines)
+
+    def toggle_overlay(self):
+        if self.overlay is not None:
+            self.overlay.destroy()
+            self.overlay = None
+            return
+        self.overlay = tk.Label(self.window, text=self.summary(), justify="left", anchor="w",
+                                font=("Courier", 9), bg="black", fg="lime")
+        self.overlay.place(relx=0, rely=1, anchor="sw")
+
+
+class _ModelTimer:
+    def __init__(self, probe, operation):
+        self.probe = probe
+        self.operation = operation
+
+    def __enter__(self):
+        probe = self.probe
+        probe.depth += 1
+        if probe.depth == 1:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        probe = self.probe
+        probe.depth -= 1
+        if probe.depth == 0:
+            probe.model_ms += (time.perf_counter() - self.start) * 1000
+        if self.operation is not None and probe.operation in (None, "flag"):
+            probe.operation = self.operation
+        return False
@@ -0,0 +1,83 @@
+import tkinter as tk
+from tkinter import ttk
+
+PAGE_SIZE = 10
+
+
+class LeaderboardView(tk.Frame):
+    """
+    A page of leaderboard records in one ttk.Treeview, shared by the
+    classic, hexagon and custom leaderboard screens.
+
+    The tree holds at most PAGE_SIZE items, created once and reused: showing
+    a page fetches only that page (plus one record, to know whether there is
+    a next one) and reconfigures only the rows whose values changed, so
+    switching category or page costs the same however long the history is.
+
+    `columns` is a list of (column id, heading, width, anchor). `show` takes
+    fetch(offset, limit) -> records and row_values(rank, record) -> tuple of
+    column values.
+    """
+    def __init__(self, master, columns, page_size=PAGE_SIZE):
+        super().__init__(master, bg=master.cget('bg'))
+        self.page_size = page_size
+        self.fetch = None
+        self.row_values = None
+        self.page = 0
+        self.shown = [None] * page_size  # values of each reusable row, None while detached
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in columns], show="headings",
+                                 height=page_size, selectmode="none")
+        for column_id, heading, width, anchor in columns:
+            self.tree.heading(column_id, text=heading, anchor=anchor)
+            self.tree.column(column_id, width=width, anchor=anchor, stretch=column_id == "name")
+        for i in range(page_size):
+            self.tree.insert("", "end", iid=str(i))
+            self.tree.detach(str(i))
+        self.tree.pack(fill=tk.BOTH, expand=True)
+
+        nav = tk.Frame(self, bg=self.cget('bg'))
+        nav.pack(fill=tk.X, pady=(5, 0))
+        self.prev_button = tk.Button(nav, text="< Prev", command=lambda: self.show_page(self.page - 1))
+        self.prev_button.pack(side=tk.LEFT)
+        self.next_button = tk.Button(nav, text="Next >", command=lambda: self.show_page(self.page + 1))
+        self.next_button.pack(side=tk.RIGHT)
+        self.status_label = tk.Label(nav, bg=self.cget('bg'))
+        self.status_label.pack(side=tk.LEFT, expand=True)
+
+    def show(self, fetch, row_values, displaycolumns="#all"):
+        """Switches to a new record source and shows its first page."""
+        self.fetch = fetch
+        self.row_values = row_values
+        self.tree.configure(displaycolumns=displaycolumns)
+        self.show_page(0)
+
+    def show_page(self, page):
+        if self.fetch is None or page < 0:
+            return
+        offset = page * self.page_size
+        records = self.fetch(offset, self.page_size + 1)
+        if not records and page > 0:
+            return
+        self.page = page
+        has_more = len(records) > self.page_size
+
+        for i in range(self.page_size):
+            iid = str(i)
+            values = self.row_values(offset + i + 1, records[i]) if i < len(records) else None
+            if values == self.shown[i]:
+                continue
+            if values is None:
+                self.tree.detach(iid)
+            else:
+                self.tree.item(iid, values=values)
+                if self.shown[i] is None:
+                    self.tree.move(iid, "", i)
+            self.shown[i] = values
+
+        if not records:
+            self.status_label.config(text="No records yet.")
+        else:
+            self.status_label.config(text=f"Page {page + 1}")
+        self.prev_button.config(state=tk.NORMAL if page > 0 else tk.DISABLED)
+        self.next_button.config(state=tk.NORMAL if has_more else tk.DISABLED)
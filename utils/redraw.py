@@ -0,0 +1,58 @@
+import time
+from collections import deque
+
+# Longest a single batch of cell redraws may keep the event loop busy.
+# A chunk stops as soon as it goes over, so its length is bounded by
+# FRAME_BUDGET plus the time to draw CHECK_EVERY cells.
+FRAME_BUDGET = 0.012  # seconds
+CHECK_EVERY = 32
+
+
+class RedrawQueue:
+    """
+    Applies per-cell visual updates in batches.
+
+    The model works out which cells changed; `push` queues them and
+    `draw(item)` is called for each one. The first batch runs straight away,
+    and anything left after FRAME_BUDGET is continued from after_idle, so a
+    huge flood fill is painted over several event-loop turns instead of
+    freezing the window. `longest_chunk` records the slowest batch in seconds.
+    """
+    def __init__(self, widget, draw, budget=FRAME_BUDGET):
+        self.widget = widget
+        self.draw = draw
+        self.budget = budget
+        self.pending = deque()
+        self.after_id = None
+        self.longest_chunk = 0.0
+
+    def push(self, items):
+        self.pending.extend(items)
+        if self.after_id is None:
+            self._run_chunk()
+
+    def flush(self):
+        """Draws everything still queued, e.g. before a game-over dialog."""
+        self.cancel()
+        draw = self.draw
+        while self.pending:
+            draw(self.pending.popleft())
+
+    def cancel(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _run_chunk(self):
+        self.after_id = None
+        pending, draw = self.pending, self.draw
+        start = time.perf_counter()
+        deadline = start + self.budget
+        while pending:
+            for _ in range(min(CHECK_EVERY, len(pending))):
+                draw(pending.popleft())
+            if time.perf_counter() >= deadline:
+                break
+        self.longest_chunk = max(self.longest_chunk, time.perf_counter() - start)
+        if pending:
+            self.after_id = self.widget.after_idle(self._run_chunk)
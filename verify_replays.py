@@ -0,0 +1,134 @@
+"""
+Batch replay verification: re-plays the recorded games behind leaderboard
+entries (or every saved replay) headlessly and reports the invalid ones.
+
+    python verify_replays.py
+    python verify_replays.py --all --workers 8 --out verification.json
+
+A leaderboard entry is valid when a replay of its board ID with the same
+recorded time exists, starts at the board's first click, wins, and its move
+timestamps add up to the recorded time.
+"""
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from logic.replay import Replay, REPLAY_DIR, REPLAY_SUFFIX, TIME_RESOLUTION, check_replay
+
+
+def index_replays(directory):
+    """Maps board ID -> replay paths, from the file names (board ID, then a timestamp)."""
+    replays = defaultdict(list)
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return replays
+    for name in names:
+        if name.endswith(REPLAY_SUFFIX):
+            board_id = name[:-len(REPLAY_SUFFIX)].rsplit("-", 1)[0]
+            replays[board_id].append(os.path.join(directory, name))
+    return replays
+
+
+def leaderboard_jobs(data, replays):
+    """One job per leaderboard entry: (description, candidate replay paths, expected time)."""
+    jobs = []
+    for mode, mode_data in data.items():
+        if not isinstance(mode_data, dict):
+            continue
+        for difficulty, records in mode_data.items():
+            for rank, entry in enumerate(records, 1):
+                entry_info = {"mode": mode, "difficulty": difficulty, "rank": rank, "name": entry.get("name"),
+                              "time": entry.get("time"), "board_id": entry.get("board_id")}
+                jobs.append((entry_info, replays.get(entry.get("board_id"), []), entry.get("time")))
+    return jobs
+
+
+def verify(job):
+    """Checks one job; returns its description with `valid`, `replay` and `problems` added."""
+    info, paths, expected_time = job
+    problems = []
+    chosen = None
+    if not info.get("board_id"):
+        problems.append("entry has no board ID")
+    for path in paths:
+        try:
+            replay = Replay.load(path)
+        except (OSError, ValueError) as e:
+            problems.append(f"{os.path.basename(path)}: {e}")
+            continue
+        if expected_time is None or abs(replay.duration - expected_time) <= TIME_RESOLUTION:
+            chosen = path
+            try:
+                problems = check_replay(replay, expected_time, require_win=expected_time is not None)
+            except Exception as e:
+                # One malformed replay must not take the worker, and the whole run, down with it.
+                problems = [f"{os.path.basename(path)}: check failed ({type(e).__name__}: {e})"]
+            break
+    else:
+        if info.get("board_id"):
+            problems.append("no replay with this board ID and time")
+    return {**info, "replay": chosen, "valid": not problems, "problems": problems}
+
+
+def summarize(results, wall_time):
+    invalid = [result for result in results if not result["valid"]]
+    return {
+        "checked": len(results),
+        "valid": len(results) - len(invalid),
+        "invalid": len(invalid),
+        "replays_per_second": len(results) / wall_time if wall_time > 0 else 0.0,
+        "invalid_entries": invalid,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Verify leaderboard times against recorded game replays.")
+    parser.add_argument("--replays", default=REPLAY_DIR, help="replay directory (default: replays/)")
+    parser.add_argument("--all", action="store_true",
+                        help="check every replay in the directory instead of the leaderboard entries")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes (default: all cores)")
+    parser.add_argument("--out", help="write the summary, with every invalid entry, to this JSON file")
+    args = parser.parse_args(argv)
+    if args.workers <= 0:
+        parser.error("--workers must be positive")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    replays = index_replays(args.replays)
+    if args.all:
+        jobs = [({"board_id": board_id}, [path], None) for board_id, paths in replays.items() for path in paths]
+    else:
+        from leaderboard.leaderboard import load_leaderboard
+        jobs = leaderboard_jobs(load_leaderboard(), replays)
+
+    start = time.perf_counter()
+    if args.workers == 1 or len(jobs) < 2:
+        results = list(map(verify, jobs))
+    else:
+        chunksize = max(1, min(256, len(jobs) // (args.workers * 8)))
+        with ProcessPoolExecutor(args.workers) as executor:
+            results = list(executor.map(verify, jobs, chunksize=chunksize))
+    summary = summarize(results, time.perf_counter() - start)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(summary, f, indent=2)
+    print(f"{'replays' if args.all else 'leaderboard entries'} checked: {summary['checked']}")
+    print(f"  valid:      {summary['valid']}")
+    print(f"  invalid:    {summary['invalid']}")
+    print(f"  throughput: {summary['replays_per_second']:.1f} replays/s")
+    for result in summary["invalid_entries"]:
+        where = f"{result['mode']} {result['difficulty']} #{result['rank']} {result['name']}" if "mode" in result \
+            else result["replay"] or result["board_id"]
+        print(f"  - {where}: {'; '.join(result['problems'])}")
+    return summary
+
+
+if __name__ == "__main__":
+    main()